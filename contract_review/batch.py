@@ -0,0 +1,110 @@
+import asyncio
+import glob
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from contract_review.config.settings import SUPPORTED_CONTRACT_EXTENSIONS
+from contract_review.runner import run_contract_review
+from contract_review.utils.logger import setup_logger
+from contract_review.workflows.contract_review import ContractReviewWorkflow
+
+logger = setup_logger(__name__)
+
+
+def resolve_contract_paths(target: str) -> List[Path]:
+    """Resolve a directory or glob pattern to the contract files it contains."""
+    target_path = Path(target)
+    if target_path.is_dir():
+        candidates = target_path.iterdir()
+    else:
+        candidates = (Path(p) for p in glob.glob(target, recursive=True))
+    return sorted(
+        p for p in candidates
+        if p.is_file() and p.suffix.lower() in SUPPORTED_CONTRACT_EXTENSIONS
+    )
+
+
+def _report_paths(contract_paths: List[Path], output_dir: Path) -> List[Path]:
+    """Assign each contract a report file, disambiguating repeated file stems."""
+    used = set()
+    report_paths = []
+    for contract_path in contract_paths:
+        name = contract_path.stem
+        suffix = 1
+        while name in used:
+            suffix += 1
+            name = f"{contract_path.stem}_{suffix}"
+        used.add(name)
+        report_paths.append(output_dir / f"{name}.json")
+    return report_paths
+
+
+async def run_batch(
+    workflow: ContractReviewWorkflow,
+    contract_paths: List[Path],
+    output_dir: Path,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """Review many contracts with a shared workflow and a bounded worker pool.
+
+    Each contract gets its own report file in ``output_dir``; a failing contract
+    is recorded in the summary without stopping the rest of the batch.
+
+    Args:
+        workflow: Workflow shared by every contract (index and LLM clients are reused)
+        contract_paths: Contracts to review
+        output_dir: Directory for per-contract reports, ``summary.json`` and ``metrics.json``
+        concurrency: Maximum number of contracts reviewed at the same time
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def review(contract_path: Path, report_path: Path) -> Dict[str, Any]:
+        async with semaphore:
+            logger.info(f"Reviewing {contract_path}")
+            start = time.perf_counter()
+            try:
+                with workflow.metrics.timer("contract_review_seconds"):
+                    result = await run_contract_review(workflow, contract_path, print_logs=False)
+            except Exception as e:
+                logger.error(f"Review failed for {contract_path}: {str(e)}", exc_info=True)
+                return {
+                    "contract_path": str(contract_path),
+                    "status": "error",
+                    "error": str(e),
+                }
+
+            report_path.write_text(result.model_dump_json(indent=2))
+            logger.info(f"Finished {contract_path} -> {report_path}")
+            return {
+                "contract_path": str(contract_path),
+                "status": "ok",
+                "report_path": str(report_path),
+                "vendor_name": result.report.vendor_name,
+                "overall_compliant": result.report.overall_compliant,
+                "clauses": len(result.match_results),
+                "non_compliant_clauses": len(result.non_compliant_results),
+                "duration_s": round(time.perf_counter() - start, 3),
+            }
+
+    entries = await asyncio.gather(*[
+        review(contract_path, report_path)
+        for contract_path, report_path in zip(
+            contract_paths, _report_paths(contract_paths, output_dir)
+        )
+    ])
+
+    succeeded = [e for e in entries if e["status"] == "ok"]
+    summary = {
+        "total": len(entries),
+        "succeeded": len(succeeded),
+        "failed": len(entries) - len(succeeded),
+        "non_compliant_contracts": sum(1 for e in succeeded if not e["overall_compliant"]),
+        "contracts": entries,
+    }
+    (output_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+    workflow.metrics.write_json(output_dir / "metrics.json")
+    return summary
@@ -0,0 +1,180 @@
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import faiss
+import numpy as np
+from llama_index.core.base.embeddings.base import BaseEmbedding
+
+from ..config.settings import (
+    DEFAULT_INDEX_BENCHMARK_EF_SEARCH,
+    DEFAULT_INDEX_BENCHMARK_NPROBE,
+    DEFAULT_SIMILARITY_TOP_K,
+)
+from ..utils.guideline_index import (
+    GuidelineIndexConfig,
+    apply_search_params,
+    create_faiss_index,
+    embed_nodes,
+    index_factory_string,
+    load_guideline_nodes,
+)
+from ..utils.logger import setup_logger
+from ..utils.metrics import quantile
+from .fakes import HashEmbedding
+from .synthetic import generate_contract, prepare_guidelines
+
+logger = setup_logger(__name__)
+
+
+def _clause_texts(contract: str) -> List[str]:
+    """Bullet clauses of a synthetic contract, used as retrieval queries."""
+    return [
+        line[2:] for line in contract.splitlines()
+        if line.startswith("- ") and not line.startswith("- **")
+    ]
+
+
+def _search_params(config: GuidelineIndexConfig) -> Dict[str, Any]:
+    if config.index_type in ("ivf_flat", "ivf_pq"):
+        return {"nprobe": config.nprobe}
+    if config.index_type == "hnsw":
+        return {"ef_search": config.ef_search}
+    return {}
+
+
+def measure_index(
+    faiss_index: faiss.Index,
+    queries: np.ndarray,
+    exact_ids: np.ndarray,
+    top_k: int,
+) -> Dict[str, float]:
+    """Measure recall@k against ``exact_ids`` and single-query and batched search latency."""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        faiss_index.search(query[np.newaxis, :], top_k)
+        latencies.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    _, ids = faiss_index.search(queries, top_k)
+    batch_seconds = time.perf_counter() - start
+
+    hits = sum(
+        len(set(row[row >= 0]) & set(exact_row[exact_row >= 0]))
+        for row, exact_row in zip(ids, exact_ids)
+    )
+    expected = int((exact_ids >= 0).sum())
+    latencies.sort()
+    return {
+        f"recall_at_{top_k}": round(hits / expected, 4) if expected else 1.0,
+        "query_p50_ms": round(quantile(latencies, 0.5) * 1000, 4),
+        "query_p99_ms": round(quantile(latencies, 0.99) * 1000, 4),
+        "batch_qps": round(len(queries) / batch_seconds, 1) if batch_seconds else 0.0,
+    }
+
+
+def evaluate_index_configs(
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    configs: Sequence[GuidelineIndexConfig],
+    top_k: int = DEFAULT_SIMILARITY_TOP_K,
+) -> List[Dict[str, Any]]:
+    """Build each index over ``vectors`` and compare it with an exact (Flat) index of the same metric.
+
+    Configs that differ only in search parameters (nprobe, ef_search) share one
+    built index. Returns one row per config with its build time, size,
+    recall@k and latency.
+    """
+    exact: Dict[str, np.ndarray] = {}
+    built: Dict[str, tuple] = {}
+    rows = []
+    for config in configs:
+        if config.metric not in exact:
+            flat = create_faiss_index(GuidelineIndexConfig(metric=config.metric), vectors)
+            flat.add(vectors)
+            _, exact[config.metric] = flat.search(queries, top_k)
+
+        description = index_factory_string(config, vectors.shape[1], len(vectors))
+        key = f"{description}/{config.metric}"
+        if key not in built:
+            start = time.perf_counter()
+            faiss_index = create_faiss_index(config, vectors, description)
+            faiss_index.add(vectors)
+            build_seconds = time.perf_counter() - start
+            size_mb = faiss.serialize_index(faiss_index).nbytes / (1024 * 1024)
+            built[key] = (faiss_index, build_seconds, size_mb)
+        faiss_index, build_seconds, size_mb = built[key]
+        apply_search_params(faiss_index, config)
+
+        row = {
+            "index_type": config.index_type,
+            "factory": description,
+            "metric": config.metric,
+            **_search_params(config),
+            "vectors": len(vectors),
+            "build_s": round(build_seconds, 3),
+            "index_mb": round(size_mb, 2),
+        }
+        row.update(measure_index(faiss_index, queries, exact[config.metric], top_k))
+        rows.append(row)
+    return rows
+
+
+def sweep_configs(
+    index_types: Sequence[str],
+    metric: str = "l2",
+    nprobes: Sequence[int] = DEFAULT_INDEX_BENCHMARK_NPROBE,
+    ef_searches: Sequence[int] = DEFAULT_INDEX_BENCHMARK_EF_SEARCH,
+) -> List[GuidelineIndexConfig]:
+    """Expand index types into configs, one per nprobe (IVF) or ef_search (HNSW) value."""
+    configs = []
+    for index_type in index_types:
+        if index_type in ("ivf_flat", "ivf_pq"):
+            configs += [GuidelineIndexConfig(index_type=index_type, metric=metric, nprobe=n) for n in nprobes]
+        elif index_type == "hnsw":
+            configs += [GuidelineIndexConfig(index_type=index_type, metric=metric, ef_search=ef) for ef in ef_searches]
+        else:
+            configs.append(GuidelineIndexConfig(index_type=index_type, metric=metric))
+    return configs
+
+
+def run_index_benchmark(
+    configs: Sequence[GuidelineIndexConfig],
+    work_dir: Path,
+    guideline_mb: float,
+    n_queries: int,
+    guidelines_dir: Optional[Path] = None,
+    embed_model: Optional[BaseEmbedding] = None,
+    top_k: int = DEFAULT_SIMILARITY_TOP_K,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """Report recall and latency of each index config on a guideline corpus.
+
+    By default the corpus is a synthetic one of ``guideline_mb`` MB embedded
+    with the offline hash embedder; pass ``guidelines_dir`` and ``embed_model``
+    to measure a real corpus. Queries are the clauses of a synthetic contract.
+    """
+    embed_model = embed_model or HashEmbedding()
+    guidelines_dir = guidelines_dir or prepare_guidelines(work_dir, guideline_mb, seed=seed)
+
+    logger.info(f"Embedding guideline chunks from {guidelines_dir}")
+    vectors = embed_nodes(load_guideline_nodes(guidelines_dir), embed_model)
+    clauses = _clause_texts(generate_contract(n_queries, seed=seed))
+    queries = np.asarray(embed_model.get_text_embedding_batch(clauses), dtype="float32")
+    logger.info(f"Evaluating {len(configs)} index configs on {len(vectors)} chunks and {len(queries)} queries")
+    return evaluate_index_configs(vectors, queries, configs, top_k=top_k)
+
+
+def format_index_results(results: List[Dict[str, Any]]) -> str:
+    """Render index benchmark results as a plain-text table."""
+    recall_key = next((key for key in results[0] if key.startswith("recall_at_")), "recall") if results else "recall"
+    columns = (
+        ("factory", "index"), ("metric", "metric"), ("nprobe", "nprobe"), ("ef_search", "efSearch"),
+        ("build_s", "build s"), ("index_mb", "MB"), (recall_key, recall_key.replace("_at_", "@")),
+        ("query_p50_ms", "p50 ms"), ("query_p99_ms", "p99 ms"), ("batch_qps", "batch q/s"),
+    )
+    rows = [[header for _, header in columns]]
+    rows += [[f"{result[key]:g}" if isinstance(result.get(key), float) else str(result.get(key, "-"))
+              for key, _ in columns] for result in results]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    return "\n".join("  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
@@ -0,0 +1,196 @@
+import asyncio
+import random
+import re
+import zlib
+from typing import Any, List, Optional, Sequence, Type
+
+import numpy as np
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.llms import (
+    CompletionResponse,
+    CompletionResponseGen,
+    CustomLLM,
+    LLMMetadata,
+)
+from llama_index.core.prompts import BasePromptTemplate
+from pydantic import BaseModel, Field, PrivateAttr
+
+from ..models.compliance import (
+    ClauseComplianceBatch,
+    ClauseComplianceCheck,
+    ComplianceReport,
+    ComplianceSummary,
+    GuidelineMatch,
+)
+from ..models.contract import ContractClause, ContractExtraction
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_BATCH_CLAUSE_RE = re.compile(r"^\[(\d+)\] (.+)$", re.MULTILINE)
+_VENDOR_RE = re.compile(r"\*\*Vendor:\*\*\s*(.+?)\s*(?:\(|$)", re.MULTILINE)
+_GUIDELINE_RE = re.compile(r"^\[1\] (.+)$", re.MULTILINE)
+
+# Clause flags set by the fake extractor when the clause contains the phrase
+_FLAG_KEYWORDS = {
+    "mentions_data_processing": ("personal data", "process"),
+    "mentions_data_transfer": ("transfer", "third countr", "sub-processor"),
+    "requires_consent": ("consent",),
+    "specifies_purpose": ("purpose", "solely to", "only to"),
+    "mentions_safeguards": ("encrypt", "safeguard", "security measure", "pseudonym"),
+}
+
+
+class FakeLLMError(RuntimeError):
+    """Failure injected by FakeLLM to exercise retries."""
+
+
+def _stable_fraction(text: str) -> float:
+    """Map text to a deterministic number in [0, 1)."""
+    return zlib.crc32(text.encode()) / 2 ** 32
+
+
+class FakeLLM(CustomLLM):
+    """Deterministic offline LLM for benchmarks.
+
+    ``astructured_predict`` returns valid ContractExtraction,
+    ClauseComplianceCheck, ClauseComplianceBatch, ComplianceSummary and
+    ComplianceReport objects built from the prompt variables, after an injected
+    latency. A fraction of calls raise FakeLLMError. Verdicts depend only on the
+    clause text, so repeated runs are comparable.
+    """
+
+    model: str = Field(default="fake-llm", description="Model name reported to the workflow.")
+    latency: float = Field(default=0.05, description="Seconds slept per call.")
+    latency_jitter: float = Field(default=0.2, description="Relative +/- jitter applied to the latency.")
+    error_rate: float = Field(default=0.0, description="Fraction of calls that raise FakeLLMError.")
+    non_compliant_rate: float = Field(default=0.2, description="Fraction of clauses judged non-compliant.")
+    seed: int = Field(default=0, description="Seed for latency jitter and injected errors.")
+    calls: int = Field(default=0, description="Number of calls made.")
+    _rng: random.Random = PrivateAttr()
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._rng = random.Random(self.seed)
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata(model_name=self.model, is_chat_model=False)
+
+    def complete(self, prompt: str, formatted: bool = False, **kwargs: Any) -> CompletionResponse:
+        return CompletionResponse(text="")
+
+    def stream_complete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponseGen:
+        yield CompletionResponse(text="", delta="")
+
+    async def astructured_predict(
+        self,
+        output_cls: Type[BaseModel],
+        prompt: BasePromptTemplate,
+        llm_kwargs: Optional[dict] = None,
+        **prompt_args: Any,
+    ) -> BaseModel:
+        self.calls += 1
+        jitter = 1 + self.latency_jitter * (2 * self._rng.random() - 1)
+        await asyncio.sleep(max(0.0, self.latency * jitter))
+        if self._rng.random() < self.error_rate:
+            raise FakeLLMError("Injected failure")
+
+        if output_cls is ContractExtraction:
+            return self._extract(prompt_args["contract_data"])
+        if output_cls is ClauseComplianceCheck:
+            return self._check(prompt_args["clause_text"], prompt_args["guideline_text"])
+        if output_cls is ClauseComplianceBatch:
+            return ClauseComplianceBatch(results=[
+                self._check(text, prompt_args["guideline_text"])
+                for _, text in _BATCH_CLAUSE_RE.findall(prompt_args["clauses"])
+            ])
+        if output_cls is ComplianceSummary:
+            return ComplianceSummary(
+                summary_notes=f"{prompt_args['noncompliant_count']} clauses need remediation."
+            )
+        if output_cls is ComplianceReport:
+            return ComplianceReport(vendor_name=prompt_args.get("vendor_name"), overall_compliant=False)
+        raise ValueError(f"FakeLLM cannot produce {output_cls.__name__}")
+
+    def _extract(self, contract_data: str) -> ContractExtraction:
+        """Treat every bullet line as a clause and derive its flags from keywords."""
+        clauses = []
+        for line in contract_data.splitlines():
+            line = line.strip()
+            if not line.startswith("- ") or line.startswith("- **"):
+                continue
+            text = line[2:].strip()
+            lowered = text.lower()
+            flags = {
+                flag: any(keyword in lowered for keyword in keywords)
+                for flag, keywords in _FLAG_KEYWORDS.items()
+            }
+            clauses.append(ContractClause(clause_text=text, **flags))
+        vendor = _VENDOR_RE.search(contract_data)
+        return ContractExtraction(
+            vendor_name=vendor.group(1) if vendor else None,
+            effective_date="January 1, 2024" if "Effective Date" in contract_data else None,
+            clauses=clauses,
+        )
+
+    def _check(self, clause_text: str, guideline_text: str) -> ClauseComplianceCheck:
+        compliant = _stable_fraction(clause_text) >= self.non_compliant_rate
+        guideline = _GUIDELINE_RE.search(guideline_text)
+        return ClauseComplianceCheck(
+            clause_text=clause_text,
+            matched_guideline=GuidelineMatch(
+                guideline_text=(guideline.group(1) if guideline else guideline_text)[:300],
+                similarity_score=0.0,
+            ),
+            compliant=compliant,
+            notes=None if compliant else "Synthetic finding: clause lacks the required safeguards.",
+            confidence=0.95,
+        )
+
+
+class HashEmbedding(BaseEmbedding):
+    """Deterministic offline embedder using signed feature hashing of words.
+
+    Texts sharing words get similar vectors, so retrieval behaves plausibly
+    without a model. ``latency`` is slept once per embedding call (per batch
+    for batched calls).
+    """
+
+    embed_dim: int = Field(default=256, description="Embedding dimension.")
+    latency: float = Field(default=0.0, description="Seconds slept per embedding call.")
+
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs.setdefault("model_name", "hash-embedding")
+        super().__init__(**kwargs)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "HashEmbedding"
+
+    def _embed(self, text: str) -> List[float]:
+        vector = np.zeros(self.embed_dim, dtype="float32")
+        for word in _WORD_RE.findall(text.lower()):
+            h = zlib.crc32(word.encode())
+            vector[h % self.embed_dim] += 1.0 if h & 0x80000000 else -1.0
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector.tolist()
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._embed(query)
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        await asyncio.sleep(self.latency)
+        return self._embed(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._embed(text)
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    async def _aget_text_embeddings(self, texts: Sequence[str]) -> List[List[float]]:
+        await asyncio.sleep(self.latency)
+        return [self._embed(text) for text in texts]
@@ -0,0 +1,188 @@
+import asyncio
+import multiprocessing
+import resource
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from llama_index.core.utils import get_tokenizer
+
+from ..config.settings import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_SIMILARITY_TOP_K,
+    GUIDELINE_INDEX_DIRNAME,
+)
+from ..models.compliance import ContractReviewResult
+from ..models.events import MatchGuidelineResultEvent
+from ..runner import iter_review_events
+from ..utils.batch_retriever import FaissBatchRetriever
+from ..utils.guideline_index import load_or_build_guideline_index
+from ..utils.logger import setup_logger
+from ..utils.metrics import RunMetrics, quantile
+from ..utils.rate_limit import AdaptiveRateLimiter
+from ..workflows.contract_review import ContractReviewWorkflow
+from .fakes import FakeLLM, HashEmbedding
+from .synthetic import generate_contract, prepare_guidelines
+
+logger = setup_logger(__name__)
+
+# Effectively unlimited, so the benchmark measures the pipeline rather than the limiter
+_UNLIMITED_RPM = 10 ** 9
+_UNLIMITED_TPM = 10 ** 12
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (ru_maxrss is in KB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def run_scenario(
+    n_clauses: int,
+    guideline_mb: float,
+    work_dir: Path,
+    repeats: int = 3,
+    llm_latency: float = 0.05,
+    error_rate: float = 0.0,
+    embed_latency: float = 0.0,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    batch_evaluation: bool = False,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Review a synthetic contract ``repeats`` times with the fake LLM and embedder.
+
+    Each repeat uses a fresh workflow and output directory, so extraction and
+    verdicts are never served from a cache or checkpoint.
+
+    Returns:
+        Throughput, verdict latency percentiles (time from the start of a run
+        until each clause verdict is streamed), run wall times, LLM call counts,
+        index build/load time and the peak RSS of the process.
+    """
+    work_dir = Path(work_dir)
+    # Load cl100k_base from llama_index's bundled tiktoken cache so no download is needed
+    get_tokenizer()
+
+    guidelines_dir = prepare_guidelines(work_dir, guideline_mb, seed)
+    embed_model = HashEmbedding(latency=embed_latency)
+    metrics = RunMetrics()
+    with metrics.timer("index_load_seconds"):
+        index = load_or_build_guideline_index(
+            guidelines_dir=guidelines_dir,
+            embed_model=embed_model,
+            embed_model_name=embed_model.model_name,
+            dimension=embed_model.embed_dim,
+            persist_dir=work_dir / f"{GUIDELINE_INDEX_DIRNAME}_{guideline_mb:g}mb",
+        )
+    index_seconds = metrics.summary()["timers"]["index_load_seconds"]["total_s"]
+
+    contract_path = work_dir / f"contract_{n_clauses}.md"
+    contract_path.write_text(generate_contract(n_clauses, seed=seed))
+
+    llm = FakeLLM(latency=llm_latency, error_rate=error_rate, seed=seed)
+    wall_times: List[float] = []
+    verdict_latencies: List[float] = []
+    clauses = 0
+    for repeat in range(repeats):
+        run_dir = work_dir / "runs" / f"{n_clauses}_{guideline_mb:g}mb_{repeat}"
+        if run_dir.exists():
+            shutil.rmtree(run_dir)
+        workflow = ContractReviewWorkflow(
+            guideline_retriever=FaissBatchRetriever(
+                index, similarity_top_k=DEFAULT_SIMILARITY_TOP_K, embed_model=embed_model, metrics=metrics
+            ),
+            llm=llm,
+            output_dir=str(run_dir),
+            max_concurrency=max_concurrency,
+            batch_evaluation=batch_evaluation,
+            rate_limiter=AdaptiveRateLimiter(_UNLIMITED_RPM, _UNLIMITED_TPM),
+            checkpointing=False,
+            metrics=metrics,
+            verbose=False,
+            timeout=None,
+        )
+
+        start = time.perf_counter()
+        result = None
+        try:
+            async for event in iter_review_events(workflow, contract_path):
+                if isinstance(event, MatchGuidelineResultEvent):
+                    verdict_latencies.append(time.perf_counter() - start)
+                elif isinstance(event, ContractReviewResult):
+                    result = event
+        finally:
+            workflow.close()
+        wall_times.append(time.perf_counter() - start)
+        clauses += len(result.match_results)
+
+    verdicts = sorted(verdict_latencies)
+    walls = sorted(wall_times)
+    return {
+        "clauses": n_clauses,
+        "guideline_mb": guideline_mb,
+        "repeats": repeats,
+        "llm_latency_s": llm_latency,
+        "error_rate": error_rate,
+        "max_concurrency": max_concurrency,
+        "batch_evaluation": batch_evaluation,
+        "index_load_s": index_seconds,
+        "clauses_reviewed": clauses,
+        "clauses_per_s": round(clauses / sum(wall_times), 3) if wall_times else 0.0,
+        "verdict_p50_s": round(quantile(verdicts, 0.5), 4),
+        "verdict_p99_s": round(quantile(verdicts, 0.99), 4),
+        "run_p50_s": round(quantile(walls, 0.5), 4),
+        "run_p99_s": round(quantile(walls, 0.99), 4),
+        "llm_calls": llm.calls,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "metrics": metrics.summary(),
+    }
+
+
+def _run_scenario_sync(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return asyncio.run(run_scenario(**kwargs))
+
+
+def run_benchmark(
+    clause_counts: Sequence[int],
+    guideline_sizes_mb: Sequence[float],
+    work_dir: Path,
+    isolate: bool = True,
+    **scenario_kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Run every (clause count, guideline size) scenario.
+
+    With ``isolate`` each scenario runs in a fresh process so its peak RSS is
+    not inflated by earlier scenarios.
+    """
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    results = []
+    for guideline_mb in guideline_sizes_mb:
+        for n_clauses in clause_counts:
+            kwargs = dict(
+                n_clauses=n_clauses, guideline_mb=guideline_mb, work_dir=work_dir, **scenario_kwargs
+            )
+            logger.info(f"Benchmark: {n_clauses} clauses, {guideline_mb:g} MB guidelines")
+            if isolate:
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(_run_scenario_sync, kwargs).result()
+            else:
+                result = _run_scenario_sync(kwargs)
+            results.append(result)
+    return results
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    """Render benchmark results as a plain-text table."""
+    columns = (
+        ("clauses", "clauses"), ("guideline_mb", "guide MB"), ("index_load_s", "index s"),
+        ("clauses_per_s", "clauses/s"), ("verdict_p50_s", "p50 s"), ("verdict_p99_s", "p99 s"),
+        ("run_p50_s", "run p50 s"), ("llm_calls", "LLM calls"), ("peak_rss_mb", "peak RSS MB"),
+    )
+    rows = [[header for _, header in columns]]
+    rows += [[f"{result[key]:g}" if isinstance(result[key], float) else str(result[key])
+              for key, _ in columns] for result in results]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    return "\n".join("  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
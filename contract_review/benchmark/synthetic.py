@@ -0,0 +1,123 @@
+import random
+import shutil
+from pathlib import Path
+
+# Clause templates; about half mention data protection so triage has work to skip
+_DATA_CLAUSES = (
+    "Vendor shall process personal data of {party} solely to {purpose} and for no other purpose.",
+    "Vendor may transfer personal data of {party} to {place} using {mechanism}.",
+    "Vendor shall obtain the consent of {party} before using their personal data to {purpose}.",
+    "Vendor shall protect personal data of {party} with {safeguard} and notify Client of any breach within {days} days.",
+    "Vendor may engage a sub-processor in {place} to process personal data of {party} without prior notice.",
+    "Vendor shall retain personal data of {party} for {days} days after termination and then delete it.",
+    "Vendor shall assist Client in responding to requests from {party} within {days} days.",
+)
+_GENERAL_CLAUSES = (
+    "Client shall pay each invoice for {item} within {days} days of receipt.",
+    "Vendor shall deliver {item} to the locations designated by Client within {days} business days.",
+    "Either party may terminate this Agreement with {days} days written notice.",
+    "Vendor warrants that {item} will be free from defects for {days} days after delivery.",
+    "Prices for {item} are fixed for the first {days} days of the term.",
+    "Vendor shall maintain insurance covering the supply of {item} throughout the term.",
+    "Neither party is liable for delays in delivering {item} caused by events beyond its control.",
+)
+_SECTION_TITLES = (
+    "Services", "Data Protection", "Payment Terms", "Delivery", "Security",
+    "Term and Termination", "Warranties", "Sub-processing", "Data Retention", "Liability",
+)
+_FIELDS = {
+    "party": ("customers", "employees", "end users", "website visitors", "job applicants"),
+    "purpose": ("fulfil orders", "provide support", "manage accounts", "send invoices", "improve services"),
+    "place": ("the United States", "India", "Brazil", "the European Union", "any country"),
+    "mechanism": ("standard contractual clauses", "binding corporate rules", "its own safeguards"),
+    "safeguard": ("encryption at rest", "pseudonymisation", "appropriate security measures", "access controls"),
+    "item": ("office supplies", "printer consumables", "furniture", "software licences", "hardware"),
+    "days": ("5", "10", "14", "30", "60", "90"),
+}
+
+_ARTICLE_TOPICS = (
+    ("Lawfulness of processing", "Processing of personal data is lawful only where a legal basis applies"),
+    ("Conditions for consent", "Where processing is based on consent the controller must be able to demonstrate it"),
+    ("Processor obligations", "Processing by a processor shall be governed by a binding contract"),
+    ("Security of processing", "The controller and processor shall implement appropriate technical and organisational measures"),
+    ("Breach notification", "A personal data breach shall be notified to the supervisory authority without undue delay"),
+    ("International transfers", "Transfers of personal data to third countries require an adequacy decision or safeguards"),
+    ("Storage limitation", "Personal data shall be kept no longer than necessary for the purposes of processing"),
+    ("Data subject rights", "The data subject has the right to access, rectify and erase personal data"),
+)
+_ARTICLE_SENTENCES = (
+    "{lead}, taking into account the nature, scope, context and purposes of processing.",
+    "The measures shall be reviewed and updated where necessary, in particular for {subject}.",
+    "Member States may maintain more specific provisions concerning {subject}.",
+    "The controller shall document any decision relating to {subject} and make it available on request.",
+    "Where {subject} is concerned, the risks to the rights and freedoms of natural persons shall be assessed.",
+)
+
+
+def _fill(template: str, rng: random.Random) -> str:
+    return template.format(**{name: rng.choice(values) for name, values in _FIELDS.items()})
+
+
+def generate_contract(n_clauses: int, seed: int = 0) -> str:
+    """Generate a markdown contract with ``n_clauses`` distinct bullet clauses in titled sections."""
+    rng = random.Random(seed)
+    lines = [
+        f"# Synthetic Vendor Agreement {seed}",
+        "",
+        "**Effective Date:** January 1, 2024",
+        "",
+        "## Parties:",
+        "- **Client:** LlamaCo (\"Client\")",
+        f"- **Vendor:** Synthetic Vendor {seed} Ltd. (\"Vendor\")",
+    ]
+    for k in range(n_clauses):
+        if k % 5 == 0:
+            section = k // 5 + 1
+            lines += ["", f"## {section}. {_SECTION_TITLES[section % len(_SECTION_TITLES)]}", ""]
+        templates = _DATA_CLAUSES if rng.random() < 0.5 else _GENERAL_CLAUSES
+        # The schedule reference keeps every clause distinct
+        lines.append(f"- {_fill(rng.choice(templates), rng)[:-1]}, as set out in Schedule {k + 1}.")
+    return "\n".join(lines) + "\n"
+
+
+def generate_guidelines(guidelines_dir: Path, target_bytes: int, seed: int = 0,
+                        file_bytes: int = 5 * 1024 * 1024) -> None:
+    """Write a synthetic GDPR-like guideline corpus of about ``target_bytes`` as markdown files.
+
+    The corpus is split into files of at most ``file_bytes`` so it loads like a
+    real multi-document guideline directory.
+    """
+    rng = random.Random(seed)
+    guidelines_dir = Path(guidelines_dir)
+    guidelines_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    file_index = 0
+    article = 0
+    while written < target_bytes:
+        file_index += 1
+        parts = []
+        size = 0
+        while size < file_bytes and written + size < target_bytes:
+            article += 1
+            title, lead = _ARTICLE_TOPICS[article % len(_ARTICLE_TOPICS)]
+            sentences = [
+                rng.choice(_ARTICLE_SENTENCES).format(lead=lead, subject=_fill("{party} in {place}", rng))
+                for _ in range(rng.randint(3, 8))
+            ]
+            part = f"## Article {article}. {title}\n\n{lead}. " + " ".join(sentences) + "\n\n"
+            parts.append(part)
+            size += len(part.encode())
+        (guidelines_dir / f"guidelines_{file_index:04d}.md").write_text("".join(parts))
+        written += size
+
+
+def prepare_guidelines(work_dir: Path, guideline_mb: float, seed: int = 0) -> Path:
+    """Generate (once) the synthetic guideline corpus of ``guideline_mb`` MB under ``work_dir``."""
+    guidelines_dir = Path(work_dir) / f"guidelines_{guideline_mb:g}mb"
+    done = guidelines_dir / ".complete"
+    if not done.exists():
+        if guidelines_dir.exists():
+            shutil.rmtree(guidelines_dir)
+        generate_guidelines(guidelines_dir, int(guideline_mb * 1024 * 1024), seed=seed)
+        done.touch()
+    return guidelines_dir
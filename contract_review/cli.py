@@ -1,31 +1,549 @@
 import click
 import asyncio
 from pathlib import Path
-from contract_review.main import main
+from contract_review.config.settings import (
+    DEFAULT_CONTRACT_PATH,
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_BATCH_CONCURRENCY,
+    BATCH_OUTPUT_DIRNAME,
+    DEFAULT_SERVER_HOST,
+    DEFAULT_SERVER_PORT,
+    DEFAULT_SERVER_CONCURRENCY,
+    UPLOAD_DIRNAME,
+    RESULTS_STORE_FILENAME,
+    BENCHMARK_DIRNAME,
+    DEFAULT_BENCHMARK_CLAUSES,
+    DEFAULT_BENCHMARK_GUIDELINE_MB,
+    DEFAULT_BENCHMARK_REPEATS,
+    DEFAULT_BENCHMARK_LLM_LATENCY,
+    DEFAULT_INDEX_BENCHMARK_GUIDELINE_MB,
+    DEFAULT_INDEX_BENCHMARK_QUERIES,
+    DEFAULT_INDEX_BENCHMARK_NPROBE,
+    DEFAULT_INDEX_BENCHMARK_EF_SEARCH,
+    DEFAULT_SIMILARITY_TOP_K,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_CLI_IMPORT_BUDGET_MS,
+    LAZY_IMPORT_MODULES,
+)
 from contract_review.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-@click.command()
+@click.group()
+def cli():
+    """Contract review assistant."""
+
+@cli.command(name="review")
 @click.option(
     '--contract-path',
     type=click.Path(exists=True),
-    default="data/vendor_agreement.md",
+    default=DEFAULT_CONTRACT_PATH,
     help='Path to the contract file to analyze'
 )
+@click.option(
+    '--previous-review',
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help='Review JSON of an earlier revision; only changed sections are re-reviewed'
+)
+@click.option(
+    '--ndjson',
+    'ndjson_path',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Stream each clause verdict to this file as NDJSON as soon as it is available'
+)
+@click.option(
+    '--report-json',
+    'report_json_path',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Write the review result as JSON to this file instead of printing the report'
+)
+@click.option(
+    '--metrics-json',
+    'metrics_json_path',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Write step, LLM, retrieval and cache metrics for the run to this JSON file'
+)
+@click.option(
+    '--local',
+    is_flag=True,
+    default=False,
+    help='Use the local FAISS index and configured LLM provider instead of LlamaCloud'
+)
 @click.option(
     '--verbose',
     is_flag=True,
     default=True,
     help='Enable verbose output'
 )
-def run_review(contract_path: str, verbose: bool):
+def run_review(
+    contract_path: str,
+    previous_review: str,
+    ndjson_path: str,
+    report_json_path: str,
+    metrics_json_path: str,
+    local: bool,
+    verbose: bool,
+):
     """Run the contract review workflow."""
+    # Import only the selected stack; the cloud one pulls in LlamaCloud and LlamaParse
+    if local:
+        from contract_review.main_local import main
+    else:
+        from contract_review.main import main
     try:
-        asyncio.run(main())
+        asyncio.run(main(
+            contract_path,
+            previous_review=previous_review,
+            ndjson_path=ndjson_path,
+            report_json_path=report_json_path,
+            metrics_json_path=metrics_json_path,
+        ))
     except Exception as e:
         logger.error(f"Error: {str(e)}")
         raise click.ClickException(str(e))
 
+@cli.command(name="batch")
+@click.argument('target')
+@click.option(
+    '--concurrency',
+    type=click.IntRange(min=1),
+    default=DEFAULT_BATCH_CONCURRENCY,
+    show_default=True,
+    help='Number of contracts reviewed concurrently'
+)
+@click.option(
+    '--output-dir',
+    type=click.Path(file_okay=False),
+    default=str(Path(DEFAULT_OUTPUT_DIR) / BATCH_OUTPUT_DIRNAME),
+    show_default=True,
+    help='Directory for per-contract reports and summary.json'
+)
+@click.option(
+    '--local',
+    is_flag=True,
+    default=False,
+    help='Use the local FAISS index and configured LLM provider instead of LlamaCloud'
+)
+def run_batch_review(target: str, concurrency: int, output_dir: str, local: bool):
+    """Review every contract in a directory or matching a glob pattern."""
+    from contract_review.batch import resolve_contract_paths, run_batch
+
+    contract_paths = resolve_contract_paths(target)
+    if not contract_paths:
+        raise click.ClickException(f"No contracts found for {target}")
+
+    async def _run():
+        # Build the index and LLM clients once and share them across contracts
+        if local:
+            from contract_review.main_local import build_workflow
+            workflow = await build_workflow(verbose=False)
+        else:
+            from contract_review.main import build_workflow
+            workflow = build_workflow(verbose=False)
+        try:
+            return await run_batch(workflow, contract_paths, Path(output_dir), concurrency)
+        finally:
+            workflow.close()
+
+    try:
+        summary = asyncio.run(_run())
+    except Exception as e:
+        logger.error(f"Error: {str(e)}")
+        raise click.ClickException(str(e))
+
+    click.echo(
+        f"Reviewed {summary['total']} contracts: {summary['succeeded']} succeeded, "
+        f"{summary['failed']} failed, {summary['non_compliant_contracts']} non-compliant. "
+        f"Summary written to {Path(output_dir) / 'summary.json'}"
+    )
+    if summary['failed']:
+        raise SystemExit(1)
+
+@cli.command(name="serve")
+@click.option('--host', default=DEFAULT_SERVER_HOST, show_default=True, help='Interface to bind')
+@click.option('--port', type=int, default=DEFAULT_SERVER_PORT, show_default=True, help='Port to listen on')
+@click.option(
+    '--concurrency',
+    type=click.IntRange(min=1),
+    default=DEFAULT_SERVER_CONCURRENCY,
+    show_default=True,
+    help='Number of reviews running concurrently'
+)
+@click.option(
+    '--local',
+    is_flag=True,
+    default=False,
+    help='Use the local FAISS index and configured LLM provider instead of LlamaCloud'
+)
+def run_server(host: str, port: int, concurrency: int, local: bool):
+    """Serve reviews over HTTP with a warm index and LLM clients."""
+    from aiohttp import web
+    from contract_review.server import create_app
+
+    async def workflow_factory():
+        if local:
+            from contract_review.main_local import build_workflow
+            return await build_workflow(verbose=True)
+        from contract_review.main import build_workflow
+        return build_workflow(verbose=True)
+
+    app = create_app(
+        workflow_factory,
+        upload_dir=Path(DEFAULT_OUTPUT_DIR) / UPLOAD_DIRNAME,
+        max_concurrent_reviews=concurrency,
+    )
+    web.run_app(app, host=host, port=port)
+
+def _number_list(cast):
+    """Click callback parsing a comma-separated list of numbers."""
+    def parse(ctx, param, value):
+        try:
+            return [cast(v) for v in str(value).split(',') if v.strip()]
+        except ValueError:
+            raise click.BadParameter(f"expected comma-separated numbers, got {value}")
+    return parse
+
+@cli.command(name="benchmark")
+@click.option(
+    '--clauses',
+    default=','.join(map(str, DEFAULT_BENCHMARK_CLAUSES)),
+    show_default=True,
+    callback=_number_list(int),
+    help='Comma-separated clause counts of the synthetic contracts'
+)
+@click.option(
+    '--guideline-mb',
+    default=','.join(map(str, DEFAULT_BENCHMARK_GUIDELINE_MB)),
+    show_default=True,
+    callback=_number_list(float),
+    help='Comma-separated sizes (MB) of the synthetic guideline corpora'
+)
+@click.option(
+    '--repeats',
+    type=click.IntRange(min=1),
+    default=DEFAULT_BENCHMARK_REPEATS,
+    show_default=True,
+    help='Reviews per scenario'
+)
+@click.option(
+    '--llm-latency-ms',
+    type=float,
+    default=DEFAULT_BENCHMARK_LLM_LATENCY * 1000,
+    show_default=True,
+    help='Latency injected per fake LLM call'
+)
+@click.option(
+    '--embed-latency-ms',
+    type=float,
+    default=0.0,
+    show_default=True,
+    help='Latency injected per fake embedding call'
+)
+@click.option(
+    '--error-rate',
+    type=click.FloatRange(0, 1),
+    default=0.0,
+    show_default=True,
+    help='Fraction of fake LLM calls that fail (and are retried with backoff)'
+)
+@click.option(
+    '--concurrency',
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    help='Clauses evaluated concurrently'
+)
+@click.option(
+    '--batch-evaluation',
+    is_flag=True,
+    default=False,
+    help='Use multi-clause compliance calls'
+)
+@click.option(
+    '--work-dir',
+    type=click.Path(file_okay=False),
+    default=str(Path(DEFAULT_OUTPUT_DIR) / BENCHMARK_DIRNAME),
+    show_default=True,
+    help='Directory for synthetic data, indexes and results.json'
+)
+def run_benchmark_command(
+    clauses: list,
+    guideline_mb: list,
+    repeats: int,
+    llm_latency_ms: float,
+    embed_latency_ms: float,
+    error_rate: float,
+    concurrency: int,
+    batch_evaluation: bool,
+    work_dir: str,
+):
+    """Benchmark the workflow offline with a fake LLM and hash embedder."""
+    import json
+    from contract_review.benchmark.harness import format_results, run_benchmark
+
+    results = run_benchmark(
+        clauses,
+        guideline_mb,
+        Path(work_dir),
+        repeats=repeats,
+        llm_latency=llm_latency_ms / 1000,
+        embed_latency=embed_latency_ms / 1000,
+        error_rate=error_rate,
+        max_concurrency=concurrency,
+        batch_evaluation=batch_evaluation,
+    )
+    results_path = Path(work_dir) / "results.json"
+    results_path.write_text(json.dumps(results, indent=2, sort_keys=True))
+    click.echo(format_results(results))
+    click.echo(f"Results written to {results_path}")
+
+@cli.command(name="benchmark-index")
+@click.option(
+    '--index-types',
+    default='flat,ivf_flat,ivf_pq,hnsw',
+    show_default=True,
+    help='Comma-separated index types to compare with the exact flat index'
+)
+@click.option(
+    '--metric',
+    type=click.Choice(['l2', 'ip', 'cosine']),
+    default='l2',
+    show_default=True,
+    help='Distance metric'
+)
+@click.option(
+    '--nprobe',
+    default=','.join(map(str, DEFAULT_INDEX_BENCHMARK_NPROBE)),
+    show_default=True,
+    callback=_number_list(int),
+    help='Comma-separated IVF nprobe values'
+)
+@click.option(
+    '--ef-search',
+    default=','.join(map(str, DEFAULT_INDEX_BENCHMARK_EF_SEARCH)),
+    show_default=True,
+    callback=_number_list(int),
+    help='Comma-separated HNSW efSearch values'
+)
+@click.option(
+    '--guideline-mb',
+    type=float,
+    default=DEFAULT_INDEX_BENCHMARK_GUIDELINE_MB,
+    show_default=True,
+    help='Size of the synthetic guideline corpus'
+)
+@click.option(
+    '--guidelines-dir',
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help='Benchmark this guideline directory with the configured embedding model instead'
+)
+@click.option(
+    '--queries',
+    type=click.IntRange(min=1),
+    default=DEFAULT_INDEX_BENCHMARK_QUERIES,
+    show_default=True,
+    help='Number of synthetic clause queries'
+)
+@click.option(
+    '--top-k',
+    type=click.IntRange(min=1),
+    default=DEFAULT_SIMILARITY_TOP_K,
+    show_default=True,
+    help='Neighbours per query used for recall'
+)
+@click.option(
+    '--work-dir',
+    type=click.Path(file_okay=False),
+    default=str(Path(DEFAULT_OUTPUT_DIR) / BENCHMARK_DIRNAME),
+    show_default=True,
+    help='Directory for synthetic data and index_results.json'
+)
+def run_index_benchmark_command(
+    index_types: str,
+    metric: str,
+    nprobe: list,
+    ef_search: list,
+    guideline_mb: float,
+    guidelines_dir: str,
+    queries: int,
+    top_k: int,
+    work_dir: str,
+):
+    """Compare recall and latency of guideline index types against exact search."""
+    import json
+    from contract_review.benchmark.ann import format_index_results, run_index_benchmark, sweep_configs
+
+    embed_model = None
+    if guidelines_dir:
+        from contract_review.main_local import initialize_embedding
+        embed_model = asyncio.run(initialize_embedding())
+
+    configs = sweep_configs(
+        [t.strip() for t in index_types.split(',') if t.strip()], metric, nprobe, ef_search
+    )
+    Path(work_dir).mkdir(parents=True, exist_ok=True)
+    results = run_index_benchmark(
+        configs,
+        Path(work_dir),
+        guideline_mb,
+        queries,
+        guidelines_dir=Path(guidelines_dir) if guidelines_dir else None,
+        embed_model=embed_model,
+        top_k=top_k,
+    )
+    results_path = Path(work_dir) / "index_results.json"
+    results_path.write_text(json.dumps(results, indent=2, sort_keys=True))
+    click.echo(format_index_results(results))
+    click.echo(f"Results written to {results_path}")
+
+@cli.group(name="results")
+def results():
+    """Query and export stored review results."""
+
+_FORMAT_OPTION = click.option(
+    '--format', 'fmt',
+    type=click.Choice(['table', 'csv', 'json', 'ndjson']),
+    default='table',
+    show_default=True,
+    help='Output format'
+)
+
+def _emit_rows(rows: list, fmt: str, output: str) -> None:
+    from contract_review.utils.results_store import format_rows
+
+    text = format_rows(rows, fmt)
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        Path(output).write_text(text)
+        click.echo(f"{len(rows)} rows written to {output}")
+    else:
+        click.echo(text, nl=False)
+
+def _open_results_store(db: str):
+    from contract_review.utils.results_store import ResultsStore
+
+    if not Path(db).exists():
+        raise click.ClickException(f"No results store at {db}; run a review first")
+    return ResultsStore(Path(db))
+
+@results.command(name="reviews")
+@click.option('--vendor', default=None, help='Vendor name prefix (case-insensitive)')
+@click.option(
+    '--compliant/--non-compliant',
+    default=None,
+    help='Only overall compliant or non-compliant contracts'
+)
+@click.option('--all-runs', is_flag=True, default=False, help='Include superseded reviews of the same contract')
+@click.option('--limit', type=click.IntRange(min=1), default=None, help='Maximum number of rows')
+@_FORMAT_OPTION
+@click.option('--output', type=click.Path(dir_okay=False), default=None, help='Write to this file instead of stdout')
+@click.option(
+    '--db',
+    type=click.Path(dir_okay=False),
+    default=str(Path(DEFAULT_OUTPUT_DIR) / RESULTS_STORE_FILENAME),
+    show_default=True,
+    help='Results store'
+)
+def results_reviews(
+    vendor: str,
+    compliant: bool,
+    all_runs: bool,
+    limit: int,
+    fmt: str,
+    output: str,
+    db: str,
+):
+    """List stored reviews (latest per contract), newest first."""
+    store = _open_results_store(db)
+    rows = store.query_reviews(vendor=vendor, compliant=compliant, all_runs=all_runs, limit=limit)
+    _emit_rows(rows, fmt, output)
+
+@results.command(name="clauses")
+@click.option('--vendor', default=None, help='Vendor name prefix (case-insensitive)')
+@click.option(
+    '--compliant/--non-compliant',
+    default=None,
+    help='Only compliant or non-compliant clauses'
+)
+@click.option(
+    '--flag',
+    'flags',
+    multiple=True,
+    type=click.Choice([
+        'mentions_data_processing', 'mentions_data_transfer', 'requires_consent',
+        'specifies_purpose', 'mentions_safeguards',
+    ]),
+    help='Clause flag that must be set (repeatable)'
+)
+@click.option('--guideline', default=None, help='Matched guideline text prefix (case-sensitive)')
+@click.option('--text', default=None, help='Clause text substring')
+@click.option('--all-runs', is_flag=True, default=False, help='Include superseded reviews of the same contract')
+@click.option('--limit', type=click.IntRange(min=1), default=None, help='Maximum number of rows')
+@_FORMAT_OPTION
+@click.option('--output', type=click.Path(dir_okay=False), default=None, help='Write to this file instead of stdout')
+@click.option(
+    '--db',
+    type=click.Path(dir_okay=False),
+    default=str(Path(DEFAULT_OUTPUT_DIR) / RESULTS_STORE_FILENAME),
+    show_default=True,
+    help='Results store'
+)
+def results_clauses(
+    vendor: str,
+    compliant: bool,
+    flags: tuple,
+    guideline: str,
+    text: str,
+    all_runs: bool,
+    limit: int,
+    fmt: str,
+    output: str,
+    db: str,
+):
+    """Query clause verdicts across all reviewed contracts."""
+    store = _open_results_store(db)
+    rows = store.query_clauses(
+        vendor=vendor,
+        compliant=compliant,
+        flags=flags,
+        guideline=guideline,
+        text=text,
+        all_runs=all_runs,
+        limit=limit,
+    )
+    _emit_rows(rows, fmt, output)
+
+@cli.command(name="check-imports")
+@click.option(
+    '--budget-ms',
+    type=float,
+    default=DEFAULT_CLI_IMPORT_BUDGET_MS,
+    show_default=True,
+    help='Maximum time to import the CLI'
+)
+@click.option(
+    '--module',
+    default='contract_review.cli',
+    show_default=True,
+    help='Module whose import is checked'
+)
+def run_check_imports(budget_ms: float, module: str):
+    """Check that the CLI imports within budget without loading provider backends."""
+    from contract_review.utils.import_check import check_import_budget
+
+    total, imports, problems = check_import_budget(module, budget_ms / 1000, LAZY_IMPORT_MODULES)
+    click.echo(f"import {module}: {total * 1000:.0f} ms (budget {budget_ms:.0f} ms)")
+    for name, seconds in imports[:10]:
+        click.echo(f"  {seconds * 1000:8.1f} ms  {name}")
+    if problems:
+        for problem in problems:
+            click.echo(f"FAIL: {problem}", err=True)
+        raise SystemExit(1)
+
 if __name__ == '__main__':
-    run_review() 
\ No newline at end of file
+    cli()
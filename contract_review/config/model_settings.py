@@ -1,8 +1,22 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional, Tuple
 import os
 from dotenv import load_dotenv
 
+from .settings import (
+    DEFAULT_CASCADE_MIN_CONFIDENCE,
+    DEFAULT_CLAUSE_REUSE_THRESHOLD,
+    DEFAULT_GUIDELINE_INDEX_METRIC,
+    DEFAULT_GUIDELINE_INDEX_TYPE,
+    DEFAULT_HNSW_EF_SEARCH,
+    DEFAULT_HNSW_M,
+    DEFAULT_INGESTION_WORKERS,
+    DEFAULT_IVF_NPROBE,
+    DEFAULT_PQ_M,
+    DEFAULT_TRIAGE_FLAGS,
+    DEFAULT_TRIAGE_KEYWORDS,
+)
+
 load_dotenv()
 
 class LLMProvider(str, Enum):
@@ -29,10 +43,139 @@ class ModelSettings:
             
     @staticmethod
     def get_embedding_model() -> str:
-        """Get the embedding model name."""
-        return os.getenv("EMBEDDING_MODEL", "text-embedding-ada-002")
+        """Get the embedding model name based on provider."""
+        provider = ModelSettings.get_llm_provider()
+        if provider == LLMProvider.OPENAI:
+            return os.getenv("EMBEDDING_MODEL", "text-embedding-ada-002")
+        else:
+            return os.getenv("OLLAMA_EMBEDDING_MODEL", "nomic-embed-text")
     
     @staticmethod
     def get_ollama_base_url() -> str:
         """Get Ollama base URL."""
-        return os.getenv("OLLAMA_BASE_URL", "http://localhost:11434") 
\ No newline at end of file
+        return os.getenv("OLLAMA_BASE_URL", "http://localhost:11434") 
+
+    @staticmethod
+    def get_llm_cache_backend() -> str:
+        """Get the LLM response cache backend: memory, sqlite or none."""
+        return os.getenv("LLM_CACHE", "sqlite").lower()
+
+    @staticmethod
+    def get_embedding_cache_enabled() -> bool:
+        """Whether embeddings are served from and stored in the persistent embedding cache."""
+        return os.getenv("EMBEDDING_CACHE", "true").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def get_requests_per_minute() -> int:
+        """Get the LLM requests-per-minute budget."""
+        return int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+
+    @staticmethod
+    def get_tokens_per_minute() -> int:
+        """Get the LLM tokens-per-minute budget."""
+        return int(os.getenv("LLM_TOKENS_PER_MINUTE", "300000"))
+
+    @staticmethod
+    def get_batch_evaluation() -> bool:
+        """Whether clauses are evaluated in multi-clause LLM calls."""
+        return os.getenv("LLM_BATCH_EVALUATION", "false").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def get_llm_cascade() -> List[Tuple[LLMProvider, str]]:
+        """Get the clause evaluation tiers, cheapest first, as (provider, model) pairs.
+
+        ``LLM_CASCADE`` is a comma-separated list of ``provider:model`` entries,
+        e.g. ``ollama:llama3.2,openai:gpt-4``. Empty disables the cascade.
+        """
+        tiers = []
+        for entry in os.getenv("LLM_CASCADE", "").split(","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            provider, sep, model = entry.partition(":")
+            if not sep or not model:
+                raise ValueError(f"Invalid LLM_CASCADE entry '{entry}', expected provider:model")
+            tiers.append((LLMProvider(provider.strip().lower()), model.strip()))
+        return tiers
+
+    @staticmethod
+    def get_cascade_min_confidence() -> float:
+        """Get the confidence below which a cheaper tier's verdict is escalated."""
+        return float(os.getenv("LLM_CASCADE_MIN_CONFIDENCE", str(DEFAULT_CASCADE_MIN_CONFIDENCE)))
+
+    @staticmethod
+    def get_triage_enabled() -> bool:
+        """Whether clauses without data-protection indicators skip the LLM check."""
+        return os.getenv("CLAUSE_TRIAGE", "true").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def get_triage_flags() -> Tuple[str, ...]:
+        """Get the clause flags that make a clause relevant (comma-separated CLAUSE_TRIAGE_FLAGS)."""
+        flags = os.getenv("CLAUSE_TRIAGE_FLAGS", "").strip()
+        if not flags:
+            return DEFAULT_TRIAGE_FLAGS
+        return tuple(flag.strip() for flag in flags.split(",") if flag.strip())
+
+    @staticmethod
+    def get_triage_keywords() -> Tuple[str, ...]:
+        """Get the keywords that make a clause relevant (comma-separated CLAUSE_TRIAGE_KEYWORDS)."""
+        keywords = os.getenv("CLAUSE_TRIAGE_KEYWORDS", "").strip()
+        if not keywords:
+            return DEFAULT_TRIAGE_KEYWORDS
+        return tuple(keyword.strip() for keyword in keywords.split(",") if keyword.strip())
+
+    @staticmethod
+    def get_clause_reuse_enabled() -> bool:
+        """Whether verdicts of near-duplicate clauses from earlier contracts are reused."""
+        return os.getenv("CLAUSE_REUSE", "false").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def get_clause_reuse_threshold() -> float:
+        """Get the minimum clause similarity (0-1) for reusing an earlier verdict."""
+        return float(os.getenv("CLAUSE_REUSE_THRESHOLD", str(DEFAULT_CLAUSE_REUSE_THRESHOLD)))
+
+    @staticmethod
+    def get_results_store_enabled() -> bool:
+        """Whether completed reviews are stored in the SQLite results store."""
+        return os.getenv("RESULTS_STORE", "true").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def get_ingestion_workers() -> int:
+        """Get the number of processes parsing contracts with the local readers."""
+        return int(os.getenv("INGESTION_WORKERS", str(DEFAULT_INGESTION_WORKERS)))
+
+    @staticmethod
+    def get_guideline_index_type() -> str:
+        """Get the guideline FAISS index type: flat, ivf_flat, ivf_pq or hnsw."""
+        return os.getenv("GUIDELINE_INDEX_TYPE", DEFAULT_GUIDELINE_INDEX_TYPE).lower()
+
+    @staticmethod
+    def get_guideline_index_metric() -> str:
+        """Get the guideline index metric: l2, ip or cosine."""
+        return os.getenv("GUIDELINE_INDEX_METRIC", DEFAULT_GUIDELINE_INDEX_METRIC).lower()
+
+    @staticmethod
+    def get_ivf_nlist() -> Optional[int]:
+        """Get the number of IVF lists (None chooses one from the corpus size)."""
+        nlist = os.getenv("GUIDELINE_INDEX_NLIST", "").strip()
+        return int(nlist) if nlist else None
+
+    @staticmethod
+    def get_ivf_nprobe() -> int:
+        """Get the number of IVF lists searched per query."""
+        return int(os.getenv("GUIDELINE_INDEX_NPROBE", str(DEFAULT_IVF_NPROBE)))
+
+    @staticmethod
+    def get_pq_m() -> int:
+        """Get the number of PQ sub-quantizers of an IVF-PQ index."""
+        return int(os.getenv("GUIDELINE_INDEX_PQ_M", str(DEFAULT_PQ_M)))
+
+    @staticmethod
+    def get_hnsw_m() -> int:
+        """Get the number of HNSW neighbours per node."""
+        return int(os.getenv("GUIDELINE_INDEX_HNSW_M", str(DEFAULT_HNSW_M)))
+
+    @staticmethod
+    def get_hnsw_ef_search() -> int:
+        """Get the HNSW candidate list size per query."""
+        return int(os.getenv("GUIDELINE_INDEX_EF_SEARCH", str(DEFAULT_HNSW_EF_SEARCH)))
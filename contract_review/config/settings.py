@@ -17,6 +17,141 @@ LLAMA_CLOUD_CONFIG: Dict[str, Any] = {
     "organization_id": "cdcb3478-1348-492e-8aa0-25f47d1a3902",
 }
 
+DEFAULT_CONTRACT_PATH = "data/vendor_agreement.md"
 DEFAULT_OUTPUT_DIR = "data_out"
-DEFAULT_SIMILARITY_TOP_K = 20
-DEFAULT_LLM_MODEL = "gpt-4o" 
\ No newline at end of file
+CHECKPOINT_DIRNAME = "checkpoints"  # per-contract JSONL review checkpoints, under workflow_output
+GUIDELINE_INDEX_DIRNAME = "guideline_index"  # persisted FAISS index under the output dir
+DEFAULT_GUIDELINES_DIR = "data/guidelines"  # loaded recursively
+DEFAULT_SIMILARITY_TOP_K = 10  # guideline nodes retrieved per clause
+DEFAULT_RERANK_TOP_N = 4  # guidelines kept per clause after reranking
+DEFAULT_GUIDELINE_TOKEN_BUDGET = 1500  # guideline tokens sent with each clause
+DEFAULT_EMBED_BATCH_SIZE = 100  # texts per embedding API call
+DEFAULT_MAX_CONCURRENCY = 8  # max clauses (or extraction chunks) evaluated in parallel
+DEFAULT_EVAL_BATCH_SIZE = 8  # max clauses per multi-clause compliance call
+DEFAULT_EVAL_BATCH_TOKEN_BUDGET = 4000  # max clause + guideline tokens per multi-clause call
+DEFAULT_REPORT_TOKEN_BUDGET = 3000  # max non-compliant clause tokens sent for the report summary
+DEFAULT_REPORT_FIELD_TOKENS = 200  # max tokens per clause, guideline or notes field in the summary prompt
+DEFAULT_EXTRACTION_CHUNK_TOKENS = 4000  # max contract tokens per extraction call
+DEFAULT_LLM_MODEL = "gpt-4o"
+
+# Guideline FAISS index (overridable with the GUIDELINE_INDEX_* environment variables)
+DEFAULT_GUIDELINE_INDEX_TYPE = "flat"  # flat, ivf_flat, ivf_pq or hnsw
+DEFAULT_GUIDELINE_INDEX_METRIC = "l2"  # l2, ip or cosine
+DEFAULT_IVF_NPROBE = 16  # IVF lists searched per query
+DEFAULT_PQ_M = 16  # PQ sub-quantizers (reduced to a divisor of the dimension)
+DEFAULT_PQ_NBITS = 8  # bits per PQ code
+DEFAULT_HNSW_M = 32  # HNSW graph neighbours per node
+DEFAULT_HNSW_EF_SEARCH = 128  # HNSW candidate list size per query
+MIN_TRAINING_POINTS_PER_CENTROID = 39  # FAISS warns below this many training vectors per centroid
+
+# Embedding cache shared by index builds, retrieval and batch runs (under the output dir)
+EMBEDDING_CACHE_DIRNAME = "embedding_cache"
+EMBEDDING_CACHE_DB_FILENAME = "embeddings.sqlite"
+
+# Cross-contract clause verdict reuse (CLAUSE_REUSE, stored under the output dir)
+CLAUSE_INDEX_FILENAME = "clause_index.sqlite"
+DEFAULT_CLAUSE_REUSE_THRESHOLD = 0.9  # min estimated Jaccard similarity of word shingles
+CLAUSE_SHINGLE_WORDS = 2  # words per shingle
+MINHASH_PERMUTATIONS = 128
+MINHASH_BANDS = 32  # LSH bands of MINHASH_PERMUTATIONS / MINHASH_BANDS rows each
+
+# Review results store for portfolio queries (under the output dir)
+RESULTS_STORE_FILENAME = "results.sqlite"
+
+# Contract ingestion: parsed text cached under <output_dir>/workflow_output/parsed_cache
+PARSED_CACHE_DIRNAME = "parsed_cache"
+DEFAULT_INGESTION_WORKERS = 4  # processes parsing PDF/DOCX files with the local readers
+PROCESS_PARSED_SUFFIXES = (".pdf", ".docx")  # other files are parsed in a thread
+
+# Contract extraction cache (stored under <output_dir>/workflow_output/extraction_cache)
+DEFAULT_EXTRACTION_CACHE_MAX_ENTRIES = 512
+DEFAULT_EXTRACTION_CACHE_MAX_BYTES = 256 * 1024 * 1024 
+
+# LLM response cache
+DEFAULT_LLM_CACHE_MAX_ENTRIES = 4096  # in-memory backend
+LLM_CACHE_FILENAME = "llm_cache.sqlite"  # sqlite backend, under the output dir
+
+# Batch review
+DEFAULT_BATCH_CONCURRENCY = 4  # contracts reviewed in parallel
+BATCH_OUTPUT_DIRNAME = "batch"  # per-contract reports and summary, under the output dir
+SUPPORTED_CONTRACT_EXTENSIONS = (".md", ".txt", ".pdf", ".docx")
+
+# Review service
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 8080
+DEFAULT_SERVER_CONCURRENCY = 4  # reviews running at the same time
+DEFAULT_MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+UPLOAD_DIRNAME = "uploads"  # temporary contract uploads, under the output dir
+
+# Offline benchmark
+BENCHMARK_DIRNAME = "benchmark"  # synthetic corpora, indexes and results, under the output dir
+DEFAULT_BENCHMARK_CLAUSES = (10, 100, 1000)
+DEFAULT_BENCHMARK_GUIDELINE_MB = (1,)
+DEFAULT_BENCHMARK_REPEATS = 3
+DEFAULT_BENCHMARK_LLM_LATENCY = 0.05  # seconds per fake LLM call
+DEFAULT_INDEX_BENCHMARK_GUIDELINE_MB = 50  # enough chunks to train IVF-PQ (39 * 256 vectors)
+DEFAULT_INDEX_BENCHMARK_QUERIES = 500
+DEFAULT_INDEX_BENCHMARK_NPROBE = (1, 4, 16, 64)
+DEFAULT_INDEX_BENCHMARK_EF_SEARCH = (16, 64, 256)
+
+# Import-time budget for the CLI (checked by `contract-review check-imports`)
+DEFAULT_CLI_IMPORT_BUDGET_MS = 300
+# Provider and backend modules that must load only when selected
+LAZY_IMPORT_MODULES = (
+    "llama_index.core",
+    "llama_index.llms.openai",
+    "llama_index.llms.ollama",
+    "llama_index.embeddings.openai",
+    "llama_index.embeddings.ollama",
+    "llama_index.indices.managed.llama_cloud",
+    "llama_parse",
+    "faiss",
+    "aiohttp",
+)
+
+# LLM retries and backoff
+DEFAULT_MAX_RETRIES = 5  # attempts per LLM call
+DEFAULT_BACKOFF_INITIAL = 1.0  # seconds, doubled (with jitter) per retry
+DEFAULT_BACKOFF_MAX = 60.0  # seconds
+DEFAULT_COMPLETION_TOKEN_ESTIMATE = 512  # completion tokens budgeted per call
+
+# Estimated USD prices per 1K (prompt, completion) tokens, for run cost metrics.
+# Models not listed (e.g. local Ollama models) are counted as free.
+LLM_PRICES_PER_1K_TOKENS = {
+    "gpt-4": (0.03, 0.06),
+    "gpt-4-turbo": (0.01, 0.03),
+    "gpt-4o": (0.0025, 0.01),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+}
+
+# Model cascade: cheaper tiers' verdicts below this confidence are escalated
+DEFAULT_CASCADE_MIN_CONFIDENCE = 0.8
+
+# Clause triage: clauses with none of these flags or keywords skip the LLM check
+DEFAULT_TRIAGE_FLAGS = (
+    "mentions_data_processing",
+    "mentions_data_transfer",
+    "requires_consent",
+    "specifies_purpose",
+    "mentions_safeguards",
+)
+DEFAULT_TRIAGE_KEYWORDS = (
+    "personal data",
+    "personal information",
+    "data subject",
+    "data protection",
+    "gdpr",
+    "privacy",
+    "processing",
+    "processor",
+    "controller",
+    "subprocessor",
+    "sub-processor",
+    "breach",
+    "consent",
+    "transfer",
+    "retention",
+    "security",
+    "encryption",
+)
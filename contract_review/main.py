@@ -1,80 +1,113 @@
 import asyncio
 from pathlib import Path
+from typing import Optional
 from llama_index.indices.managed.llama_cloud import LlamaCloudIndex
 from llama_parse import LlamaParse
-from llama_index.llms.openai import OpenAI
 
+from contract_review.workflows.cascade import create_model_cascade
 from contract_review.workflows.contract_review import ContractReviewWorkflow
-from contract_review.models.events import LogEvent
+from contract_review.runner import (
+    NDJSONClauseWriter,
+    print_review,
+    run_contract_review,
+    write_review_json,
+)
 from contract_review.config.settings import (
     LLAMA_CLOUD_CONFIG,
     ResultType,
+    DEFAULT_CONTRACT_PATH,
+    DEFAULT_OUTPUT_DIR,
     DEFAULT_SIMILARITY_TOP_K
 )
+from contract_review.config.model_settings import LLMProvider, ModelSettings
+from contract_review.utils.clause_index import create_verdict_index
+from contract_review.utils.llm_cache import create_llm_cache
+from contract_review.utils.llm_utils import create_llm
 from contract_review.utils.logger import setup_logger
+from contract_review.utils.results_store import create_results_store
 
 logger = setup_logger(__name__)
 
-async def main():
-    """Run the contract review workflow."""
-    try:
-        # Initialize LlamaCloud Index and retriever
-        index = LlamaCloudIndex(
-            name=LLAMA_CLOUD_CONFIG["name"],
-            project_name=LLAMA_CLOUD_CONFIG["project_name"],
-            organization_id=LLAMA_CLOUD_CONFIG["organization_id"],
-        )
-        retriever = index.as_retriever(similarity_top_k=DEFAULT_SIMILARITY_TOP_K)
+def build_workflow(verbose: bool = True) -> ContractReviewWorkflow:
+    """Build the workflow backed by LlamaCloud, LlamaParse and OpenAI."""
+    # Initialize LlamaCloud Index and retriever
+    index = LlamaCloudIndex(
+        name=LLAMA_CLOUD_CONFIG["name"],
+        project_name=LLAMA_CLOUD_CONFIG["project_name"],
+        organization_id=LLAMA_CLOUD_CONFIG["organization_id"],
+    )
+    retriever = index.as_retriever(similarity_top_k=DEFAULT_SIMILARITY_TOP_K)
 
-        # Initialize document parser
-        parser = LlamaParse(result_type=ResultType.MARKDOWN.value)
+    # Initialize document parser
+    parser = LlamaParse(result_type=ResultType.MARKDOWN.value)
 
-        # Initialize language model
-        llm = OpenAI(model="gpt-4")
+    # Initialize language model
+    llm = create_llm(LLMProvider.OPENAI, "gpt-4")
 
-        # Initialize workflow
-        workflow = ContractReviewWorkflow(
-            parser=parser,
-            guideline_retriever=retriever,
-            llm=llm,
-            verbose=True,
-            timeout=None,  # don't worry about timeout to make sure it completes
-        )
+    # Initialize workflow
+    return ContractReviewWorkflow(
+        parser=parser,
+        guideline_retriever=retriever,
+        llm=llm,
+        verbose=verbose,
+        batch_evaluation=ModelSettings.get_batch_evaluation(),
+        cascade=create_model_cascade(),
+        llm_cache=create_llm_cache(
+            ModelSettings.get_llm_cache_backend(), Path(DEFAULT_OUTPUT_DIR)
+        ),
+        verdict_index=create_verdict_index(Path(DEFAULT_OUTPUT_DIR)),
+        results_store=create_results_store(Path(DEFAULT_OUTPUT_DIR)),
+        # The managed index has no content fingerprint; identify it by name
+        guideline_fingerprint="llamacloud:{organization_id}/{project_name}/{name}".format(**LLAMA_CLOUD_CONFIG),
+        timeout=None,  # don't worry about timeout to make sure it completes
+    )
+
+async def main(
+    contract_path: str = DEFAULT_CONTRACT_PATH,
+    previous_review: Optional[str] = None,
+    ndjson_path: Optional[str] = None,
+    report_json_path: Optional[str] = None,
+    metrics_json_path: Optional[str] = None,
+):
+    """Run the contract review workflow."""
+    workflow = None
+    try:
+        workflow = build_workflow()
 
         # Get the contract path
-        contract_path = Path("data/vendor_agreement.md")
+        contract_path = Path(contract_path)
         if not contract_path.exists():
             raise FileNotFoundError(f"Contract file not found at {contract_path}")
 
-        # Run the workflow
-        handler = workflow.run(contract_path=str(contract_path))
-        
-        # Stream events
-        async for event in handler.stream_events():
-            if isinstance(event, LogEvent):
-                if event.delta:
-                    print(event.msg, end="")
-                else:
-                    print(event.msg)
+        # Run the workflow, streaming clause verdicts to the NDJSON file if requested
+        clause_writer = NDJSONClauseWriter(ndjson_path) if ndjson_path else None
+        try:
+            result = await run_contract_review(
+                workflow,
+                contract_path,
+                previous_review=previous_review,
+                on_clause_result=clause_writer,
+            )
+        finally:
+            if clause_writer is not None:
+                clause_writer.close()
 
-        # Get final results
-        response_dict = await handler
-        print("\nCompliance Report:")
-        print("=" * 50)
-        print(str(response_dict["report"]))
+        if report_json_path:
+            write_review_json(result, report_json_path)
+            print(f"\nReview written to {report_json_path}")
+        else:
+            print_review(result)
 
-        # Print non-compliant results if any
-        if response_dict["non_compliant_results"]:
-            print("\nNon-Compliant Clauses:")
-            print("=" * 50)
-            for result in response_dict["non_compliant_results"]:
-                print(f"\nClause: {result.clause_text}")
-                print(f"Guideline: {result.matched_guideline.guideline_text}")
-                print(f"Notes: {result.notes}")
+        if metrics_json_path:
+            workflow.metrics.write_json(metrics_json_path)
+            print(f"Metrics written to {metrics_json_path}")
 
     except Exception as e:
         logger.error(f"Error running workflow: {str(e)}", exc_info=True)
         raise
+    finally:
+        if workflow is not None:
+            workflow.close()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(main())
@@ -1,136 +1,175 @@
 import asyncio
 from pathlib import Path
-import faiss
-from llama_index.core import VectorStoreIndex, SimpleDirectoryReader, Settings
-from llama_index.vector_stores.faiss import FaissVectorStore
-from llama_index.llms.openai import OpenAI
-from llama_index.llms.ollama import Ollama
-from llama_index.embeddings.openai import OpenAIEmbedding
-from llama_index.embeddings.ollama import OllamaEmbedding
+from typing import Optional
+from llama_index.core import Settings
 
+from contract_review.workflows.cascade import create_model_cascade
 from contract_review.workflows.contract_review import ContractReviewWorkflow
-from contract_review.models.events import LogEvent
-from llama_index.core.workflow import StopEvent
-from contract_review.config.settings import ResultType, DEFAULT_SIMILARITY_TOP_K
+from contract_review.runner import (
+    NDJSONClauseWriter,
+    print_review,
+    run_contract_review,
+    write_review_json,
+)
+from contract_review.config.settings import (
+    ResultType,
+    DEFAULT_CONTRACT_PATH,
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_GUIDELINES_DIR,
+    DEFAULT_SIMILARITY_TOP_K,
+    DEFAULT_EMBED_BATCH_SIZE,
+    EMBEDDING_CACHE_DIRNAME,
+    GUIDELINE_INDEX_DIRNAME,
+)
 from contract_review.config.model_settings import ModelSettings, LLMProvider
+from contract_review.utils.batch_retriever import FaissBatchRetriever
+from contract_review.utils.clause_index import create_verdict_index
+from contract_review.utils.embedding_cache import CachedEmbedding, EmbeddingStore
+from contract_review.utils.guideline_index import (
+    create_index_config,
+    load_or_build_guideline_index,
+    read_index_fingerprint,
+)
+from contract_review.utils.llm_cache import create_llm_cache
+from contract_review.utils.llm_utils import create_llm
 from contract_review.utils.logger import setup_logger
+from contract_review.utils.metrics import RunMetrics
+from contract_review.utils.results_store import create_results_store
 
 logger = setup_logger(__name__)
 
 async def initialize_llm():
     """Initialize the LLM based on configuration."""
-    provider = ModelSettings.get_llm_provider()
-    model_name = ModelSettings.get_llm_model()
-    
-    if provider == LLMProvider.OPENAI:
-        return OpenAI(model=model_name)
-    else:
-        return Ollama(
-            model=model_name,
-            base_url=ModelSettings.get_ollama_base_url(),
-            timeout=300,  # 5 minutes timeout
-            streaming=True,  # Enable streaming
-            max_retries=3,  # Add retry logic
-            request_timeout=300  # 5 minutes timeout for HTTP requests
-        )
+    return create_llm(ModelSettings.get_llm_provider(), ModelSettings.get_llm_model())
 
 async def initialize_embedding():
     """Initialize the embedding model based on configuration."""
     provider = ModelSettings.get_llm_provider()
-    model_name = ModelSettings.get_llm_model()
-    
+    model_name = ModelSettings.get_embedding_model()
+
+    # Import only the selected backend
     if provider == LLMProvider.OPENAI:
-        return OpenAIEmbedding(model=ModelSettings.get_embedding_model())
+        from llama_index.embeddings.openai import OpenAIEmbedding
+        return OpenAIEmbedding(
+            model=model_name,
+            embed_batch_size=DEFAULT_EMBED_BATCH_SIZE,
+        )
     else:
+        from llama_index.embeddings.ollama import OllamaEmbedding
         return OllamaEmbedding(
             model_name=model_name,
             base_url=ModelSettings.get_ollama_base_url(),
+            embed_batch_size=DEFAULT_EMBED_BATCH_SIZE,
             timeout=300,  # 5 minutes timeout
             request_timeout=300  # 5 minutes timeout for HTTP requests
         )
 
-async def main():
+async def build_workflow(verbose: bool = True) -> ContractReviewWorkflow:
+    """Build the workflow backed by a local FAISS index and the configured LLM."""
+    # Initialize local vector store for guidelines
+    guidelines_dir = Path(DEFAULT_GUIDELINES_DIR)
+    if not guidelines_dir.exists():
+        raise FileNotFoundError("Guidelines directory not found. Please add your guidelines in data/guidelines/")
+
+    # Shared by the retriever and the workflow so one summary covers the run
+    metrics = RunMetrics()
+
+    # Set up embedding model, serving previously embedded guideline chunks and
+    # clauses from the persistent embedding cache
+    embed_model = await initialize_embedding()
+    if ModelSettings.get_embedding_cache_enabled():
+        embed_model = CachedEmbedding(
+            embed_model,
+            EmbeddingStore(Path(DEFAULT_OUTPUT_DIR) / EMBEDDING_CACHE_DIRNAME),
+            metrics=metrics,
+        )
+    Settings.embed_model = embed_model
+
+    # Load the persisted FAISS index, re-embedding only when the guidelines,
+    # embedding model or index build parameters have changed; the dimension is
+    # probed from the embedding model
+    index_config = create_index_config()
+    persist_dir = Path(DEFAULT_OUTPUT_DIR) / GUIDELINE_INDEX_DIRNAME
+    with metrics.timer("index_load_seconds"):
+        index = load_or_build_guideline_index(
+            guidelines_dir=guidelines_dir,
+            embed_model=embed_model,
+            embed_model_name=embed_model.model_name,
+            persist_dir=persist_dir,
+            config=index_config,
+        )
+    # Search parameters (nprobe, efSearch) change retrieval without a rebuild
+    guideline_fingerprint = f"{read_index_fingerprint(persist_dir)}:{index_config.model_dump_json()}"
+    retriever = FaissBatchRetriever(
+        index, similarity_top_k=DEFAULT_SIMILARITY_TOP_K, metrics=metrics
+    )
+
+    # Initialize language model
+    llm = await initialize_llm()
+
+    # Initialize workflow with SimpleDirectoryReader
+    return ContractReviewWorkflow(
+        guideline_retriever=retriever,
+        llm=llm,
+        verbose=verbose,
+        batch_evaluation=ModelSettings.get_batch_evaluation(),
+        cascade=create_model_cascade(),
+        metrics=metrics,
+        llm_cache=create_llm_cache(
+            ModelSettings.get_llm_cache_backend(), Path(DEFAULT_OUTPUT_DIR)
+        ),
+        verdict_index=create_verdict_index(Path(DEFAULT_OUTPUT_DIR)),
+        results_store=create_results_store(Path(DEFAULT_OUTPUT_DIR)),
+        guideline_fingerprint=guideline_fingerprint,
+        timeout=None,
+    )
+
+async def main(
+    contract_path: str = DEFAULT_CONTRACT_PATH,
+    previous_review: Optional[str] = None,
+    ndjson_path: Optional[str] = None,
+    report_json_path: Optional[str] = None,
+    metrics_json_path: Optional[str] = None,
+):
     """Run the contract review workflow with local implementations."""
+    workflow = None
     try:
-        # Initialize local vector store for guidelines
-        guidelines_dir = Path("data/guidelines")
-        if not guidelines_dir.exists():
-            raise FileNotFoundError("Guidelines directory not found. Please add your guidelines in data/guidelines/")
-            
-        # Load and index guidelines
-        guidelines_docs = SimpleDirectoryReader(input_dir=str(guidelines_dir)).load_data()
-        
-        # Set up embedding model
-        embed_model = await initialize_embedding()
-        Settings.embed_model = embed_model
-        
-        # Create FAISS index with appropriate dimension
-        d = 384 if ModelSettings.get_llm_provider() == LLMProvider.OLLAMA else 1536
-        faiss_index = faiss.IndexFlatL2(d)
-        vector_store = FaissVectorStore(faiss_index=faiss_index)
-        
-        # Create index and add documents
-        index = VectorStoreIndex.from_documents(guidelines_docs, vector_store=vector_store)
-        retriever = index.as_retriever(similarity_top_k=DEFAULT_SIMILARITY_TOP_K)
-
-        # Initialize language model
-        llm = await initialize_llm()
-
-        # Initialize workflow with SimpleDirectoryReader
-        workflow = ContractReviewWorkflow(
-            guideline_retriever=retriever,
-            llm=llm,
-            verbose=True,
-            timeout=None,
-        )
+        workflow = await build_workflow()
 
         # Get the contract path
-        contract_path = Path("data/vendor_agreement.md")
+        contract_path = Path(contract_path)
         if not contract_path.exists():
             raise FileNotFoundError(f"Contract file not found at {contract_path}")
 
-        # Run the workflow
-        handler = workflow.run(contract_path=str(contract_path))
-        
-        # Stream events and collect the final event
-        final_event = None
-        async for event in handler.stream_events():
-            if isinstance(event, LogEvent):
-                if event.delta:
-                    print(event.msg, end="")
-                else:
-                    print(event.msg)
-            elif isinstance(event, StopEvent):
-                final_event = event
-                break
-
-        # Get final results
-        if final_event is None:
-            # If we didn't get the final event from streaming, try to get it directly
-            final_event = await handler
-            if final_event is None:
-                raise ValueError("Workflow completed but no final event was returned")
-            
-        if not isinstance(final_event, StopEvent):
-            raise ValueError(f"Expected StopEvent, got {type(final_event)}")
-
-        print("\nCompliance Report:")
-        print("=" * 50)
-        print(str(final_event.report))
-
-        # Print non-compliant results if any
-        if final_event.non_compliant_results:
-            print("\nNon-Compliant Clauses:")
-            print("=" * 50)
-            for result in final_event.non_compliant_results:
-                print(f"\nClause: {result.clause_text}")
-                if result.matched_guideline:
-                    print(f"Guideline: {result.matched_guideline.guideline_text}")
-                print(f"Notes: {result.notes}")
+        # Run the workflow, streaming clause verdicts to the NDJSON file if requested
+        clause_writer = NDJSONClauseWriter(ndjson_path) if ndjson_path else None
+        try:
+            result = await run_contract_review(
+                workflow,
+                contract_path,
+                previous_review=previous_review,
+                on_clause_result=clause_writer,
+            )
+        finally:
+            if clause_writer is not None:
+                clause_writer.close()
+
+        if report_json_path:
+            write_review_json(result, report_json_path)
+            print(f"\nReview written to {report_json_path}")
+        else:
+            print_review(result)
+
+        if metrics_json_path:
+            workflow.metrics.write_json(metrics_json_path)
+            print(f"Metrics written to {metrics_json_path}")
 
     except Exception as e:
         logger.error(f"Error running workflow: {str(e)}", exc_info=True)
         raise
+    finally:
+        if workflow is not None:
+            workflow.close()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(main())
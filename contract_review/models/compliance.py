@@ -1,19 +1,49 @@
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 from typing import List, Optional
-from .contract import ContractClause
+from .contract import ContractClause, ContractExtraction
+
+# Notes prefix of the result recorded for a clause that could not be evaluated
+CLAUSE_ERROR_NOTE_PREFIX = "Error processing clause"
 
 class GuidelineMatch(BaseModel):
     guideline_text: str = Field(..., description="The single most relevant guideline excerpt related to this clause.")
     similarity_score: float = Field(..., description="Similarity score indicating how closely the guideline matches the clause.")
     relevance_explanation: Optional[str] = Field(None, description="Brief explanation of why this guideline is relevant.")
 
+class VerdictProvenance(BaseModel):
+    """Where a reused clause verdict was originally evaluated."""
+    contract_hash: str = Field(..., description="SHA-256 of the contract the verdict was evaluated for.")
+    contract_path: Optional[str] = Field(None, description="Path of that contract when it was reviewed.")
+    clause_index: int = Field(..., description="Index of the original clause in that contract.")
+    similarity: float = Field(..., description="Estimated similarity to the original clause (1.0 for a normalized exact match).")
+
 class ClauseComplianceCheck(BaseModel):
     clause_text: str = Field(..., description="The exact text of the clause from the contract.")
     matched_guideline: Optional[GuidelineMatch] = Field(None, description="The most relevant guideline extracted via vector retrieval.")
     compliant: bool = Field(..., description="Indicates whether the clause is considered compliant with the referenced guideline.")
     notes: Optional[str] = Field(None, description="Additional commentary or recommendations.")
+    confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="Confidence in the compliance verdict, from 0 (guess) to 1 (certain).")
+    # Set by the workflow, not the LLM, so it is left out of the output schema
+    reused_from: SkipJsonSchema[Optional[VerdictProvenance]] = Field(None, description="Original clause when the verdict was reused from a near-duplicate.")
+
+class ClauseComplianceBatch(BaseModel):
+    results: List[ClauseComplianceCheck] = Field(..., description="One compliance check per contract clause, in the order the clauses were given.")
+
+class ComplianceSummary(BaseModel):
+    summary_notes: str = Field(..., description="Summary of the compliance issues and recommendations for achieving full compliance.")
 
 class ComplianceReport(BaseModel):
     vendor_name: Optional[str] = Field(None, description="The vendor's name if identified from the contract.")
     overall_compliant: bool = Field(..., description="Indicates if the contract is considered overall compliant.")
-    summary_notes: Optional[str] = Field(None, description="General summary or recommendations for achieving full compliance.") 
\ No newline at end of file
+    summary_notes: Optional[str] = Field(None, description="General summary or recommendations for achieving full compliance.") 
+
+class ContractReviewResult(BaseModel):
+    contract_path: str = Field(..., description="Path of the reviewed contract.")
+    contract_extraction: ContractExtraction = Field(..., description="Information extracted from the contract.")
+    match_results: List[ClauseComplianceCheck] = Field(default_factory=list, description="Compliance checks for every evaluated clause, in clause order.")
+    report: ComplianceReport = Field(..., description="The final compliance report.")
+
+    @property
+    def non_compliant_results(self) -> List[ClauseComplianceCheck]:
+        return [result for result in self.match_results if not result.compliant]
@@ -1,6 +1,9 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 
+# Bump when ContractExtraction/ContractClause change meaning, to invalidate cached extractions
+CONTRACT_EXTRACTION_SCHEMA_VERSION = 1
+
 class ContractClause(BaseModel):
     clause_text: str = Field(..., description="The exact text of the clause.")
     mentions_data_processing: bool = Field(False, description="True if the clause involves personal data collection or usage.")
@@ -1,20 +1,37 @@
 from llama_index.core.workflow import Event
-from typing import List
+from typing import Dict, List, Optional
 from .contract import ContractExtraction, ContractClause
 from .compliance import ClauseComplianceCheck
 
 class ContractExtractionEvent(Event):
     contract_extraction: ContractExtraction
+    contract_hash: str
+    contract_path: Optional[str] = None
+    carried_results: Dict[int, ClauseComplianceCheck] = {}
 
 class MatchGuidelineEvent(Event):
     clause: ContractClause
     vendor_name: str
 
 class MatchGuidelineResultEvent(Event):
+    """Verdict for one clause, streamed as soon as it is available.
+
+    ``source`` is where the verdict came from: ``previous_review``, ``triage``,
+    ``checkpoint``, ``portfolio`` (reused from a near-duplicate clause of an
+    earlier contract), ``llm`` or ``error``.
+    """
+    clause_index: int
     result: ClauseComplianceCheck
+    source: str
 
 class GenerateReportEvent(Event):
+    contract_extraction: ContractExtraction
+    contract_hash: str
     match_results: List[ClauseComplianceCheck]
+    contract_path: Optional[str] = None
+    # Clause index and verdict source of each match result
+    clause_indexes: List[int] = []
+    sources: List[str] = []
 
 class LogEvent(Event):
     msg: str
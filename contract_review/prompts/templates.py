@@ -16,29 +16,47 @@ and provide a JSON object that matches the ClauseComplianceCheck schema.
 
 **Matched Guideline Text(s):**
 {guideline_text}
+
+The guidelines are numbered from most to least relevant. Set `matched_guideline` to the \
+guideline excerpt your verdict primarily rests on, and `confidence` to how certain you are \
+of the verdict.
+"""
+
+CONTRACT_BATCH_MATCH_PROMPT = """\
+Given the following numbered contract clauses and the relevant guideline texts, evaluate the compliance \
+of each clause and provide a JSON object that matches the ClauseComplianceBatch schema.
+
+Return exactly one result per clause, in the same order. Copy each clause's text verbatim into \
+`clause_text`, set `matched_guideline` to the guideline excerpt that result primarily rests on, \
+and set `confidence` to how certain you are of that verdict.
+
+**Contract Clauses:**
+{clauses}
+
+**Matched Guideline Text(s):**
+{guideline_text}
+
+The guidelines are numbered from most to least relevant.
 """
 
 COMPLIANCE_REPORT_SYSTEM_PROMPT = """\
-You are a compliance reporting assistant. Your task is to generate a final compliance report \
-based on the results of clause compliance checks against \
-a given set of guidelines. 
+You are a compliance reporting assistant. Your task is to summarize the noncompliant clauses \
+found when a contract was checked against a given set of guidelines.
 
-Analyze the provided compliance results and produce a structured report according to the specified schema. 
-Ensure that if there are no noncompliant clauses, the report clearly indicates full compliance.
+Explain the compliance issues concisely and recommend the changes needed for full compliance, \
+following the specified schema.
 """
 
 COMPLIANCE_REPORT_USER_PROMPT = """\
-A set of clauses within a contract were checked against GDPR compliance guidelines for the following vendor: {vendor_name}. 
-The set of noncompliant clauses are given below.
+A contract was checked against GDPR compliance guidelines for the following vendor: {vendor_name}. 
+{noncompliant_count} of {clause_count} clauses were found noncompliant. They are given below.
 
-Each section includes:
-- **Clause:** The exact text of the contract clause.
+Each entry includes:
+- **Clause:** The text of the contract clause.
 - **Guideline:** The relevant GDPR guideline text.
-- **Compliance Status:** Should be `False` for noncompliant clauses.
-- **Notes:** Additional information or explanations.
+- **Notes:** The reviewer's explanation.
 
 {compliance_results}
 
-Based on the above compliance results, generate a final compliance report following the `ComplianceReport` schema below. 
-If there are no noncompliant clauses, the report should indicate that the contract is fully compliant.
-""" 
\ No newline at end of file
+Based on the above, write the summary following the `ComplianceSummary` schema.
+"""
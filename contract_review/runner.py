@@ -0,0 +1,144 @@
+import json
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional, Union
+
+from llama_index.core.workflow import StopEvent
+
+from contract_review.models.compliance import ContractReviewResult
+from contract_review.models.events import LogEvent, MatchGuidelineResultEvent
+from contract_review.workflows.contract_review import ContractReviewWorkflow
+
+
+async def iter_review_events(
+    workflow: ContractReviewWorkflow,
+    contract_path: Union[str, Path],
+    previous_review: Optional[Union[str, Path, ContractReviewResult]] = None,
+) -> AsyncIterator[Union[LogEvent, MatchGuidelineResultEvent, ContractReviewResult]]:
+    """Run the workflow on one contract, yielding log events and finally the result.
+
+    Each clause verdict is yielded as a MatchGuidelineResultEvent as soon as it
+    is available, before the report is generated.
+
+    If ``previous_review`` (a result or the path of its JSON) is given, only the
+    sections changed since that review are re-extracted and unchanged clauses keep
+    their earlier verdicts.
+    """
+    handler = workflow.run(contract_path=str(contract_path), previous_review=previous_review)
+
+    try:
+        # Stream events and collect the final event
+        final_event = None
+        async for event in handler.stream_events():
+            if isinstance(event, (LogEvent, MatchGuidelineResultEvent)):
+                yield event
+            elif isinstance(event, StopEvent):
+                final_event = event
+
+        # Surface any exception raised inside the workflow
+        await handler
+    finally:
+        if not handler.done():
+            # The consumer stopped early (e.g. the client disconnected): stop the run too
+            await handler.cancel_run()
+
+    if final_event is None:
+        raise ValueError("Workflow completed but no final event was returned")
+
+    yield ContractReviewResult(
+        contract_path=str(contract_path),
+        contract_extraction=final_event.contract_extraction,
+        match_results=final_event.match_results,
+        report=final_event.report,
+    )
+
+
+async def run_contract_review(
+    workflow: ContractReviewWorkflow,
+    contract_path: Union[str, Path],
+    print_logs: bool = True,
+    previous_review: Optional[Union[str, Path, ContractReviewResult]] = None,
+    on_clause_result: Optional[Callable[[MatchGuidelineResultEvent], None]] = None,
+) -> ContractReviewResult:
+    """Run the workflow on one contract, streaming its log events to stdout.
+
+    ``on_clause_result`` is called with each clause verdict as it is produced.
+    """
+    result = None
+    async for event in iter_review_events(workflow, contract_path, previous_review):
+        if isinstance(event, LogEvent):
+            if print_logs:
+                if event.delta:
+                    print(event.msg, end="")
+                else:
+                    print(event.msg)
+        elif isinstance(event, MatchGuidelineResultEvent):
+            if on_clause_result is not None:
+                on_clause_result(event)
+        else:
+            result = event
+    return result
+
+
+def clause_result_payload(event: MatchGuidelineResultEvent) -> dict:
+    """JSON-serializable record of one streamed clause verdict."""
+    return {
+        "type": "clause",
+        "clause_index": event.clause_index,
+        "source": event.source,
+        "result": event.result.model_dump(mode="json"),
+    }
+
+
+class NDJSONClauseWriter:
+    """Write streamed clause verdicts to a file as NDJSON, one flushed line per clause.
+
+    Lines are written in completion order; ``clause_index`` gives the clause's
+    position in the contract.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Open (and truncate) the output file.
+
+        Args:
+            path: NDJSON file to write
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fp = open(self.path, "w")
+
+    def __call__(self, event: MatchGuidelineResultEvent) -> None:
+        self._fp.write(json.dumps(clause_result_payload(event)) + "\n")
+        self._fp.flush()
+
+    def close(self) -> None:
+        self._fp.close()
+
+    def __enter__(self) -> "NDJSONClauseWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_review_json(result: ContractReviewResult, path: Union[str, Path]) -> None:
+    """Write the review result as JSON (usable later as ``--previous-review``)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(result.model_dump_json(indent=2))
+
+
+def print_review(result: ContractReviewResult) -> None:
+    """Print the compliance report and any non-compliant clauses."""
+    print("\nCompliance Report:")
+    print("=" * 50)
+    print(str(result.report))
+
+    # Print non-compliant results if any
+    if result.non_compliant_results:
+        print("\nNon-Compliant Clauses:")
+        print("=" * 50)
+        for clause_result in result.non_compliant_results:
+            print(f"\nClause: {clause_result.clause_text}")
+            if clause_result.matched_guideline:
+                print(f"Guideline: {clause_result.matched_guideline.guideline_text}")
+            print(f"Notes: {clause_result.notes}")
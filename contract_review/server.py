@@ -0,0 +1,171 @@
+import asyncio
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from aiohttp import web
+
+from contract_review.config.settings import (
+    DEFAULT_MAX_UPLOAD_BYTES,
+    DEFAULT_SERVER_CONCURRENCY,
+    SUPPORTED_CONTRACT_EXTENSIONS,
+)
+from contract_review.models.compliance import ContractReviewResult
+from contract_review.models.events import LogEvent, MatchGuidelineResultEvent
+from contract_review.runner import clause_result_payload, iter_review_events
+from contract_review.utils.logger import setup_logger
+from contract_review.workflows.contract_review import ContractReviewWorkflow
+
+logger = setup_logger(__name__)
+
+WorkflowFactory = Callable[[], Awaitable[ContractReviewWorkflow]]
+
+
+async def _save_upload(request: web.Request, upload_dir: Path) -> Path:
+    """Save the ``file`` field of a multipart upload into a fresh temp directory.
+
+    ``client_max_size`` does not apply to streamed multipart reads, so the
+    upload is limited to DEFAULT_MAX_UPLOAD_BYTES here.
+    """
+    reader = await request.multipart()
+    async for field in reader:
+        if field.name != "file":
+            continue
+        filename = Path(field.filename or "").name
+        if Path(filename).suffix.lower() not in SUPPORTED_CONTRACT_EXTENSIONS:
+            raise web.HTTPBadRequest(
+                text=f"Unsupported contract type '{filename}', expected one of "
+                     f"{', '.join(SUPPORTED_CONTRACT_EXTENSIONS)}"
+            )
+        contract_path = Path(tempfile.mkdtemp(dir=upload_dir)) / filename
+        size = 0
+        try:
+            with open(contract_path, "wb") as fp:
+                while chunk := await field.read_chunk():
+                    size += len(chunk)
+                    if size > DEFAULT_MAX_UPLOAD_BYTES:
+                        raise web.HTTPRequestEntityTooLarge(
+                            max_size=DEFAULT_MAX_UPLOAD_BYTES, actual_size=size
+                        )
+                    fp.write(chunk)
+        except BaseException:
+            shutil.rmtree(contract_path.parent, ignore_errors=True)
+            raise
+        return contract_path
+    raise web.HTTPBadRequest(text="Missing multipart field 'file'")
+
+
+def _ndjson_line(payload: dict) -> bytes:
+    return (json.dumps(payload) + "\n").encode()
+
+
+async def handle_health(request: web.Request) -> web.Response:
+    return web.json_response({"status": "ok"})
+
+
+async def handle_metrics(request: web.Request) -> web.Response:
+    """Expose the shared workflow's metrics in the Prometheus text format."""
+    workflow: ContractReviewWorkflow = request.app["workflow"]
+    return web.Response(
+        text=workflow.metrics.to_prometheus(),
+        content_type="text/plain",
+        headers={"X-Content-Type-Options": "nosniff"},
+    )
+
+
+async def handle_review(request: web.Request) -> web.StreamResponse:
+    """Review an uploaded contract.
+
+    With ``?stream=true`` (the default) the response is NDJSON: one ``log`` line
+    per workflow log event, one ``clause`` line per clause verdict as soon as it
+    is available, then a ``result`` line with the ContractReviewResult (or an
+    ``error`` line). With ``?stream=false`` only the result JSON is returned.
+    """
+    workflow: ContractReviewWorkflow = request.app["workflow"]
+    semaphore: asyncio.Semaphore = request.app["review_semaphore"]
+    stream = request.query.get("stream", "true").lower() != "false"
+
+    contract_path = await _save_upload(request, request.app["upload_dir"])
+    try:
+        if not stream:
+            async with semaphore:
+                events = iter_review_events(workflow, contract_path)
+                try:
+                    result = None
+                    async for event in events:
+                        if isinstance(event, ContractReviewResult):
+                            result = event
+                except Exception as e:
+                    logger.error(f"Review failed for {contract_path.name}: {str(e)}", exc_info=True)
+                    return web.json_response({"error": str(e)}, status=500)
+                finally:
+                    # Also runs when the request is cancelled, cancelling the workflow run
+                    await events.aclose()
+            return web.json_response(text=result.model_dump_json())
+
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        async with semaphore:
+            events = iter_review_events(workflow, contract_path)
+            try:
+                async for event in events:
+                    if isinstance(event, LogEvent):
+                        payload = {"type": "log", "msg": event.msg, "delta": event.delta}
+                    elif isinstance(event, MatchGuidelineResultEvent):
+                        payload = clause_result_payload(event)
+                    else:
+                        payload = {"type": "result", "result": event.model_dump(mode="json")}
+                    await response.write(_ndjson_line(payload))
+            except (ConnectionResetError, asyncio.CancelledError):
+                # The client is gone: nothing can be written, and closing the
+                # event stream cancels the workflow run
+                logger.info(f"Client disconnected, cancelling review of {contract_path.name}")
+                raise
+            except Exception as e:
+                logger.error(f"Review failed for {contract_path.name}: {str(e)}", exc_info=True)
+                await response.write(_ndjson_line({"type": "error", "error": str(e)}))
+            finally:
+                await events.aclose()
+        await response.write_eof()
+        return response
+    finally:
+        shutil.rmtree(contract_path.parent, ignore_errors=True)
+
+
+def create_app(
+    workflow_factory: WorkflowFactory,
+    upload_dir: Path,
+    max_concurrent_reviews: int = DEFAULT_SERVER_CONCURRENCY,
+) -> web.Application:
+    """Create the review service.
+
+    The workflow (and with it the guideline retriever and LLM clients) is built
+    once at startup, shared by every request and closed on shutdown.
+
+    Args:
+        workflow_factory: Coroutine function that builds the shared workflow
+        upload_dir: Directory for temporary contract uploads
+        max_concurrent_reviews: Maximum number of reviews running at the same time
+    """
+    app = web.Application(client_max_size=DEFAULT_MAX_UPLOAD_BYTES)
+    app["upload_dir"] = Path(upload_dir)
+
+    async def on_startup(app: web.Application) -> None:
+        app["upload_dir"].mkdir(parents=True, exist_ok=True)
+        app["review_semaphore"] = asyncio.Semaphore(max_concurrent_reviews)
+        app["workflow"] = await workflow_factory()
+        logger.info("Review service ready")
+
+    async def on_cleanup(app: web.Application) -> None:
+        workflow = app.get("workflow")
+        if workflow is not None:
+            workflow.close()
+
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    app.router.add_get("/health", handle_health)
+    app.router.add_get("/metrics", handle_metrics)
+    app.router.add_post("/review", handle_review)
+    return app
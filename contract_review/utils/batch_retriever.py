@@ -0,0 +1,93 @@
+from typing import List, Optional, Sequence
+
+import faiss
+import numpy as np
+from llama_index.core import VectorStoreIndex
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.retrievers import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle
+
+from .metrics import RunMetrics
+
+
+class FaissBatchRetriever(BaseRetriever):
+    """Retriever over a FAISS-backed VectorStoreIndex that can answer many queries at once.
+
+    ``abatch_retrieve`` embeds all queries with batched embedding calls and runs a
+    single FAISS matrix search. Scores are similarities (higher is better):
+    ``1 / (1 + distance)`` for L2 indexes and the inner product (cosine
+    similarity for normalized indexes) otherwise.
+    """
+
+    def __init__(
+        self,
+        index: VectorStoreIndex,
+        similarity_top_k: int,
+        embed_model: Optional[BaseEmbedding] = None,
+        metrics: Optional[RunMetrics] = None,
+    ) -> None:
+        """Initialize the retriever.
+
+        Args:
+            index: Vector index whose vector store is a FaissVectorStore
+            similarity_top_k: Number of guideline nodes returned per query
+            embed_model: Embedding model (defaults to the index's model)
+            metrics: Records embedding and FAISS search latency (defaults to a new RunMetrics)
+        """
+        super().__init__()
+        self._index = index
+        self._faiss_index = index.vector_store.client
+        self._inner_product = self._faiss_index.metric_type == faiss.METRIC_INNER_PRODUCT
+        self._embed_model = embed_model or index._embed_model
+        self.similarity_top_k = similarity_top_k
+        self.metrics = metrics or RunMetrics()
+
+    def _search(
+        self, embeddings: Sequence[Sequence[float]], top_k: int
+    ) -> List[List[NodeWithScore]]:
+        """Search FAISS for all query vectors at once and resolve the hits to nodes."""
+        if not embeddings:
+            return []
+        queries = np.asarray(embeddings, dtype="float32")
+        with self.metrics.timer("faiss_search_seconds"):
+            distances, ids = self._faiss_index.search(queries, top_k)
+
+        nodes_dict = self._index.index_struct.nodes_dict
+        docstore = self._index.docstore
+        results = []
+        for row_distances, row_ids in zip(distances, ids):
+            nodes = []
+            for distance, vector_id in zip(row_distances, row_ids):
+                if vector_id < 0:  # FAISS pads with -1 when fewer than top_k vectors exist
+                    continue
+                node = docstore.get_node(nodes_dict[str(vector_id)])
+                score = float(distance) if self._inner_product else 1.0 / (1.0 + float(distance))
+                nodes.append(NodeWithScore(node=node, score=score))
+            results.append(nodes)
+        return results
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        with self.metrics.timer("embedding_seconds", mode="query"):
+            embedding = self._embed_model.get_query_embedding(query_bundle.query_str)
+        self.metrics.increment("embedded_texts")
+        return self._search([embedding], self.similarity_top_k)[0]
+
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        with self.metrics.timer("embedding_seconds", mode="query"):
+            embedding = await self._embed_model.aget_query_embedding(query_bundle.query_str)
+        self.metrics.increment("embedded_texts")
+        return self._search([embedding], self.similarity_top_k)[0]
+
+    async def abatch_retrieve(
+        self, queries: List[str], top_k: Optional[int] = None
+    ) -> List[List[NodeWithScore]]:
+        """Retrieve the top-k guideline nodes for each query, in query order.
+
+        Queries are embedded as texts so they can share batched embedding calls;
+        for models that embed queries and documents identically (e.g. OpenAI)
+        this matches per-query retrieval.
+        """
+        with self.metrics.timer("embedding_seconds", mode="batch"):
+            embeddings = await self._embed_model.aget_text_embedding_batch(queries)
+        self.metrics.increment("embedded_texts", len(queries))
+        return self._search(embeddings, top_k or self.similarity_top_k)
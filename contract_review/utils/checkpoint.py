@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..models.compliance import ClauseComplianceCheck, ComplianceReport
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def text_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of ``text``."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ReviewCheckpoint:
+    """Append-only JSONL checkpoint of one contract's review.
+
+    Each completed clause verdict is appended as soon as it is available, so an
+    interrupted review can resume with only the missing clauses. The final report
+    is recorded with a hash of its inputs so it can be skipped when they are
+    unchanged. Records written with a different model or review context (guideline
+    index, prompts, retrieval settings) are ignored. Clause verdicts only cover an
+    unfinished review: once it completes, only its report is kept, so a later
+    review producing the same verdicts reuses the report summary.
+    """
+
+    def __init__(self, path: Path, model_name: str, context: str = "") -> None:
+        """Open (and load) the checkpoint at ``path``.
+
+        Args:
+            path: JSONL checkpoint file, usually ``<output_dir>/checkpoints/<contract_hash>.jsonl``
+            model_name: Model whose verdicts may be reused
+            context: Hash of everything else a verdict depends on, e.g. the guideline
+                index fingerprint, prompts and retrieval settings
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self.context = context
+        self._clauses: Dict[Tuple[int, str], ClauseComplianceCheck] = {}
+        self._reports: Dict[str, ComplianceReport] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path) as fp:
+            for line_number, line in enumerate(fp, start=1):
+                try:
+                    record = json.loads(line)
+                    if record.get("model") != self.model_name or record.get("context", "") != self.context:
+                        continue
+                    if record["type"] == "clause":
+                        key = (record["index"], record["clause_hash"])
+                        self._clauses[key] = ClauseComplianceCheck.model_validate(record["result"])
+                    elif record["type"] == "report":
+                        self._reports[record["inputs_hash"]] = ComplianceReport.model_validate(
+                            record["report"]
+                        )
+                except (ValueError, KeyError) as e:
+                    # Typically a line truncated by a crash mid-write
+                    logger.warning(f"Skipping invalid checkpoint line {line_number} in {self.path.name}: {str(e)}")
+
+    def _append(self, record: dict, path: Optional[Path] = None) -> None:
+        record["model"] = self.model_name
+        record["context"] = self.context
+        with open(path or self.path, "a") as fp:
+            fp.write(json.dumps(record) + "\n")
+            fp.flush()
+            os.fsync(fp.fileno())
+
+    def get_clause(self, index: int, clause_text: str) -> Optional[ClauseComplianceCheck]:
+        """Return the checkpointed verdict for the clause at ``index``, if its text is unchanged."""
+        return self._clauses.get((index, text_hash(clause_text)))
+
+    def record_clause(self, index: int, clause_text: str, result: ClauseComplianceCheck) -> None:
+        """Append the verdict for the clause at ``index``."""
+        clause_hash = text_hash(clause_text)
+        self._clauses[(index, clause_hash)] = result
+        self._append({
+            "type": "clause",
+            "index": index,
+            "clause_hash": clause_hash,
+            "result": result.model_dump(mode="json"),
+        })
+
+    def get_report(self, inputs_hash: str) -> Optional[ComplianceReport]:
+        """Return the checkpointed report generated from the same inputs, if any."""
+        return self._reports.get(inputs_hash)
+
+    def record_report(self, inputs_hash: str, report: ComplianceReport) -> None:
+        """Append the final report together with the hash of its inputs."""
+        self._reports[inputs_hash] = report
+        self._append(self._report_record(inputs_hash, report))
+
+    @staticmethod
+    def _report_record(inputs_hash: str, report: ComplianceReport) -> dict:
+        return {"type": "report", "inputs_hash": inputs_hash, "report": report.model_dump(mode="json")}
+
+    def complete(self, inputs_hash: Optional[str] = None) -> None:
+        """Drop the clause verdicts once the review has completed, keeping its report.
+
+        Args:
+            inputs_hash: Inputs hash of the completed review's report (the
+                checkpoint is deleted if None or no such report was recorded)
+        """
+        report = self._reports.get(inputs_hash) if inputs_hash is not None else None
+        self._clauses.clear()
+        self._reports.clear()
+        if report is None:
+            self.path.unlink(missing_ok=True)
+            return
+        self._reports[inputs_hash] = report
+        # Rewrite then rename, so a crash never loses the kept report
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.unlink(missing_ok=True)
+        self._append(self._report_record(inputs_hash, report), tmp_path)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,135 @@
+import re
+from collections import Counter
+from typing import Iterable, List, Optional
+
+import tiktoken
+
+from ..models.contract import ContractExtraction, ContractClause
+
+# Lines that start a new contract section: markdown headings, numbered
+# headings ("3.", "3.2", "12)") and ARTICLE/SECTION headings.
+_SECTION_START_RE = re.compile(
+    r"^(?:#{1,6}\s|(?:\d+(?:\.\d+)*[.)]|\d+(?:\.\d+)+)\s+\S|(?:article|section|schedule|annex)\s+\w+)",
+    re.IGNORECASE,
+)
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def get_encoding(model_name: str) -> tiktoken.Encoding:
+    """Return the tiktoken encoding for a model, falling back to cl100k_base."""
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        # Non-OpenAI models (e.g. Ollama) have no tiktoken encoding; cl100k_base
+        # is a close enough approximation for budgeting.
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, encoding: tiktoken.Encoding) -> int:
+    """Count the tokens in ``text``."""
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def is_section_heading(line: str) -> bool:
+    """Return True if ``line`` starts a new contract section."""
+    return bool(_SECTION_START_RE.match(line.strip()))
+
+
+def split_sections(text: str) -> List[str]:
+    """Split a contract into sections at heading lines, keeping headings with their body."""
+    sections: List[List[str]] = [[]]
+    for line in text.splitlines(keepends=True):
+        if is_section_heading(line) and any(l.strip() for l in sections[-1]):
+            sections.append([])
+        sections[-1].append(line)
+    return ["".join(lines) for lines in sections if "".join(lines).strip()]
+
+
+def _split_oversized(section: str, max_tokens: int, encoding: tiktoken.Encoding) -> List[str]:
+    """Split a section larger than ``max_tokens`` at paragraph breaks, then by tokens."""
+    pieces: List[str] = []
+    for paragraph in _PARAGRAPH_BREAK_RE.split(section):
+        if not paragraph.strip():
+            continue
+        tokens = encoding.encode(paragraph, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            pieces.append(paragraph)
+        else:
+            pieces.extend(
+                encoding.decode(tokens[start:start + max_tokens])
+                for start in range(0, len(tokens), max_tokens)
+            )
+    return pieces
+
+
+def split_contract(text: str, max_tokens: int, encoding: tiktoken.Encoding) -> List[str]:
+    """Pack contract sections into chunks of at most ``max_tokens`` tokens.
+
+    Chunks break on section boundaries wherever possible; only sections that
+    are larger than a chunk on their own are split further.
+    """
+    if count_tokens(text, encoding) <= max_tokens:
+        return [text]
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for section in split_sections(text):
+        section_tokens = count_tokens(section, encoding)
+        pieces = (
+            [section] if section_tokens <= max_tokens
+            else _split_oversized(section, max_tokens, encoding)
+        )
+        for piece in pieces:
+            piece_tokens = count_tokens(piece, encoding)
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append("".join(current))
+                current, current_tokens = [], 0
+            current.append(piece if piece.endswith("\n") else piece + "\n")
+            current_tokens += piece_tokens
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+def normalize_clause_text(text: str) -> str:
+    """Normalize clause text for comparison: casefolded with collapsed whitespace."""
+    return _WHITESPACE_RE.sub(" ", text).strip().casefold()
+
+
+def _reconcile(values: Iterable[Optional[str]]) -> Optional[str]:
+    """Pick the most frequent non-empty value, preferring the earliest on ties."""
+    present = [v.strip() for v in values if v and v.strip()]
+    if not present:
+        return None
+    counts = Counter(normalize_clause_text(v) for v in present)
+    best = max(counts.values())
+    return next(v for v in present if counts[normalize_clause_text(v)] == best)
+
+
+def merge_extractions(extractions: List[ContractExtraction]) -> ContractExtraction:
+    """Merge per-chunk extractions into one, in chunk order.
+
+    Vendor, effective date and governing law are reconciled by majority vote
+    across chunks. Chunks do not overlap, so clauses that repeat in different
+    sections are all kept; only a clause extracted both at the end of one chunk
+    and at the start of the next (one clause cut by a chunk boundary) is merged.
+    """
+    clauses: List[ContractClause] = []
+    for extraction in extractions:
+        chunk_clauses = list(extraction.clauses)
+        if (
+            clauses and chunk_clauses
+            and normalize_clause_text(chunk_clauses[0].clause_text)
+            == normalize_clause_text(clauses[-1].clause_text)
+        ):
+            chunk_clauses = chunk_clauses[1:]
+        clauses.extend(chunk_clauses)
+
+    return ContractExtraction(
+        vendor_name=_reconcile(e.vendor_name for e in extractions),
+        effective_date=_reconcile(e.effective_date for e in extractions),
+        governing_law=_reconcile(e.governing_law for e in extractions),
+        clauses=clauses,
+    )
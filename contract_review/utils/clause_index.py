@@ -0,0 +1,267 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..config.model_settings import ModelSettings
+from ..config.settings import (
+    CLAUSE_INDEX_FILENAME,
+    CLAUSE_SHINGLE_WORDS,
+    DEFAULT_CLAUSE_REUSE_THRESHOLD,
+    MINHASH_BANDS,
+    MINHASH_PERMUTATIONS,
+)
+from ..models.compliance import ClauseComplianceCheck, VerdictProvenance
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Negations and modals: changing one can flip a clause's meaning however similar the rest is
+_GUARD_WORDS = frozenset({
+    "no", "not", "never", "without", "unless", "except", "nor", "neither", "may", "shall", "must",
+})
+# Mersenne prime for the universal hash family; keeps products within uint64
+_PRIME = (1 << 31) - 1
+
+
+def normalize_for_reuse(text: str) -> str:
+    """Lowercase words and numbers only, so punctuation and spacing differences are ignored."""
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+def clause_guard(normalized: str) -> str:
+    """Numbers and modal/negation words of a clause, which must match for a verdict to be reused.
+
+    "within 72 hours" and "within 30 days", or "shall" and "shall not", are
+    textually close but can flip the verdict.
+    """
+    words = normalized.split()
+    numbers = sorted(w for w in words if w.isdigit())
+    modals = sorted(w for w in words if w in _GUARD_WORDS)
+    return " ".join(numbers) + "|" + " ".join(modals)
+
+
+def _shingles(normalized: str) -> List[int]:
+    words = normalized.split()
+    if len(words) < CLAUSE_SHINGLE_WORDS:
+        grams = [" ".join(words)]
+    else:
+        grams = [
+            " ".join(words[i:i + CLAUSE_SHINGLE_WORDS])
+            for i in range(len(words) - CLAUSE_SHINGLE_WORDS + 1)
+        ]
+    return sorted({zlib.crc32(gram.encode()) % _PRIME for gram in grams})
+
+
+# Fixed seed: signatures are stored and compared across runs
+_rng = np.random.default_rng(0)
+_A = _rng.integers(1, _PRIME, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+_B = _rng.integers(0, _PRIME, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+
+def minhash_signature(normalized: str) -> np.ndarray:
+    """MinHash signature of the clause's word shingles (MINHASH_PERMUTATIONS uint32 values)."""
+    shingles = np.asarray(_shingles(normalized), dtype=np.uint64)
+    hashes = (_A[:, None] * shingles[None, :] + _B[:, None]) % _PRIME
+    return hashes.min(axis=1).astype(np.uint32)
+
+
+def estimate_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures' shingle sets."""
+    return float(np.mean(a == b))
+
+
+def _band_keys(signature: np.ndarray) -> List[int]:
+    """LSH band hashes: clauses sharing any band are candidate near-duplicates."""
+    rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+    return [
+        int.from_bytes(
+            hashlib.blake2b(signature[band * rows:(band + 1) * rows].tobytes(), digest_size=8).digest(),
+            "big",
+            signed=True,
+        )
+        for band in range(MINHASH_BANDS)
+    ]
+
+
+class ClauseVerdictIndex:
+    """Portfolio-wide index of evaluated clause verdicts for reuse across contracts.
+
+    Standard clauses recur across vendors with small wording differences. A new
+    clause whose normalized text matches a stored one, or whose estimated word
+    shingle similarity (MinHash with LSH banding) reaches ``threshold``, reuses
+    that verdict, tagged with the original clause as ``reused_from``. Numbers
+    and negation/modal words must match exactly. Verdicts are only reused for
+    the model (or cascade) that produced them, under the same review context
+    (guideline index, prompts and retrieval settings).
+    """
+
+    def __init__(self, db_path: Path, threshold: float = DEFAULT_CLAUSE_REUSE_THRESHOLD) -> None:
+        """Open (or create) the index.
+
+        Args:
+            db_path: SQLite database, shared by all runs using the same output directory
+            threshold: Minimum estimated similarity (0-1) for reusing a near-duplicate's verdict
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(clause_verdicts)")]
+        if columns and "context" not in columns:
+            # Verdicts stored without their review context cannot be safely reused
+            logger.warning(f"Clearing clause verdicts stored without a review context in {db_path.name}")
+            self._conn.executescript("DROP TABLE clause_verdicts; DROP TABLE IF EXISTS clause_bands;")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS clause_verdicts ("
+            " id INTEGER PRIMARY KEY, model TEXT NOT NULL, context TEXT NOT NULL, text_hash TEXT NOT NULL,"
+            " guard TEXT NOT NULL, signature BLOB NOT NULL, contract_hash TEXT NOT NULL, contract_path TEXT,"
+            " clause_index INTEGER NOT NULL, result TEXT NOT NULL, created_at REAL NOT NULL,"
+            " UNIQUE (model, context, text_hash));"
+            "CREATE TABLE IF NOT EXISTS clause_bands ("
+            " model TEXT NOT NULL, context TEXT NOT NULL, band INTEGER NOT NULL, bucket INTEGER NOT NULL,"
+            " verdict_id INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS clause_bands_context_lookup ON clause_bands (model, context, band, bucket);"
+        )
+        self._conn.commit()
+
+    def _provenance(self, row: tuple, similarity: float) -> Tuple[ClauseComplianceCheck, VerdictProvenance]:
+        contract_hash, contract_path, clause_index, result = row
+        return (
+            ClauseComplianceCheck.model_validate_json(result),
+            VerdictProvenance(
+                contract_hash=contract_hash,
+                contract_path=contract_path,
+                clause_index=clause_index,
+                similarity=round(similarity, 4),
+            ),
+        )
+
+    def _find(
+        self, model_name: str, context: str, normalized: str
+    ) -> Optional[Tuple[ClauseComplianceCheck, VerdictProvenance]]:
+        text_hash = hashlib.sha256(normalized.encode()).hexdigest()
+        row = self._conn.execute(
+            "SELECT contract_hash, contract_path, clause_index, result FROM clause_verdicts"
+            " WHERE model = ? AND context = ? AND text_hash = ?",
+            (model_name, context, text_hash),
+        ).fetchone()
+        if row is not None:
+            self.exact_hits += 1
+            return self._provenance(row, 1.0)
+
+        signature = minhash_signature(normalized)
+        guard = clause_guard(normalized)
+        candidates = set()
+        for band, bucket in enumerate(_band_keys(signature)):
+            candidates.update(verdict_id for (verdict_id,) in self._conn.execute(
+                "SELECT verdict_id FROM clause_bands WHERE model = ? AND context = ? AND band = ? AND bucket = ?",
+                (model_name, context, band, bucket),
+            ))
+        best, best_similarity = None, self.threshold
+        for verdict_id in candidates:
+            stored_guard, stored_signature, *row = self._conn.execute(
+                "SELECT guard, signature, contract_hash, contract_path, clause_index, result"
+                " FROM clause_verdicts WHERE id = ?",
+                (verdict_id,),
+            ).fetchone()
+            if stored_guard != guard:
+                continue
+            similarity = estimate_similarity(signature, np.frombuffer(stored_signature, dtype=np.uint32))
+            if similarity >= best_similarity:
+                best, best_similarity = tuple(row), similarity
+        if best is None:
+            self.misses += 1
+            return None
+        self.near_hits += 1
+        return self._provenance(best, best_similarity)
+
+    def lookup(self, model_name: str, clause_text: str, context: str = "") -> Optional[ClauseComplianceCheck]:
+        """Return a stored verdict for ``clause_text`` or a near-duplicate, tagged with its provenance.
+
+        Args:
+            model_name: Model (or cascade) judging the clause
+            clause_text: Clause to look up
+            context: Hash of the guideline index, prompts and retrieval settings
+        """
+        with self._lock:
+            found = self._find(model_name, context, normalize_for_reuse(clause_text))
+        if found is None:
+            return None
+        result, provenance = found
+        return result.model_copy(update={"clause_text": clause_text, "reused_from": provenance})
+
+    def add(
+        self,
+        model_name: str,
+        clause_text: str,
+        result: ClauseComplianceCheck,
+        contract_hash: str,
+        clause_index: int,
+        contract_path: Optional[str] = None,
+        context: str = "",
+    ) -> None:
+        """Store an evaluated verdict; the first verdict stored for a normalized text is kept.
+
+        ``context`` is the review context the verdict was judged under (see ``lookup``).
+        """
+        if result.reused_from is not None:
+            return
+        normalized = normalize_for_reuse(clause_text)
+        signature = minhash_signature(normalized)
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO clause_verdicts (model, context, text_hash, guard, signature,"
+                " contract_hash, contract_path, clause_index, result, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    model_name,
+                    context,
+                    hashlib.sha256(normalized.encode()).hexdigest(),
+                    clause_guard(normalized),
+                    signature.tobytes(),
+                    contract_hash,
+                    contract_path,
+                    clause_index,
+                    result.model_dump_json(),
+                    time.time(),
+                ),
+            )
+            if cursor.rowcount:
+                self._conn.executemany(
+                    "INSERT INTO clause_bands (model, context, band, bucket, verdict_id) VALUES (?, ?, ?, ?, ?)",
+                    [(model_name, context, band, bucket, cursor.lastrowid)
+                     for band, bucket in enumerate(_band_keys(signature))],
+                )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """Return exact/near-duplicate hit and miss counters for this process."""
+        return {"exact_hits": self.exact_hits, "near_hits": self.near_hits, "misses": self.misses}
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def create_verdict_index(output_dir: Path) -> Optional[ClauseVerdictIndex]:
+    """Create the portfolio verdict index from the CLAUSE_REUSE settings (None when disabled)."""
+    if not ModelSettings.get_clause_reuse_enabled():
+        return None
+    return ClauseVerdictIndex(
+        Path(output_dir) / CLAUSE_INDEX_FILENAME,
+        threshold=ModelSettings.get_clause_reuse_threshold(),
+    )
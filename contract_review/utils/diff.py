@@ -0,0 +1,212 @@
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from ..models.compliance import (
+    CLAUSE_ERROR_NOTE_PREFIX,
+    ClauseComplianceCheck,
+    ContractReviewResult,
+)
+from ..models.contract import ContractClause, ContractExtraction
+from .chunking import is_section_heading, split_sections
+from .clause_index import clause_guard
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# Section numbering at the start of a heading ("## 3.2", "Article IV"), which is
+# not part of the section's content
+_HEADING_NUMBER_RE = re.compile(
+    r"^\s*#*\s*(?:(?:article|section|schedule|annex)\s+[\w.]+[.:]?|\d+(?:\.\d+)*[.)]?)?",
+    re.IGNORECASE,
+)
+
+# Words a section may contain beyond its heading and unchanged clauses (e.g. a
+# short lead-in) and still count as unchanged
+MAX_RESIDUAL_WORDS = 5
+
+
+def fingerprint_text(text: str) -> str:
+    """Normalize text for alignment: lowercase alphanumeric words separated by single spaces.
+
+    Markdown markup, bullets, punctuation and line breaks are ignored, so a clause
+    matches the contract text it was extracted from.
+    """
+    return " ".join(_NON_ALNUM_RE.sub(" ", text.lower()).split())
+
+
+def clause_fingerprint(text: str) -> str:
+    """Return a stable hash of a clause's normalized text."""
+    return hashlib.sha256(fingerprint_text(text).encode()).hexdigest()
+
+
+def load_previous_review(previous: Union[str, Path, ContractReviewResult]) -> ContractReviewResult:
+    """Load a previous review result, as written by the batch command or the service."""
+    if isinstance(previous, ContractReviewResult):
+        return previous
+    return ContractReviewResult.model_validate_json(Path(previous).read_text())
+
+
+def _locate(doc_fingerprint: str, texts: List[str]) -> List[int]:
+    """Position of each normalized text in the normalized contract, or -1.
+
+    Repeats of a text are matched to its successive occurrences; a repeat
+    beyond the last occurrence is not located.
+    """
+    padded = f" {doc_fingerprint} "
+    next_start: Dict[str, int] = {}
+    positions = []
+    for text in texts:
+        position = padded.find(f" {text} ", next_start.get(text, 0)) if text else -1
+        if position >= 0:
+            next_start[text] = position + 1
+        positions.append(position)
+    return positions
+
+
+def _occurrences(fingerprint: str, text: str) -> int:
+    """Number of times ``text`` occurs as whole words in ``fingerprint``."""
+    return len(re.findall(rf"(?<= ){re.escape(text)}(?= )", f" {fingerprint} "))
+
+
+def _section_changes(
+    doc_text: str, previous_clauses: List[ContractClause]
+) -> List[Tuple[str, int, int, bool]]:
+    """Each section's text, span in the normalized contract and whether it changed.
+
+    A section is unchanged if, after removing its heading and every previous
+    clause it contains, at most MAX_RESIDUAL_WORDS words remain, and neither
+    these words nor the heading (without its numbering) contain a number or a
+    negation/modal word: an edit such as "Vendor shall" to "Vendor shall not",
+    or a changed period in a heading, can flip the clauses that follow.
+    """
+    # Remove longer clauses first so a clause contained in another doesn't split it
+    previous_texts = sorted(
+        {fingerprint_text(c.clause_text) for c in previous_clauses} - {""}, key=len, reverse=True
+    )
+    spans = []
+    start = 0
+    for section in split_sections(doc_text):
+        section_fingerprint = fingerprint_text(section)
+        if not section_fingerprint:
+            continue
+        lines = section.splitlines()
+        heading = ""
+        if lines and is_section_heading(lines[0]):
+            heading = fingerprint_text(_HEADING_NUMBER_RE.sub("", lines[0], count=1))
+            lines = lines[1:]
+        residual = f" {fingerprint_text(' '.join(lines))} "
+        for text in previous_texts:
+            residual = re.sub(rf"(?<= ){re.escape(text)}(?= )", "", residual)
+        residual = " ".join(residual.split())
+        changed = (
+            len(residual.split()) > MAX_RESIDUAL_WORDS
+            or clause_guard(f"{heading} {residual}".strip()) != "|"
+        )
+        end = start + len(section_fingerprint)
+        spans.append((section, start, end, changed))
+        # Sections are normalized separately and joined by single spaces
+        start = end + 1
+    return spans
+
+
+def find_changed_sections(
+    doc_text: str, previous_clauses: List[ContractClause]
+) -> Tuple[List[str], List[ContractClause]]:
+    """Split the new contract into sections and find those that need re-extraction.
+
+    Sections are compared with the previous clauses as described in
+    ``_section_changes``. Only the previous clauses found in unchanged sections
+    are kept, once per occurrence; every clause of a changed section is
+    extracted again, even if its own text did not change.
+
+    Returns:
+        The changed sections (raw text) and the unchanged previous clauses.
+    """
+    clauses_by_text: Dict[str, ContractClause] = {}
+    for clause in previous_clauses:
+        clauses_by_text.setdefault(fingerprint_text(clause.clause_text), clause)
+    clauses_by_text.pop("", None)
+
+    changed, unchanged = [], []
+    for section, _, _, section_changed in _section_changes(doc_text, previous_clauses):
+        if section_changed:
+            changed.append(section)
+            continue
+        section_fingerprint = fingerprint_text(section)
+        for text, clause in clauses_by_text.items():
+            unchanged += [clause] * _occurrences(section_fingerprint, text)
+    return changed, unchanged
+
+
+def order_clauses(doc_text: str, clauses: List[ContractClause]) -> List[ContractClause]:
+    """Order clauses by where they occur in the contract.
+
+    A clause repeated in the contract is kept once per occurrence; a copy beyond
+    its occurrences is a duplicate and is dropped. Clauses that cannot be
+    located at all keep their relative order at the end.
+    """
+    doc_fingerprint = fingerprint_text(doc_text)
+    texts = [fingerprint_text(clause.clause_text) for clause in clauses]
+    positions = _locate(doc_fingerprint, texts)
+    located = {text for text, position in zip(texts, positions) if position >= 0}
+    positioned = []
+    for order, (text, position, clause) in enumerate(zip(texts, positions, clauses)):
+        if position < 0 and text in located:
+            continue
+        positioned.append((position if position >= 0 else len(doc_fingerprint) + 1, order, clause))
+    positioned.sort(key=lambda item: (item[0], item[1]))
+    return [clause for _, _, clause in positioned]
+
+
+def merge_revision(
+    doc_text: str,
+    previous: ContractExtraction,
+    unchanged: List[ContractClause],
+    revised: ContractExtraction,
+) -> ContractExtraction:
+    """Combine unchanged previous clauses with clauses extracted from changed sections."""
+    return ContractExtraction(
+        vendor_name=revised.vendor_name or previous.vendor_name,
+        effective_date=revised.effective_date or previous.effective_date,
+        governing_law=revised.governing_law or previous.governing_law,
+        clauses=order_clauses(doc_text, unchanged + revised.clauses),
+    )
+
+
+def carried_verdicts(
+    doc_text: str, clauses: List[ContractClause], previous: ContractReviewResult
+) -> Dict[int, ClauseComplianceCheck]:
+    """Map clause indices to previous verdicts for unchanged clauses in unchanged sections.
+
+    A clause in a changed section is evaluated again even if its text is the
+    same, since an edited lead-in ("Vendor shall not:") can flip it. Clauses
+    that previously failed to evaluate are not carried forward.
+
+    Args:
+        doc_text: Text of the revised contract
+        clauses: Clauses of the revised contract, in contract order
+        previous: The previous review of the contract
+    """
+    unchanged_spans = [
+        (start, end)
+        for _, start, end, changed in _section_changes(doc_text, previous.contract_extraction.clauses)
+        if not changed
+    ]
+    previous_results = {
+        clause_fingerprint(result.clause_text): result
+        for result in previous.match_results
+        if not (result.notes or "").startswith(CLAUSE_ERROR_NOTE_PREFIX)
+    }
+    texts = [fingerprint_text(clause.clause_text) for clause in clauses]
+    carried = {}
+    for i, (clause, text, position) in enumerate(
+        zip(clauses, texts, _locate(fingerprint_text(doc_text), texts))
+    ):
+        if position < 0 or not any(
+            start <= position and position + len(text) <= end for start, end in unchanged_spans
+        ):
+            continue
+        result = previous_results.get(clause_fingerprint(clause.clause_text))
+        if result is not None:
+            carried[i] = result.model_copy(update={"clause_text": clause.clause_text})
+    return carried
@@ -0,0 +1,267 @@
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from pydantic import PrivateAttr
+
+from ..config.settings import EMBEDDING_CACHE_DB_FILENAME
+from .logger import setup_logger
+from .metrics import RunMetrics
+
+logger = setup_logger(__name__)
+
+# Queries and documents are cached separately: some models embed them differently
+QUERY_KIND = "query"
+TEXT_KIND = "text"
+
+
+def embedding_key(kind: str, text: str) -> str:
+    """Return the content hash identifying ``text`` embedded as a query or a document."""
+    return hashlib.sha256(f"{kind}\0{text}".encode()).hexdigest()
+
+
+def _vectors_file(model_name: str) -> str:
+    return hashlib.sha256(model_name.encode()).hexdigest()[:16] + ".f32"
+
+
+class EmbeddingStore:
+    """On-disk embedding store shared by every run and process using the same directory.
+
+    Vectors are kept as float32 rows appended to one file per model and read
+    through a memory map; a SQLite table maps (model, content hash) to the row.
+    Appends happen inside a SQLite write transaction, so concurrent batch runs
+    and the review service can share the store.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Open (or create) the store.
+
+        Args:
+            cache_dir: Directory holding the SQLite index and the per-model vector files
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / EMBEDDING_CACHE_DB_FILENAME), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS models ("
+            "model TEXT PRIMARY KEY, dimension INTEGER NOT NULL, vectors_file TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, key TEXT NOT NULL, row INTEGER NOT NULL, PRIMARY KEY (model, key))"
+        )
+        self._maps: Dict[str, np.memmap] = {}
+
+    def _model_info(self, model_name: str) -> Optional[tuple]:
+        return self._conn.execute(
+            "SELECT dimension, vectors_file FROM models WHERE model = ?", (model_name,)
+        ).fetchone()
+
+    def _rows(self, model_name: str, vectors_file: str, dimension: int, rows: Sequence[int]) -> np.ndarray:
+        """Read ``rows`` through the model's memory map, remapping when the file has grown."""
+        matrix = self._maps.get(model_name)
+        if matrix is None or max(rows) >= matrix.shape[0]:
+            path = self.cache_dir / vectors_file
+            n_rows = path.stat().st_size // (4 * dimension)
+            matrix = np.memmap(path, dtype="float32", mode="r", shape=(n_rows, dimension))
+            self._maps[model_name] = matrix
+        return np.asarray(matrix[list(rows)])
+
+    def _stored_rows(self, model_name: str, keys: Sequence[str]) -> Dict[str, int]:
+        found: Dict[str, int] = {}
+        unique = list(dict.fromkeys(keys))
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(self._conn.execute(
+                f"SELECT key, row FROM embeddings WHERE model = ? AND key IN ({placeholders})",
+                (model_name, *chunk),
+            ).fetchall())
+        return found
+
+    def get_many(self, model_name: str, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        """Return the stored embedding for each key, or None where it is missing."""
+        with self._lock:
+            info = self._model_info(model_name)
+            found = self._stored_rows(model_name, keys) if info else {}
+            if not found:
+                return [None] * len(keys)
+            dimension, vectors_file = info
+            hit_keys = list(found)
+            vectors = self._rows(model_name, vectors_file, dimension, [found[k] for k in hit_keys])
+            by_key = dict(zip(hit_keys, vectors.tolist()))
+            return [by_key.get(key) for key in keys]
+
+    def put_many(self, model_name: str, keys: Sequence[str], embeddings: Sequence[Sequence[float]]) -> None:
+        """Append the embeddings whose keys are not yet stored for ``model_name``."""
+        if not keys:
+            return
+        vectors = np.asarray(embeddings, dtype="float32")
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock, serializing appends across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                info = self._model_info(model_name)
+                if info is None:
+                    info = (vectors.shape[1], _vectors_file(model_name))
+                    self._conn.execute(
+                        "INSERT INTO models (model, dimension, vectors_file) VALUES (?, ?, ?)",
+                        (model_name, *info),
+                    )
+                dimension, vectors_file = info
+                if vectors.shape[1] != dimension:
+                    logger.warning(
+                        f"Not caching {vectors.shape[1]}-dimensional embeddings of {model_name}, "
+                        f"the store has dimension {dimension}"
+                    )
+                    self._conn.execute("ROLLBACK")
+                    return
+                stored = self._stored_rows(model_name, keys)
+                # One row per distinct new key
+                new = list({key: i for i, key in enumerate(keys) if key not in stored}.values())
+                if new:
+                    row_bytes = 4 * dimension
+                    with open(self.cache_dir / vectors_file, "ab") as fp:
+                        size = fp.seek(0, 2)
+                        if size % row_bytes:
+                            # Drop a row cut off by an interrupted append; it was
+                            # never committed, and would shift every later row
+                            size -= size % row_bytes
+                            fp.truncate(size)
+                        first_row = size // row_bytes
+                        fp.write(vectors[new].tobytes())
+                    self._conn.executemany(
+                        "INSERT INTO embeddings (model, key, row) VALUES (?, ?, ?)",
+                        [(model_name, keys[i], first_row + offset) for offset, i in enumerate(new)],
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def count(self, model_name: Optional[str] = None) -> int:
+        """Return the number of stored embeddings (for one model, or in total)."""
+        with self._lock:
+            if model_name is None:
+                return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE model = ?", (model_name,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        self._maps.clear()
+        self._conn.close()
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embedding model that serves previously seen texts from an EmbeddingStore.
+
+    Wraps any llama_index embedding model (OpenAI, Ollama, ...). Only texts
+    missing from the store are sent to the wrapped model, in one batched call,
+    and their vectors are stored for later runs. The wrapper reports the wrapped
+    model's name, so index fingerprints are unchanged.
+    """
+
+    _embed_model: BaseEmbedding = PrivateAttr()
+    _store: EmbeddingStore = PrivateAttr()
+    _metrics: Optional[RunMetrics] = PrivateAttr(default=None)
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+
+    def __init__(
+        self,
+        embed_model: BaseEmbedding,
+        store: EmbeddingStore,
+        metrics: Optional[RunMetrics] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Wrap ``embed_model``.
+
+        Args:
+            embed_model: Provider embedding model called on cache misses
+            store: Store shared with other runs and processes
+            metrics: Records ``embedding_cache_hits``/``embedding_cache_misses`` if given
+        """
+        kwargs.setdefault("model_name", embed_model.model_name)
+        kwargs.setdefault("embed_batch_size", embed_model.embed_batch_size)
+        super().__init__(**kwargs)
+        self._embed_model = embed_model
+        self._store = store
+        self._metrics = metrics
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit and miss counters for this process."""
+        return {"hits": self._hits, "misses": self._misses}
+
+    def _lookup(self, kind: str, texts: Sequence[str]) -> tuple:
+        keys = [embedding_key(kind, text) for text in texts]
+        cached = self._store.get_many(self.model_name, keys)
+        missing = [i for i, embedding in enumerate(cached) if embedding is None]
+        self._hits += len(texts) - len(missing)
+        self._misses += len(missing)
+        if self._metrics is not None:
+            self._metrics.increment("embedding_cache_hits", len(texts) - len(missing))
+            self._metrics.increment("embedding_cache_misses", len(missing))
+        return keys, cached, missing
+
+    def _fill(
+        self, keys: List[str], cached: List, missing: List[int], embeddings: List[List[float]]
+    ) -> List[List[float]]:
+        for i, embedding in zip(missing, embeddings):
+            cached[i] = embedding
+        self._store.put_many(self.model_name, [keys[i] for i in missing], embeddings)
+        return cached
+
+    def _embed(self, kind: str, texts: Sequence[str]) -> List[List[float]]:
+        keys, cached, missing = self._lookup(kind, texts)
+        if not missing:
+            return cached
+        if kind == QUERY_KIND:
+            embeddings = [self._embed_model.get_query_embedding(texts[i]) for i in missing]
+        else:
+            embeddings = self._embed_model.get_text_embedding_batch([texts[i] for i in missing])
+        return self._fill(keys, cached, missing, embeddings)
+
+    async def _aembed(self, kind: str, texts: Sequence[str]) -> List[List[float]]:
+        # The store's SQLite and file I/O (and waits for another process's write
+        # lock) are kept off the event loop
+        keys, cached, missing = await asyncio.to_thread(self._lookup, kind, texts)
+        if not missing:
+            return cached
+        if kind == QUERY_KIND:
+            embeddings = [await self._embed_model.aget_query_embedding(texts[i]) for i in missing]
+        else:
+            embeddings = await self._embed_model.aget_text_embedding_batch([texts[i] for i in missing])
+        return await asyncio.to_thread(self._fill, keys, cached, missing, embeddings)
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._embed(QUERY_KIND, [query])[0]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return (await self._aembed(QUERY_KIND, [query]))[0]
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._embed(TEXT_KIND, [text])[0]
+
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        return (await self._aembed(TEXT_KIND, [text]))[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(TEXT_KIND, texts)
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return await self._aembed(TEXT_KIND, texts)
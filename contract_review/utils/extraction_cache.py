@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..models.contract import ContractExtraction, CONTRACT_EXTRACTION_SCHEMA_VERSION
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def make_extraction_cache_key(
+    contract_bytes: bytes,
+    prompt: str,
+    model_name: str,
+    chunk_tokens: int,
+    previous_extraction: Optional[ContractExtraction] = None,
+) -> str:
+    """Build a content-addressed key for a contract extraction.
+
+    The key covers the contract bytes, the extraction prompt, the LLM model name,
+    the extraction chunk size and the ``ContractExtraction`` schema, so a change
+    to any of them is a miss. A revision (diff-aware) extraction merges clauses
+    carried from ``previous_extraction``, so it is keyed on that extraction too
+    and never served to a plain review of the same file.
+    """
+    schema = json.dumps(ContractExtraction.model_json_schema(), sort_keys=True)
+    parts = [
+        hashlib.sha256(contract_bytes).hexdigest(),
+        prompt,
+        model_name,
+        str(chunk_tokens),
+        str(CONTRACT_EXTRACTION_SCHEMA_VERSION),
+        schema,
+    ]
+    if previous_extraction is not None:
+        parts.append("revision:" + hashlib.sha256(previous_extraction.model_dump_json().encode()).hexdigest())
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """On-disk cache of contract extractions with LRU and size-based eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int,
+        max_bytes: int,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per cached extraction
+            max_entries: Maximum number of entries kept on disk
+            max_bytes: Maximum total size of the cache in bytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[ContractExtraction]:
+        """Return the cached extraction for ``key``, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            extraction = ContractExtraction.model_validate_json(path.read_text())
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except ValueError as e:
+            logger.warning(f"Discarding invalid extraction cache entry {path.name}: {str(e)}")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        # Touch the entry so eviction treats it as most recently used
+        os.utime(path)
+        self.hits += 1
+        return extraction
+
+    def set(self, key: str, extraction: ContractExtraction) -> None:
+        """Store ``extraction`` under ``key`` and evict old entries if needed."""
+        path = self._entry_path(key)
+        # Unique per writer: batch workers and service requests may store the same key
+        tmp_path = path.with_suffix(f".{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(extraction.model_dump_json())
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache is within its limits."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and eviction counters for this process."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
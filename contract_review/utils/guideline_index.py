@@ -0,0 +1,295 @@
+import hashlib
+import json
+import math
+import shutil
+from pathlib import Path
+from typing import List, Literal, Optional, Sequence
+
+import faiss
+import numpy as np
+from llama_index.core import (
+    Settings,
+    SimpleDirectoryReader,
+    StorageContext,
+    VectorStoreIndex,
+    load_index_from_storage,
+)
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.ingestion import run_transformations
+from llama_index.core.schema import BaseNode, MetadataMode
+from llama_index.vector_stores.faiss import FaissVectorStore
+from pydantic import BaseModel, Field
+
+from ..config.model_settings import ModelSettings
+from ..config.settings import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_GUIDELINE_INDEX_METRIC,
+    DEFAULT_GUIDELINE_INDEX_TYPE,
+    DEFAULT_HNSW_EF_SEARCH,
+    DEFAULT_HNSW_M,
+    DEFAULT_IVF_NPROBE,
+    DEFAULT_PQ_M,
+    DEFAULT_PQ_NBITS,
+    MIN_TRAINING_POINTS_PER_CENTROID,
+)
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+FINGERPRINT_FILE = "fingerprint.json"
+
+
+class GuidelineIndexConfig(BaseModel):
+    """Type, metric and parameters of the guideline FAISS index.
+
+    ``nlist``, ``pq_m``, ``pq_nbits`` and ``hnsw_m`` shape the built index and
+    are part of its fingerprint; ``nprobe`` and ``ef_search`` only trade recall
+    for latency at query time and can change without a rebuild.
+    """
+
+    index_type: Literal["flat", "ivf_flat", "ivf_pq", "hnsw"] = DEFAULT_GUIDELINE_INDEX_TYPE
+    metric: Literal["l2", "ip", "cosine"] = DEFAULT_GUIDELINE_INDEX_METRIC
+    nlist: Optional[int] = Field(default=None, ge=1, description="IVF lists; None chooses ~4*sqrt(vectors)")
+    nprobe: int = Field(default=DEFAULT_IVF_NPROBE, ge=1)
+    pq_m: int = Field(default=DEFAULT_PQ_M, ge=1)
+    pq_nbits: int = Field(default=DEFAULT_PQ_NBITS, ge=1, le=16)
+    hnsw_m: int = Field(default=DEFAULT_HNSW_M, ge=2)
+    ef_search: int = Field(default=DEFAULT_HNSW_EF_SEARCH, ge=1)
+
+    def build_params(self) -> dict:
+        """Parameters that determine the built index (the fingerprinted part of the config)."""
+        return self.model_dump(exclude={"nprobe", "ef_search"})
+
+
+def create_index_config() -> GuidelineIndexConfig:
+    """Build the guideline index config from the GUIDELINE_INDEX_* settings."""
+    return GuidelineIndexConfig(
+        index_type=ModelSettings.get_guideline_index_type(),
+        metric=ModelSettings.get_guideline_index_metric(),
+        nlist=ModelSettings.get_ivf_nlist(),
+        nprobe=ModelSettings.get_ivf_nprobe(),
+        pq_m=ModelSettings.get_pq_m(),
+        hnsw_m=ModelSettings.get_hnsw_m(),
+        ef_search=ModelSettings.get_hnsw_ef_search(),
+    )
+
+
+def _is_hidden(path: Path, root: Path) -> bool:
+    return any(part.startswith(".") for part in path.relative_to(root).parts)
+
+
+def _guideline_files(guidelines_dir: Path) -> List[Path]:
+    """List the guideline files SimpleDirectoryReader would load (recursively, skipping hidden paths)."""
+    return sorted(
+        p for p in guidelines_dir.rglob("*")
+        if p.is_file() and not _is_hidden(p, guidelines_dir)
+    )
+
+
+def compute_index_fingerprint(
+    guidelines_dir: Path,
+    embed_model_name: str,
+    dimension: int,
+    config: Optional[GuidelineIndexConfig] = None,
+) -> str:
+    """Hash the guideline files, embedding model, dimension and index build parameters into a fingerprint."""
+    config = config or GuidelineIndexConfig()
+    digest = hashlib.sha256()
+    digest.update(f"model={embed_model_name}\ndim={dimension}\n".encode())
+    digest.update(json.dumps(config.build_params(), sort_keys=True).encode())
+    for path in _guideline_files(guidelines_dir):
+        digest.update(path.relative_to(guidelines_dir).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _read_fingerprint_record(persist_dir: Path) -> dict:
+    """Return the stored fingerprint record, or an empty dict if none is present."""
+    fingerprint_path = persist_dir / FINGERPRINT_FILE
+    if not fingerprint_path.exists():
+        return {}
+    try:
+        return json.loads(fingerprint_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def read_index_fingerprint(persist_dir: Path) -> Optional[str]:
+    """Return the fingerprint of the guideline index persisted in ``persist_dir``, if any."""
+    return _read_fingerprint_record(Path(persist_dir)).get("fingerprint")
+
+
+def probe_embedding_dimension(embed_model: BaseEmbedding) -> int:
+    """Embed a short text to find the embedding model's output dimension."""
+    return len(embed_model.get_text_embedding("dimension probe"))
+
+
+def _largest_divisor_at_most(n: int, limit: int) -> int:
+    return max(k for k in range(1, min(n, limit) + 1) if n % k == 0)
+
+
+def index_factory_string(config: GuidelineIndexConfig, dimension: int, n_vectors: int) -> str:
+    """Return the FAISS index_factory description for ``config`` and a corpus of ``n_vectors``.
+
+    IVF list counts and PQ codebooks are reduced, or the index type downgraded,
+    when the corpus is too small to train them (fewer than
+    MIN_TRAINING_POINTS_PER_CENTROID vectors per centroid).
+    """
+    index_type = config.index_type
+    nlist = config.nlist or max(1, int(4 * math.sqrt(n_vectors)))
+    nlist = min(nlist, n_vectors // MIN_TRAINING_POINTS_PER_CENTROID)
+    if index_type == "ivf_pq" and n_vectors < MIN_TRAINING_POINTS_PER_CENTROID * 2 ** config.pq_nbits:
+        logger.warning(
+            f"{n_vectors} guideline chunks are too few to train PQ{config.pq_m}x{config.pq_nbits}; using ivf_flat"
+        )
+        index_type = "ivf_flat"
+    if index_type in ("ivf_flat", "ivf_pq") and nlist < 2:
+        logger.warning(f"{n_vectors} guideline chunks are too few to train an IVF index; using flat")
+        index_type = "flat"
+
+    if index_type == "flat":
+        description = "Flat"
+    elif index_type == "ivf_flat":
+        description = f"IVF{nlist},Flat"
+    elif index_type == "ivf_pq":
+        pq_m = _largest_divisor_at_most(dimension, config.pq_m)
+        description = f"IVF{nlist},PQ{pq_m}x{config.pq_nbits}"
+    else:
+        description = f"HNSW{config.hnsw_m}"
+    # Cosine similarity is inner product over L2-normalized vectors
+    return f"L2norm,{description}" if config.metric == "cosine" else description
+
+
+def create_faiss_index(
+    config: GuidelineIndexConfig, vectors: np.ndarray, description: Optional[str] = None
+) -> faiss.Index:
+    """Create, train (if needed) and configure an empty FAISS index for ``vectors``.
+
+    The vectors are only used for training; add them afterwards. ``description``
+    defaults to ``index_factory_string(config, ...)`` for the vectors' shape.
+    """
+    n_vectors, dimension = vectors.shape
+    description = description or index_factory_string(config, dimension, n_vectors)
+    metric = faiss.METRIC_L2 if config.metric == "l2" else faiss.METRIC_INNER_PRODUCT
+    faiss_index = faiss.index_factory(dimension, description, metric)
+    if not faiss_index.is_trained:
+        faiss_index.train(vectors)
+    apply_search_params(faiss_index, config)
+    return faiss_index
+
+
+def _unwrap(faiss_index: faiss.Index) -> faiss.Index:
+    """Return the index inside any IndexPreTransform wrappers (e.g. L2 normalization)."""
+    faiss_index = faiss.downcast_index(faiss_index)
+    while isinstance(faiss_index, faiss.IndexPreTransform):
+        faiss_index = faiss.downcast_index(faiss_index.index)
+    return faiss_index
+
+
+def apply_search_params(faiss_index: faiss.Index, config: GuidelineIndexConfig) -> None:
+    """Set the query-time nprobe (IVF) or efSearch (HNSW) of ``faiss_index``."""
+    inner = _unwrap(faiss_index)
+    if isinstance(inner, faiss.IndexIVF):
+        inner.nprobe = config.nprobe
+    elif isinstance(inner, faiss.IndexHNSW):
+        inner.hnsw.efSearch = config.ef_search
+
+
+def load_guideline_nodes(guidelines_dir: Path) -> List[BaseNode]:
+    """Load every guideline file under ``guidelines_dir`` and split it into chunk nodes."""
+    documents = SimpleDirectoryReader(input_dir=str(guidelines_dir), recursive=True).load_data()
+    return run_transformations(documents, Settings.transformations)
+
+
+def embed_nodes(
+    nodes: Sequence[BaseNode],
+    embed_model: BaseEmbedding,
+    batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+) -> np.ndarray:
+    """Embed ``nodes`` in batches, store each embedding on its node and return them as a float32 matrix."""
+    texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+    embeddings = []
+    for start in range(0, len(texts), batch_size):
+        embeddings.extend(embed_model.get_text_embedding_batch(texts[start:start + batch_size]))
+    for node, embedding in zip(nodes, embeddings):
+        node.embedding = embedding
+    return np.asarray(embeddings, dtype="float32")
+
+
+def load_or_build_guideline_index(
+    guidelines_dir: Path,
+    embed_model: BaseEmbedding,
+    embed_model_name: str,
+    persist_dir: Path,
+    dimension: Optional[int] = None,
+    config: Optional[GuidelineIndexConfig] = None,
+) -> VectorStoreIndex:
+    """Load the persisted guideline index, rebuilding it only when its inputs change.
+
+    Args:
+        guidelines_dir: Directory containing the guideline documents (searched recursively)
+        embed_model: Embedding model used to embed guideline chunks
+        embed_model_name: Name of the embedding model (part of the fingerprint)
+        persist_dir: Directory where the FAISS index and docstore are stored
+        dimension: Embedding dimension; by default taken from the persisted index
+            when it was built with the same model, otherwise probed from the model
+        config: Index type, metric and parameters (defaults to an exact L2 index)
+    """
+    guidelines_dir = Path(guidelines_dir)
+    persist_dir = Path(persist_dir)
+    config = config or GuidelineIndexConfig()
+    stored = _read_fingerprint_record(persist_dir)
+    if dimension is None:
+        if stored.get("embed_model") == embed_model_name and stored.get("dimension"):
+            dimension = stored["dimension"]
+        else:
+            dimension = probe_embedding_dimension(embed_model)
+            logger.info(f"Embedding model {embed_model_name} has dimension {dimension}")
+    fingerprint = compute_index_fingerprint(guidelines_dir, embed_model_name, dimension, config)
+
+    if stored.get("fingerprint") == fingerprint:
+        try:
+            vector_store = FaissVectorStore.from_persist_dir(str(persist_dir))
+            apply_search_params(vector_store.client, config)
+            storage_context = StorageContext.from_defaults(
+                vector_store=vector_store, persist_dir=str(persist_dir)
+            )
+            index = load_index_from_storage(storage_context, embed_model=embed_model)
+            logger.info(f"Loaded {stored.get('factory', 'Flat')} guideline index from {persist_dir}")
+            return index
+        except Exception as e:
+            logger.warning(f"Failed to load guideline index, rebuilding: {str(e)}")
+
+    logger.info(f"Building guideline index from {guidelines_dir}")
+    nodes = load_guideline_nodes(guidelines_dir)
+    vectors = embed_nodes(nodes, embed_model)
+    if vectors.shape[1] != dimension:
+        raise ValueError(
+            f"Embedding model {embed_model_name} returned {vectors.shape[1]}-dimensional vectors, expected {dimension}"
+        )
+
+    # IVF and PQ indexes must be trained before FaissVectorStore adds the vectors
+    factory = index_factory_string(config, dimension, len(vectors))
+    faiss_index = create_faiss_index(config, vectors, factory)
+    logger.info(f"Indexing {len(vectors)} guideline chunks in a {factory} index ({config.metric})")
+    vector_store = FaissVectorStore(faiss_index=faiss_index)
+    storage_context = StorageContext.from_defaults(vector_store=vector_store)
+    # Nodes already carry their embeddings, so the index does not embed them again
+    index = VectorStoreIndex(nodes, storage_context=storage_context, embed_model=embed_model)
+
+    # Write the fingerprint last so a partially persisted index is never reused
+    if persist_dir.exists():
+        shutil.rmtree(persist_dir)
+    persist_dir.mkdir(parents=True, exist_ok=True)
+    index.storage_context.persist(persist_dir=str(persist_dir))
+    (persist_dir / FINGERPRINT_FILE).write_text(json.dumps({
+        "fingerprint": fingerprint,
+        "embed_model": embed_model_name,
+        "dimension": dimension,
+        "factory": factory,
+        "metric": config.metric,
+        "vectors": len(vectors),
+    }))
+
+    return index
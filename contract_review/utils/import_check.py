@@ -0,0 +1,79 @@
+import json
+import re
+import subprocess
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+# "import time:      1234 |      56789 | package.module"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure_import_time(module: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """Import ``module`` in a fresh interpreter and time it with ``-X importtime``.
+
+    Returns:
+        The cumulative import time of ``module`` in seconds and the top-level
+        imports it triggered, as (module, cumulative seconds) sorted slowest first.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr}")
+
+    # Children are printed before their parent, one indentation level (two spaces) deeper
+    total = 0.0
+    imports: Dict[str, float] = {}
+    children: Dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        cumulative = int(match.group(2)) / 1e6
+        depth = len(match.group(3)) // 2
+        name = match.group(4)
+        if depth == 0:
+            if name.split(".")[0] == module.split(".")[0]:
+                total += cumulative
+                imports.update(children)
+            children = {}
+        elif depth == 1:
+            children[name] = cumulative
+    return total, sorted(imports.items(), key=lambda item: item[1], reverse=True)
+
+
+def find_loaded_modules(module: str, candidates: Sequence[str]) -> List[str]:
+    """Return which of ``candidates`` (or their submodules) are loaded by importing ``module``."""
+    code = (
+        f"import json, sys, {module}; "
+        f"print(json.dumps(sorted(sys.modules)))"
+    )
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr}")
+    loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+    return [
+        candidate for candidate in candidates
+        if any(name == candidate or name.startswith(candidate + ".") for name in loaded)
+    ]
+
+
+def check_import_budget(
+    module: str, budget_seconds: float, forbidden: Sequence[str]
+) -> Tuple[float, List[Tuple[str, float]], List[str]]:
+    """Check that ``module`` imports within ``budget_seconds`` without loading ``forbidden`` modules.
+
+    Returns:
+        The import time, the slowest imports and a list of problems (empty if the check passed).
+    """
+    total, imports = measure_import_time(module)
+    problems = []
+    if total > budget_seconds:
+        problems.append(
+            f"import {module} took {total * 1000:.0f} ms (budget {budget_seconds * 1000:.0f} ms)"
+        )
+    for name in find_loaded_modules(module, forbidden):
+        problems.append(f"import {module} loads {name}, which should only be imported when selected")
+    return total, imports, problems
@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+from ..config.settings import DEFAULT_INGESTION_WORKERS, PROCESS_PARSED_SUFFIXES
+from .metrics import RunMetrics
+
+# Bump when the text produced for a document changes, to invalidate parsed files
+PARSED_CACHE_VERSION = 1
+
+
+def _documents_text(documents: Sequence[Any]) -> str:
+    """Join parsed documents (pages, sections) into one text, without file metadata."""
+    from llama_index.core.schema import MetadataMode
+
+    return "\n".join(document.get_content(metadata_mode=MetadataMode.NONE) for document in documents)
+
+
+def _read_local_file(path: str) -> str:
+    """Parse one file with the local readers (in a worker process for PDF/DOCX)."""
+    from llama_index.core import SimpleDirectoryReader
+
+    return _documents_text(SimpleDirectoryReader(input_files=[path]).load_data())
+
+
+class DocumentLoader:
+    """Parse contracts to text with the configured parser, off the event loop, with a cache.
+
+    With a LlamaParse parser, files are parsed with its async ``aload_data``.
+    A SimpleDirectoryReader parser contributes its file extractors and runs in a
+    thread. Without a parser, PDF and DOCX files are parsed in a process pool, so
+    slow parsing neither blocks the event loop nor holds the GIL; cheap text
+    formats are read in a thread. The pool is created on first use and shut
+    down by :meth:`close`.
+
+    Parsed text is cached on disk by file hash and parser, and concurrent
+    requests for the same file share one parse.
+    """
+
+    def __init__(
+        self,
+        parser: Optional[Any] = None,
+        cache_dir: Optional[Path] = None,
+        max_workers: int = DEFAULT_INGESTION_WORKERS,
+        metrics: Optional[RunMetrics] = None,
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            parser: LlamaParse, a SimpleDirectoryReader or any reader with
+                ``load_data(file_path)`` (local readers if None)
+            cache_dir: Directory for parsed text files (no caching if None)
+            max_workers: Processes used for local parsing
+            metrics: Records ``document_read_seconds`` and parse cache hits/misses
+        """
+        self.parser = parser
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self.metrics = metrics or RunMetrics()
+        self._executor: Optional[Executor] = None
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+
+    def _parser_id(self) -> str:
+        if self.parser is None:
+            return "local"
+        # LlamaParse output differs by result type (markdown, text, json)
+        return f"{type(self.parser).__name__}:{getattr(self.parser, 'result_type', '')}"
+
+    def _cache_key(self, file_bytes: bytes) -> str:
+        digest = hashlib.sha256()
+        for part in (hashlib.sha256(file_bytes).hexdigest(), self._parser_id(), str(PARSED_CACHE_VERSION)):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _process_pool(self) -> Executor:
+        if self._executor is None:
+            # Spawned, not forked: the parent runs an event loop and client threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def _parse(self, path: Path) -> str:
+        loop = asyncio.get_running_loop()
+        if self.parser is None:
+            if path.suffix.lower() in PROCESS_PARSED_SUFFIXES:
+                return await loop.run_in_executor(self._process_pool(), _read_local_file, str(path))
+            return await asyncio.to_thread(_read_local_file, str(path))
+        if hasattr(self.parser, "aload_data"):
+            return _documents_text(await self.parser.aload_data(str(path)))
+
+        from llama_index.core import SimpleDirectoryReader
+
+        if isinstance(self.parser, SimpleDirectoryReader):
+            reader = SimpleDirectoryReader(input_files=[str(path)], file_extractor=self.parser.file_extractor)
+            return _documents_text(await asyncio.to_thread(reader.load_data))
+        return _documents_text(await asyncio.to_thread(self.parser.load_data, str(path)))
+
+    async def aload(self, path: Union[str, Path], file_bytes: Optional[bytes] = None) -> str:
+        """Return the text of the file at ``path``, parsing it only if it is not cached.
+
+        Args:
+            path: File to parse
+            file_bytes: The file's contents, if already read
+        """
+        path = Path(path)
+        if file_bytes is None:
+            file_bytes = await asyncio.to_thread(path.read_bytes)
+        key = self._cache_key(file_bytes)
+        cache_path = self.cache_dir / f"{key}.md" if self.cache_dir is not None else None
+        if cache_path is not None and cache_path.exists():
+            self.metrics.increment("parse_cache_hits")
+            return await asyncio.to_thread(cache_path.read_text)
+
+        # Concurrent requests for the same contents wait for one parse
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self.metrics.increment("parse_cache_misses")
+            with self.metrics.timer("document_read_seconds", parser=self._parser_id().split(":")[0]):
+                text = await self._parse(path)
+            if cache_path is not None:
+                # Write then rename, so a crash never leaves a truncated cache entry
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                await asyncio.to_thread(tmp_path.write_text, text)
+                os.replace(tmp_path, cache_path)
+            future.set_result(text)
+            return text
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve the exception so an unawaited future does not log a warning
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
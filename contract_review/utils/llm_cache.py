@@ -0,0 +1,133 @@
+import hashlib
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Type
+
+from llama_index.core.prompts import ChatPromptTemplate
+from pydantic import BaseModel
+
+from ..config.settings import DEFAULT_LLM_CACHE_MAX_ENTRIES, LLM_CACHE_FILENAME
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize pydantic models and other objects found in prompt variables."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    return str(value)
+
+
+def make_llm_cache_key(
+    prompt: ChatPromptTemplate,
+    prompt_args: Dict[str, Any],
+    output_cls: Type[BaseModel],
+    model_name: str,
+) -> str:
+    """Build a cache key from the prompt template, its variables, output class and model."""
+    payload = {
+        "template": [
+            (message.role.value, message.content)
+            for message in prompt.message_templates
+        ],
+        "variables": prompt_args,
+        "output_cls": f"{output_cls.__module__}.{output_cls.__qualname__}",
+        "model": model_name,
+    }
+    serialized = json.dumps(payload, sort_keys=True, default=_json_default)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class BaseLLMCache(ABC):
+    """Cache of validated structured LLM outputs, stored as JSON strings."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        """Return the stored JSON for ``key``, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store the JSON ``value`` under ``key``."""
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored JSON for ``key`` and update hit/miss counters."""
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit and miss counters for this process."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class InMemoryLLMCache(BaseLLMCache):
+    """Process-local LRU cache."""
+
+    def __init__(self, max_entries: int) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+
+    def _get(self, key: str) -> Optional[str]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SQLiteLLMCache(BaseLLMCache):
+    """Persistent cache backed by a SQLite database, shared across runs."""
+
+    def __init__(self, db_path: Path) -> None:
+        super().__init__()
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _get(self, key: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+            (key, value, time.time()),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def create_llm_cache(backend: str, output_dir: Path) -> Optional[BaseLLMCache]:
+    """Create the LLM cache for a backend name: ``memory``, ``sqlite`` or ``none``."""
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemoryLLMCache(max_entries=DEFAULT_LLM_CACHE_MAX_ENTRIES)
+    if backend == "sqlite":
+        return SQLiteLLMCache(Path(output_dir) / LLM_CACHE_FILENAME)
+    raise ValueError(f"Unknown LLM cache backend: {backend}")
@@ -0,0 +1,41 @@
+from llama_index.core.llms import LLM
+
+from ..config.model_settings import LLMProvider, ModelSettings
+
+
+def create_llm(provider: LLMProvider, model_name: str) -> LLM:
+    """Create an LLM client for ``provider`` and ``model_name``.
+
+    Client-side retries are disabled: the workflow retries failed calls itself
+    and feeds 429 responses to its rate limiter, which SDK retries would hide.
+    """
+    if provider == LLMProvider.OPENAI:
+        from llama_index.llms.openai import OpenAI
+        return OpenAI(model=model_name, max_retries=0)
+
+    from llama_index.llms.ollama import Ollama
+    return Ollama(
+        model=model_name,
+        base_url=ModelSettings.get_ollama_base_url(),
+        timeout=300,  # 5 minutes timeout
+        streaming=True,  # Enable streaming
+        request_timeout=300  # 5 minutes timeout for HTTP requests
+    )
+
+
+def get_llm_model_name(llm: LLM) -> str:
+    """Return the model name of an LLM instance, e.g. ``gpt-4`` or ``llama3.2``."""
+    model = getattr(llm, "model", None)
+    if model:
+        return str(model)
+    return llm.metadata.model_name
+
+
+def get_llm_endpoint(llm: LLM) -> str:
+    """Identify the service an LLM calls, e.g. ``OpenAI@https://api.openai.com/v1``.
+
+    Rate limits are per endpoint: a 429 from one provider says nothing about another.
+    """
+    base_url = getattr(llm, "base_url", None) or getattr(llm, "api_base", None)
+    name = type(llm).__name__
+    return f"{name}@{base_url}" if base_url else name
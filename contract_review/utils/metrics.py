@@ -0,0 +1,202 @@
+import functools
+import json
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, Tuple, TypeVar, Union
+
+from ..config.settings import LLM_PRICES_PER_1K_TOKENS
+
+# Recent samples kept per timer for quantiles; count, sum and max cover all samples
+MAX_TIMER_SAMPLES = 1024
+SUMMARY_QUANTILES = (0.5, 0.9, 0.99)
+
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+StepFn = TypeVar("StepFn", bound=Callable[..., Awaitable[Any]])
+
+
+def _key(name: str, labels: Dict[str, Any]) -> MetricKey:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_key(key: MetricKey) -> str:
+    """Render a metric key as ``name{label="value",...}``."""
+    name, labels = key
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+
+def _labels(labels: Tuple[Tuple[str, str], ...], **extra: str) -> str:
+    pairs = list(labels) + sorted(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+def quantile(sorted_samples: list, q: float) -> float:
+    """Nearest-rank quantile of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def estimate_cost(model_name: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimate the USD cost of a call from LLM_PRICES_PER_1K_TOKENS (0 for unknown/local models)."""
+    prices = LLM_PRICES_PER_1K_TOKENS.get(model_name)
+    if prices is None:
+        # Versioned names such as gpt-4o-mini-2024-07-18 use their base model's price
+        matches = [name for name in LLM_PRICES_PER_1K_TOKENS if model_name.startswith(name)]
+        if not matches:
+            return 0.0
+        prices = LLM_PRICES_PER_1K_TOKENS[max(matches, key=len)]
+    prompt_price, completion_price = prices
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000
+
+
+class _Timer:
+    """Latency samples of one timer: all-time count, sum and max, recent samples for quantiles."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=MAX_TIMER_SAMPLES)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        ordered = sorted(self.samples)
+        summary = {
+            "count": self.count,
+            "total_s": round(self.total, 6),
+            "mean_s": round(self.total / self.count, 6) if self.count else 0.0,
+            "max_s": round(self.max, 6),
+        }
+        for q in SUMMARY_QUANTILES:
+            summary[f"p{int(q * 100)}_s"] = round(quantile(ordered, q), 6)
+        return summary
+
+
+class RunMetrics:
+    """Timers and counters for a review run (or, in the service, for its lifetime).
+
+    Metrics have a name and optional labels, e.g. ``timer("step_seconds",
+    step="parse_contract")`` or ``increment("llm_prompt_tokens", 812, model="gpt-4")``.
+    ``summary()`` is sorted by metric key so summaries of different runs can be
+    diffed; ``to_prometheus()`` renders the same metrics in the Prometheus text format.
+    """
+
+    def __init__(self, namespace: str = "contract_review") -> None:
+        """Initialize an empty registry.
+
+        Args:
+            namespace: Prefix of the Prometheus metric names
+        """
+        self.namespace = namespace
+        self.started_at = time.time()
+        self._timers: Dict[MetricKey, _Timer] = {}
+        self._counters: Dict[MetricKey, float] = {}
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """Record one duration for the timer ``name``."""
+        key = _key(name, labels)
+        timer = self._timers.get(key)
+        if timer is None:
+            timer = self._timers[key] = _Timer()
+        timer.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        """Time the enclosed block (including when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Add ``value`` to the counter ``name``."""
+        key = _key(name, labels)
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def record_llm_call(
+        self, model_name: str, seconds: float, prompt_tokens: int, completion_tokens: int
+    ) -> None:
+        """Record the latency, tokens and estimated cost of one successful LLM call."""
+        self.observe("llm_request_seconds", seconds, model=model_name)
+        self.increment("llm_requests", model=model_name)
+        self.increment("llm_prompt_tokens", prompt_tokens, model=model_name)
+        self.increment("llm_completion_tokens", completion_tokens, model=model_name)
+        self.increment(
+            "llm_cost_usd", estimate_cost(model_name, prompt_tokens, completion_tokens), model=model_name
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Return all timers and counters as a JSON-serializable, key-sorted dict."""
+        return {
+            "elapsed_s": round(time.time() - self.started_at, 3),
+            "timers": {
+                _format_key(key): self._timers[key].summary()
+                for key in sorted(self._timers)
+            },
+            "counters": {
+                _format_key(key): round(self._counters[key], 6)
+                for key in sorted(self._counters)
+            },
+        }
+
+    def write_json(self, path: Union[str, Path]) -> None:
+        """Write ``summary()`` to ``path`` as indented, key-sorted JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), indent=2, sort_keys=True))
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Timers become summaries (quantiles over recent samples, all-time sum and
+        count); counters get a ``_total`` suffix.
+        """
+        lines = []
+        typed = set()
+        for key in sorted(self._timers):
+            name, labels = key
+            metric = f"{self.namespace}_{name}"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} summary")
+                typed.add(metric)
+            timer = self._timers[key]
+            ordered = sorted(timer.samples)
+            for q in SUMMARY_QUANTILES:
+                lines.append(f"{metric}{_labels(labels, quantile=str(q))} {quantile(ordered, q)}")
+            lines.append(f"{metric}_sum{_labels(labels)} {timer.total}")
+            lines.append(f"{metric}_count{_labels(labels)} {timer.count}")
+        for key in sorted(self._counters):
+            name, labels = key
+            metric = f"{self.namespace}_{name}_total"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{_labels(labels)} {self._counters[key]}")
+        return "\n".join(lines) + "\n"
+
+
+def timed_step(fn: StepFn) -> StepFn:
+    """Record a workflow step's wall time as ``step_seconds{step=<name>}``.
+
+    Apply below ``@step``; the workflow must expose a RunMetrics as ``self.metrics``.
+    The wrapped signature and annotations are preserved for step validation.
+    """
+    @functools.wraps(fn)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        with self.metrics.timer("step_seconds", step=fn.__name__):
+            return await fn(self, *args, **kwargs)
+    return wrapper
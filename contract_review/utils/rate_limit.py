@@ -0,0 +1,184 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from tenacity import RetryCallState, wait_random_exponential
+from tenacity.wait import wait_base
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _response_headers(exc: BaseException) -> Dict[str, str]:
+    """Return the HTTP response headers attached to a provider exception, if any."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return {}
+    return {str(k).lower(): str(v) for k, v in headers.items()}
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Return True if ``exc`` is a provider rate-limit (HTTP 429) error."""
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status == 429 or "ratelimit" in type(exc).__name__.lower()
+
+
+def get_retry_after(exc: BaseException) -> Optional[float]:
+    """Return the Retry-After delay in seconds advertised by the provider, if any."""
+    headers = _response_headers(exc)
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+class RetryAfterWait(wait_base):
+    """Wait for the provider's Retry-After delay, else jittered exponential backoff."""
+
+    def __init__(self, initial: float, maximum: float) -> None:
+        self.fallback = wait_random_exponential(multiplier=initial, max=maximum)
+        self.maximum = maximum
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = get_retry_after(exc) if exc is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.maximum)
+        return self.fallback(retry_state)
+
+
+class AdaptiveRateLimiter:
+    """Requests- and tokens-per-minute limiter shared by every LLM call.
+
+    Budgets refill continuously as token buckets. On a rate-limit error the
+    limits are halved and all callers pause for the Retry-After delay; each
+    success raises them again towards the ceiling. Ceilings start at the
+    configured budgets and follow the provider's ``x-ratelimit-limit-*``
+    headers whenever an error exposes them.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        recovery_fraction: float = 0.05,
+        min_fraction: float = 0.05,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Initial request budget (and ceiling) per minute
+            tokens_per_minute: Initial token budget (and ceiling) per minute
+            recovery_fraction: Fraction of the ceiling regained after each success
+            min_fraction: Lowest fraction of the ceiling the limits may drop to
+        """
+        self.max_requests_per_minute = float(requests_per_minute)
+        self.max_tokens_per_minute = float(tokens_per_minute)
+        self.requests_per_minute = self.max_requests_per_minute
+        self.tokens_per_minute = self.max_tokens_per_minute
+        self.recovery_fraction = recovery_fraction
+        self.min_fraction = min_fraction
+
+        self._request_budget = self.requests_per_minute
+        self._token_budget = self.tokens_per_minute
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self.rate_limited = 0
+        self.waited_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_budget = min(
+            self.requests_per_minute,
+            self._request_budget + elapsed * self.requests_per_minute / 60,
+        )
+        self._token_budget = min(
+            self.tokens_per_minute,
+            self._token_budget + elapsed * self.tokens_per_minute / 60,
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request costing ``tokens`` tokens fits in both budgets."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                needed = min(float(tokens), self.tokens_per_minute)
+
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._request_budget >= 1 and self._token_budget >= needed:
+                        self._request_budget -= 1
+                        self._token_budget -= needed
+                        return
+                    wait = max(
+                        (1 - self._request_budget) * 60 / self.requests_per_minute,
+                        (needed - self._token_budget) * 60 / self.tokens_per_minute,
+                    )
+
+                self.waited_seconds += wait
+                await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        """Additively raise the limits back towards their ceilings."""
+        self.requests_per_minute = min(
+            self.max_requests_per_minute,
+            self.requests_per_minute + self.max_requests_per_minute * self.recovery_fraction,
+        )
+        self.tokens_per_minute = min(
+            self.max_tokens_per_minute,
+            self.tokens_per_minute + self.max_tokens_per_minute * self.recovery_fraction,
+        )
+
+    def on_rate_limited(self, exc: BaseException) -> None:
+        """Learn from a rate-limit error: adopt advertised limits, back off and pause."""
+        self.rate_limited += 1
+        headers = _response_headers(exc)
+        try:
+            if "x-ratelimit-limit-requests" in headers:
+                self.max_requests_per_minute = float(headers["x-ratelimit-limit-requests"])
+            if "x-ratelimit-limit-tokens" in headers:
+                self.max_tokens_per_minute = float(headers["x-ratelimit-limit-tokens"])
+        except ValueError:
+            pass
+
+        self.requests_per_minute = max(
+            self.max_requests_per_minute * self.min_fraction,
+            min(self.requests_per_minute, self.max_requests_per_minute) / 2,
+        )
+        self.tokens_per_minute = max(
+            self.max_tokens_per_minute * self.min_fraction,
+            min(self.tokens_per_minute, self.max_tokens_per_minute) / 2,
+        )
+
+        # Drain the buckets so queued callers don't immediately re-trigger a 429
+        self._request_budget = 0.0
+        self._token_budget = 0.0
+        retry_after = get_retry_after(exc)
+        if retry_after is not None:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+        logger.warning(
+            f"Rate limited by provider; limits now {self.requests_per_minute:.0f} rpm / "
+            f"{self.tokens_per_minute:.0f} tpm"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current limits and rate-limit counters."""
+        return {
+            "requests_per_minute": round(self.requests_per_minute, 1),
+            "tokens_per_minute": round(self.tokens_per_minute, 1),
+            "rate_limited": self.rate_limited,
+            "waited_seconds": round(self.waited_seconds, 3),
+        }
@@ -0,0 +1,97 @@
+from typing import List, Optional, Sequence
+
+import tiktoken
+
+from ..models.compliance import ClauseComplianceCheck, ComplianceReport
+from .chunking import count_tokens
+
+
+def truncate_tokens(text: str, max_tokens: int, encoding: tiktoken.Encoding) -> str:
+    """Cut ``text`` to at most ``max_tokens`` tokens, marking the cut with an ellipsis."""
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens]).rstrip() + " ..."
+
+
+def format_noncompliant_results(
+    results: List[ClauseComplianceCheck],
+    token_budget: int,
+    field_tokens: int,
+    encoding: tiktoken.Encoding,
+) -> str:
+    """Render non-compliant clause checks compactly for the report prompt.
+
+    Each field is cut to ``field_tokens`` tokens, and entries that would exceed
+    ``token_budget`` are left out and counted in a closing line instead. The
+    first entry is always included.
+    """
+    entries: List[str] = []
+    used = 0
+    for k, result in enumerate(results, start=1):
+        lines = [f"[{k}] Clause: {truncate_tokens(result.clause_text, field_tokens, encoding)}"]
+        if result.matched_guideline:
+            lines.append(
+                f"Guideline: {truncate_tokens(result.matched_guideline.guideline_text, field_tokens, encoding)}"
+            )
+        if result.notes:
+            lines.append(f"Notes: {truncate_tokens(result.notes, field_tokens, encoding)}")
+        entry = "\n".join(lines)
+        tokens = count_tokens(entry, encoding)
+        if entries and used + tokens > token_budget:
+            break
+        entries.append(entry)
+        used += tokens
+
+    omitted = len(results) - len(entries)
+    if omitted:
+        entries.append(f"({omitted} further noncompliant clauses omitted for brevity)")
+    return "\n\n".join(entries)
+
+
+def aggregate_report(
+    vendor_name: Optional[str],
+    match_results: List[ClauseComplianceCheck],
+    sources: Sequence[Optional[str]] = (),
+) -> ComplianceReport:
+    """Build the report fields that follow directly from the clause results.
+
+    The contract is compliant only if every clause is and at least one clause
+    was assessed against the guidelines; clauses skipped by triage (source
+    ``triage``) do not count as assessed. ``summary_notes`` is left for the LLM
+    when there are non-compliant clauses.
+
+    Args:
+        vendor_name: Vendor extracted from the contract
+        match_results: Clause verdicts, in clause order
+        sources: Where each verdict came from (llm, triage, checkpoint, ...)
+    """
+    skipped = sum(1 for source in sources if source == "triage")
+    assessed = len(match_results) - skipped
+    noncompliant = sum(1 for result in match_results if not result.compliant)
+    summary_notes = None
+    if assessed <= 0:
+        summary_notes = (
+            "Not assessed: no clause was checked against the GDPR guidelines "
+            "(no clauses were extracted, or none mention data protection), so "
+            "compliance cannot be confirmed."
+        )
+    elif not noncompliant:
+        summary_notes = (
+            f"All {assessed} assessed clauses are compliant with the GDPR guidelines; "
+            "no changes are required."
+        )
+    if summary_notes is not None and skipped:
+        summary_notes += " " + triage_note(skipped)
+    return ComplianceReport(
+        vendor_name=vendor_name,
+        overall_compliant=assessed > 0 and not noncompliant,
+        summary_notes=summary_notes,
+    )
+
+
+def triage_note(skipped: int) -> str:
+    """Sentence reporting the clauses triage kept away from the compliance check."""
+    if skipped == 1:
+        return "1 further clause without data-protection indicators was not assessed."
+    return f"{skipped} further clauses without data-protection indicators were not assessed."
@@ -0,0 +1,152 @@
+import math
+import re
+from collections import Counter
+from typing import List, Optional, Set
+
+import tiktoken
+from llama_index.core.schema import NodeWithScore
+
+from .chunking import count_tokens
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or shall "
+    "that the their this to was were will with".split()
+)
+
+# BM25 parameters
+_K1 = 1.5
+_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _shingles(tokens: List[str], size: int = 3) -> Set[str]:
+    if len(tokens) < size:
+        return {" ".join(tokens)}
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def dedup_nodes(nodes: List[NodeWithScore], threshold: float = 0.8) -> List[NodeWithScore]:
+    """Drop repeated nodes and chunks that overlap an earlier (better-ranked) chunk."""
+    kept: List[NodeWithScore] = []
+    kept_shingles: List[Set[str]] = []
+    seen_ids = set()
+    for node in nodes:
+        if node.node.node_id in seen_ids:
+            continue
+        shingles = _shingles(tokenize(node.node.get_content()))
+        if any(
+            shingles <= other or other <= shingles or _jaccard(shingles, other) >= threshold
+            for other in kept_shingles
+        ):
+            continue
+        seen_ids.add(node.node.node_id)
+        kept.append(node)
+        kept_shingles.append(shingles)
+    return kept
+
+
+def _bm25_scores(query: List[str], documents: List[List[str]]) -> List[float]:
+    """Score each document against the query with BM25, using the candidates as corpus."""
+    n_docs = len(documents)
+    avg_len = sum(len(d) for d in documents) / n_docs or 1.0
+    doc_freq = Counter(term for doc in documents for term in set(doc))
+    scores = []
+    for doc in documents:
+        term_freq = Counter(doc)
+        score = 0.0
+        for term in set(query):
+            tf = term_freq.get(term, 0)
+            if not tf:
+                continue
+            idf = math.log(1 + (n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+            score += idf * tf * (_K1 + 1) / (tf + _K1 * (1 - _B + _B * len(doc) / avg_len))
+        scores.append(score)
+    return scores
+
+
+def _min_max(values: List[float]) -> List[float]:
+    low, high = min(values), max(values)
+    if high == low:
+        return [1.0] * len(values)
+    return [(v - low) / (high - low) for v in values]
+
+
+def rerank_nodes(
+    clause_text: str,
+    nodes: List[NodeWithScore],
+    top_n: int,
+    lexical_weight: float = 0.5,
+) -> List[NodeWithScore]:
+    """Rerank retrieved guideline nodes for a clause and keep the best ``top_n``.
+
+    Overlapping chunks are removed first. Nodes are ordered by a blend of the
+    min-max normalized retrieval similarity and a min-max normalized BM25 score
+    of the clause against the candidates, weighted by ``lexical_weight``. The
+    blend is relative to the candidates (the best is always near 1.0), so the
+    returned nodes keep their absolute retrieval scores.
+    """
+    candidates = dedup_nodes(nodes)
+    if not candidates:
+        return []
+
+    lexical = _min_max(_bm25_scores(
+        tokenize(clause_text),
+        [tokenize(n.node.get_content()) for n in candidates],
+    ))
+    semantic = _min_max([n.score if n.score is not None else 0.0 for n in candidates])
+    blended = [
+        (lexical_weight * lex + (1 - lexical_weight) * sem, n)
+        for n, lex, sem in zip(candidates, lexical, semantic)
+    ]
+    blended.sort(key=lambda pair: pair[0], reverse=True)
+    return [n for _, n in blended[:top_n]]
+
+
+def select_within_budget(
+    nodes: List[NodeWithScore], token_budget: int, encoding: tiktoken.Encoding
+) -> List[NodeWithScore]:
+    """Keep the best-ranked nodes whose combined text fits in ``token_budget``.
+
+    The best node is always kept so a clause is never evaluated without context.
+    """
+    selected: List[NodeWithScore] = []
+    used = 0
+    for node in nodes:
+        tokens = count_tokens(node.node.get_content(), encoding)
+        if selected and used + tokens > token_budget:
+            continue
+        selected.append(node)
+        used += tokens
+    return selected
+
+
+def format_guidelines(nodes: List[NodeWithScore]) -> str:
+    """Render selected guideline nodes as a numbered list for the match prompt."""
+    return "\n\n".join(
+        f"[{i}] {node.node.get_content().strip()}"
+        for i, node in enumerate(nodes, start=1)
+    )
+
+
+def best_matching_node(
+    guideline_text: Optional[str], nodes: List[NodeWithScore]
+) -> NodeWithScore:
+    """Return the node whose text best matches ``guideline_text`` (the top node by default)."""
+    if not guideline_text:
+        return nodes[0]
+    target = set(tokenize(guideline_text))
+    return max(
+        nodes,
+        key=lambda n: len(target & set(tokenize(n.node.get_content()))),
+    )
@@ -0,0 +1,324 @@
+import csv
+import io
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..config.model_settings import ModelSettings
+from ..config.settings import RESULTS_STORE_FILENAME
+from ..models.compliance import ClauseComplianceCheck, ComplianceReport
+from ..models.contract import ContractClause, ContractExtraction
+
+# Clause flags extracted from the contract, stored as columns for filtering
+CLAUSE_FLAGS = (
+    "mentions_data_processing",
+    "mentions_data_transfer",
+    "requires_consent",
+    "specifies_purpose",
+    "mentions_safeguards",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    id INTEGER PRIMARY KEY,
+    contract_path TEXT,
+    contract_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    vendor_name TEXT,
+    effective_date TEXT,
+    governing_law TEXT,
+    overall_compliant INTEGER NOT NULL,
+    summary_notes TEXT,
+    clause_count INTEGER NOT NULL,
+    non_compliant_count INTEGER NOT NULL,
+    extraction TEXT NOT NULL,
+    report TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+-- Case-insensitive, so vendor prefix filters (LIKE 'acme%') can use it
+DROP INDEX IF EXISTS reviews_vendor;
+CREATE INDEX IF NOT EXISTS reviews_vendor_nocase ON reviews (vendor_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS reviews_compliant ON reviews (overall_compliant);
+CREATE INDEX IF NOT EXISTS reviews_contract ON reviews (contract_hash, created_at);
+
+CREATE TABLE IF NOT EXISTS clause_results (
+    id INTEGER PRIMARY KEY,
+    review_id INTEGER NOT NULL REFERENCES reviews (id) ON DELETE CASCADE,
+    clause_index INTEGER,
+    source TEXT,
+    clause_text TEXT NOT NULL,
+    compliant INTEGER NOT NULL,
+    confidence REAL,
+    notes TEXT,
+    guideline_text TEXT,
+    guideline_score REAL,
+    mentions_data_processing INTEGER,
+    mentions_data_transfer INTEGER,
+    requires_consent INTEGER,
+    specifies_purpose INTEGER,
+    mentions_safeguards INTEGER,
+    reused_from_contract TEXT,
+    result TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS clause_results_review ON clause_results (review_id);
+CREATE INDEX IF NOT EXISTS clause_results_compliant ON clause_results (compliant, review_id);
+CREATE INDEX IF NOT EXISTS clause_results_guideline ON clause_results (guideline_text);
+""" + "".join(
+    # Portfolio queries filter by flag and verdict ("non-compliant data-transfer clauses")
+    f"CREATE INDEX IF NOT EXISTS clause_results_{flag} ON clause_results ({flag}, compliant);\n"
+    for flag in CLAUSE_FLAGS
+)
+
+# Columns returned by query_clauses, in output order
+CLAUSE_COLUMNS = (
+    "review_id", "contract_path", "vendor_name", "clause_index", "source", "compliant",
+    "confidence", "clause_text", "guideline_text", "notes", *CLAUSE_FLAGS, "reused_from_contract",
+    "created_at",
+)
+REVIEW_COLUMNS = (
+    "id", "contract_path", "contract_hash", "model", "vendor_name", "effective_date", "governing_law",
+    "overall_compliant", "clause_count", "non_compliant_count", "summary_notes", "created_at",
+)
+
+
+def _like_prefix(prefix: str) -> str:
+    """LIKE pattern matching values starting with ``prefix`` (escaped with a backslash)."""
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def _select_column(table: str, column: str) -> str:
+    """Select expression for a query column; timestamps are rendered as UTC ISO dates."""
+    if column == "created_at":
+        return f"datetime({table}.created_at, 'unixepoch') AS created_at"
+    return f"{table}.{column}"
+
+
+class ResultsStore:
+    """SQLite store of every review: its extraction, clause verdicts and report.
+
+    Each completed review is one row in ``reviews`` and one row per clause in
+    ``clause_results``, with the clause flags, verdict, matched guideline and
+    provenance as indexed columns, so portfolio questions ("non-compliant
+    data-transfer clauses across vendors") are answered without rerunning
+    reviews. Reviewing a contract again adds a new review; queries use the
+    latest review of each contract unless ``all_runs`` is set.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Open (or create) the store.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def record_review(
+        self,
+        contract_hash: str,
+        model_name: str,
+        extraction: ContractExtraction,
+        match_results: Sequence[ClauseComplianceCheck],
+        report: ComplianceReport,
+        contract_path: Optional[str] = None,
+        clause_indexes: Optional[Sequence[int]] = None,
+        sources: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Store one completed review and return its id.
+
+        Args:
+            contract_hash: SHA-256 of the contract file
+            model_name: Model (or cascade) that judged the clauses
+            extraction: Contract extraction the clauses came from
+            match_results: Clause verdicts, in clause order
+            report: Final compliance report
+            contract_path: Path of the reviewed contract
+            clause_indexes: Clause index of each verdict (defaults to its position)
+            sources: Where each verdict came from (llm, triage, checkpoint, ...)
+        """
+        clause_indexes = list(clause_indexes) if clause_indexes else list(range(len(match_results)))
+        sources = list(sources) if sources else [None] * len(match_results)
+        clauses: Dict[int, ContractClause] = dict(enumerate(extraction.clauses))
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO reviews (contract_path, contract_hash, model, vendor_name, effective_date,"
+                " governing_law, overall_compliant, summary_notes, clause_count, non_compliant_count,"
+                " extraction, report, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    contract_path,
+                    contract_hash,
+                    model_name,
+                    report.vendor_name or extraction.vendor_name,
+                    extraction.effective_date,
+                    extraction.governing_law,
+                    int(report.overall_compliant),
+                    report.summary_notes,
+                    len(match_results),
+                    sum(1 for result in match_results if not result.compliant),
+                    extraction.model_dump_json(),
+                    report.model_dump_json(),
+                    time.time(),
+                ),
+            )
+            review_id = cursor.lastrowid
+            rows = []
+            for index, source, result in zip(clause_indexes, sources, match_results):
+                clause = clauses.get(index)
+                guideline = result.matched_guideline
+                rows.append((
+                    review_id,
+                    index,
+                    source,
+                    result.clause_text,
+                    int(result.compliant),
+                    result.confidence,
+                    result.notes,
+                    guideline.guideline_text if guideline else None,
+                    guideline.similarity_score if guideline else None,
+                    *(int(getattr(clause, flag)) if clause is not None else None for flag in CLAUSE_FLAGS),
+                    result.reused_from.contract_hash if result.reused_from else None,
+                    result.model_dump_json(),
+                ))
+            columns = (
+                "review_id", "clause_index", "source", "clause_text", "compliant", "confidence", "notes",
+                "guideline_text", "guideline_score", *CLAUSE_FLAGS, "reused_from_contract", "result",
+            )
+            self._conn.executemany(
+                f"INSERT INTO clause_results ({', '.join(columns)})"
+                f" VALUES ({', '.join('?' * len(columns))})",
+                rows,
+            )
+            self._conn.commit()
+        return review_id
+
+    def _latest_filter(self, all_runs: bool) -> str:
+        if all_runs:
+            return ""
+        return (
+            " AND r.id = (SELECT MAX(latest.id) FROM reviews latest"
+            " WHERE latest.contract_hash = r.contract_hash)"
+        )
+
+    def query_reviews(
+        self,
+        vendor: Optional[str] = None,
+        compliant: Optional[bool] = None,
+        all_runs: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return reviews, newest first, optionally filtered by vendor name prefix and compliance.
+
+        The vendor prefix is case-insensitive and served by the vendor index.
+        """
+        columns = ", ".join(_select_column("r", c) for c in REVIEW_COLUMNS)
+        sql = f"SELECT {columns} FROM reviews r WHERE 1 = 1"
+        params: List[Any] = []
+        if vendor:
+            sql += " AND r.vendor_name LIKE ? ESCAPE '\\'"
+            params.append(_like_prefix(vendor))
+        if compliant is not None:
+            sql += " AND r.overall_compliant = ?"
+            params.append(int(compliant))
+        sql += self._latest_filter(all_runs) + " ORDER BY r.id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def query_clauses(
+        self,
+        vendor: Optional[str] = None,
+        compliant: Optional[bool] = None,
+        flags: Sequence[str] = (),
+        guideline: Optional[str] = None,
+        text: Optional[str] = None,
+        all_runs: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return clause verdicts across reviews.
+
+        Args:
+            vendor: Vendor name prefix (case-insensitive, served by an index)
+            compliant: Only compliant (True) or non-compliant (False) clauses
+            flags: Clause flags that must all be set, e.g. ``("mentions_data_transfer",)``
+            guideline: Matched guideline text prefix (case-sensitive, served by an index)
+            text: Clause text substring (scans the clauses left by the other filters)
+            all_runs: Include clauses of superseded reviews of the same contract
+            limit: Maximum number of rows
+        """
+        unknown = set(flags) - set(CLAUSE_FLAGS)
+        if unknown:
+            raise ValueError(f"Unknown clause flags: {', '.join(sorted(unknown))}")
+        columns = ", ".join(
+            _select_column("r" if c in ("contract_path", "vendor_name", "created_at") else "c", c)
+            for c in CLAUSE_COLUMNS
+        )
+        sql = f"SELECT {columns} FROM clause_results c JOIN reviews r ON r.id = c.review_id WHERE 1 = 1"
+        params: List[Any] = []
+        if vendor:
+            sql += " AND r.vendor_name LIKE ? ESCAPE '\\'"
+            params.append(_like_prefix(vendor))
+        if compliant is not None:
+            sql += " AND c.compliant = ?"
+            params.append(int(compliant))
+        for flag in flags:
+            sql += f" AND c.{flag} = 1"
+        if guideline:
+            # A range over the guideline index, which a LIKE pattern cannot use
+            sql += " AND c.guideline_text >= ? AND c.guideline_text < ?"
+            params += [guideline, guideline + "\U0010ffff"]
+        if text:
+            sql += " AND c.clause_text LIKE ?"
+            params.append(f"%{text}%")
+        sql += self._latest_filter(all_runs) + " ORDER BY r.vendor_name, c.review_id, c.clause_index"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def format_rows(rows: List[Dict[str, Any]], fmt: str) -> str:
+    """Render query rows as ``json`` (a list), ``ndjson``, ``csv`` or a plain-text ``table``."""
+    if fmt == "json":
+        return json.dumps(rows, indent=2)
+    if fmt == "ndjson":
+        return "".join(json.dumps(row) + "\n" for row in rows)
+    if not rows:
+        return ""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue()
+    if fmt == "table":
+        def cell(value: Any) -> str:
+            text = "" if value is None else str(value)
+            return text if len(text) <= 60 else text[:57] + "..."
+        table = [list(rows[0])] + [[cell(v) for v in row.values()] for row in rows]
+        widths = [max(len(r[i]) for r in table) for i in range(len(table[0]))]
+        return "\n".join("  ".join(c.ljust(w) for c, w in zip(r, widths)).rstrip() for r in table) + "\n"
+    raise ValueError(f"Unknown format: {fmt}")
+
+
+def create_results_store(output_dir: Path) -> Optional[ResultsStore]:
+    """Open the results store under ``output_dir`` (None when RESULTS_STORE is disabled)."""
+    if not ModelSettings.get_results_store_enabled():
+        return None
+    return ResultsStore(Path(output_dir) / RESULTS_STORE_FILENAME)
@@ -0,0 +1,97 @@
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+from llama_index.core.llms import LLM
+
+from ..config.model_settings import ModelSettings
+from ..config.settings import DEFAULT_CASCADE_MIN_CONFIDENCE
+from ..models.compliance import ClauseComplianceCheck
+from ..models.contract import ContractClause
+from ..utils.llm_utils import create_llm, get_llm_model_name
+
+
+def flags_suggest_risk(clause: ContractClause) -> bool:
+    """Return True if the extracted flags point to a data-protection gap.
+
+    Personal data that is processed or transferred without any safeguards, or
+    transferred without a stated purpose, is a likely compliance issue.
+    """
+    handles_data = clause.mentions_data_processing or clause.mentions_data_transfer
+    if handles_data and not clause.mentions_safeguards:
+        return True
+    return clause.mentions_data_transfer and not clause.specifies_purpose
+
+
+class ModelCascade:
+    """Tiered clause evaluation: cheap models first, the strongest model last.
+
+    Every clause is judged by the first tier. A verdict is escalated to the next
+    tier when it is non-compliant, its confidence is missing or below
+    ``min_confidence``, or it is compliant although the clause's extracted flags
+    suggest a data-protection gap. The last tier's verdict is always final.
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[LLM],
+        min_confidence: float = DEFAULT_CASCADE_MIN_CONFIDENCE,
+    ) -> None:
+        """Initialize the cascade.
+
+        Args:
+            tiers: LLMs ordered from cheapest to strongest
+            min_confidence: Confidence below which a verdict is escalated
+        """
+        if not tiers:
+            raise ValueError("A model cascade needs at least one tier")
+        self.tiers: List[LLM] = list(tiers)
+        self.tier_names = [get_llm_model_name(llm) for llm in self.tiers]
+        self.min_confidence = min_confidence
+        self.handled: Counter = Counter()
+        self.escalations: Counter = Counter()
+
+    def is_last(self, tier: int) -> bool:
+        return tier == len(self.tiers) - 1
+
+    def escalation_reason(
+        self, clause: ContractClause, result: ClauseComplianceCheck
+    ) -> Optional[str]:
+        """Return why ``result`` should go to the next tier, or None to accept it."""
+        if not result.compliant:
+            return "non-compliant"
+        if result.confidence is None or result.confidence < self.min_confidence:
+            return "low confidence"
+        if flags_suggest_risk(clause):
+            return "disagrees with flags"
+        return None
+
+    def accept(self, tier: int, clause: ContractClause, result: ClauseComplianceCheck) -> bool:
+        """Decide whether ``tier``'s verdict is final, counting the outcome."""
+        reason = None if self.is_last(tier) else self.escalation_reason(clause, result)
+        if reason is None:
+            self.handled[self.tier_names[tier]] += 1
+            return True
+        self.escalations[reason] += 1
+        return False
+
+    def record_escalation(self, reason: str) -> None:
+        """Count an escalation decided outside ``accept`` (e.g. a failed call)."""
+        self.escalations[reason] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return clauses handled per tier and escalations per reason."""
+        return {
+            "handled": {name: self.handled[name] for name in self.tier_names},
+            "escalations": dict(self.escalations),
+        }
+
+
+def create_model_cascade() -> Optional[ModelCascade]:
+    """Build the cascade configured by ``LLM_CASCADE``, or None if it is not set."""
+    tiers = ModelSettings.get_llm_cascade()
+    if not tiers:
+        return None
+    return ModelCascade(
+        [create_llm(provider, model_name) for provider, model_name in tiers],
+        min_confidence=ModelSettings.get_cascade_min_confidence(),
+    )
@@ -1,57 +1,179 @@
 from pathlib import Path
+import hashlib
 import json
 import os
-from typing import Optional, List, Union
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, List, Type, Union
 import asyncio
 
-from llama_index.indices.managed.llama_cloud import LlamaCloudIndex
-from llama_index.llms.openai import OpenAI
 from llama_index.core.workflow import Context, Workflow, step, StopEvent, StartEvent
 from llama_index.core.llms import LLM
 from llama_index.core import SimpleDirectoryReader
 from llama_index.core.retrievers import BaseRetriever
 from llama_index.core.prompts import ChatPromptTemplate
-from llama_index.core.schema import Document, MetadataMode
-from llama_parse import LlamaParse
+from llama_index.core.schema import NodeWithScore
+import tiktoken
+from pydantic import BaseModel
+from tenacity import AsyncRetrying, stop_after_attempt
 
 from ..models.events import (
     ContractExtractionEvent,
-    MatchGuidelineEvent,
     MatchGuidelineResultEvent,
     GenerateReportEvent,
     LogEvent,
 )
-from ..models.compliance import ComplianceReport, ClauseComplianceCheck
-from ..models.contract import ContractExtraction
+from ..models.compliance import (
+    CLAUSE_ERROR_NOTE_PREFIX,
+    ComplianceSummary,
+    ClauseComplianceBatch,
+    ClauseComplianceCheck,
+    ContractReviewResult,
+    GuidelineMatch,
+)
+from ..models.contract import ContractExtraction, ContractClause
 from ..prompts.templates import (
     CONTRACT_EXTRACT_PROMPT,
     CONTRACT_MATCH_PROMPT,
+    CONTRACT_BATCH_MATCH_PROMPT,
     COMPLIANCE_REPORT_SYSTEM_PROMPT,
     COMPLIANCE_REPORT_USER_PROMPT,
 )
+from .cascade import ModelCascade
+from .triage import ClauseTriage, create_clause_triage
+from ..utils.batch_retriever import FaissBatchRetriever
+from ..utils.chunking import (
+    count_tokens,
+    get_encoding,
+    merge_extractions,
+    normalize_clause_text,
+    split_contract,
+)
+from ..utils.checkpoint import ReviewCheckpoint, text_hash
+from ..utils.clause_index import ClauseVerdictIndex
+from ..utils.diff import (
+    carried_verdicts,
+    find_changed_sections,
+    load_previous_review,
+    merge_revision,
+)
+from ..utils.extraction_cache import ExtractionCache, make_extraction_cache_key
+from ..utils.ingestion import DocumentLoader
+from ..utils.llm_cache import BaseLLMCache, make_llm_cache_key
+from ..utils.llm_utils import create_llm, get_llm_endpoint, get_llm_model_name
 from ..utils.logger import logger
-from ..config.settings import DEFAULT_OUTPUT_DIR, DEFAULT_SIMILARITY_TOP_K
+from ..utils.metrics import RunMetrics, timed_step
+from ..utils.rerank import (
+    best_matching_node,
+    format_guidelines,
+    rerank_nodes,
+    select_within_budget,
+)
+from ..utils.report import aggregate_report, format_noncompliant_results, triage_note
+from ..utils.results_store import ResultsStore
+from ..utils.rate_limit import AdaptiveRateLimiter, RetryAfterWait, is_rate_limit_error
+from ..config.settings import (
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_SIMILARITY_TOP_K,
+    DEFAULT_RERANK_TOP_N,
+    DEFAULT_GUIDELINE_TOKEN_BUDGET,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_EVAL_BATCH_SIZE,
+    DEFAULT_EVAL_BATCH_TOKEN_BUDGET,
+    DEFAULT_EXTRACTION_CHUNK_TOKENS,
+    DEFAULT_REPORT_TOKEN_BUDGET,
+    DEFAULT_REPORT_FIELD_TOKENS,
+    DEFAULT_EXTRACTION_CACHE_MAX_ENTRIES,
+    DEFAULT_EXTRACTION_CACHE_MAX_BYTES,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_BACKOFF_INITIAL,
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_COMPLETION_TOKEN_ESTIMATE,
+    CHECKPOINT_DIRNAME,
+    PARSED_CACHE_DIRNAME,
+)
+from ..config.model_settings import LLMProvider, ModelSettings
+
+if TYPE_CHECKING:
+    # Only for annotations: LlamaParse is imported by the cloud entry point that uses it
+    from llama_parse import LlamaParse
 
 class ContractReviewWorkflow(Workflow):
     """Contract review workflow for GDPR compliance checking."""
 
     def __init__(
         self,
-        parser: Optional[Union[LlamaParse, SimpleDirectoryReader]] = None,
+        parser: Optional[Union["LlamaParse", SimpleDirectoryReader]] = None,
         guideline_retriever: Optional[BaseRetriever] = None,
         llm: Optional[LLM] = None,
         similarity_top_k: int = DEFAULT_SIMILARITY_TOP_K,
+        rerank_top_n: int = DEFAULT_RERANK_TOP_N,
+        guideline_token_budget: int = DEFAULT_GUIDELINE_TOKEN_BUDGET,
         output_dir: str = DEFAULT_OUTPUT_DIR,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        batch_evaluation: bool = False,
+        eval_batch_size: int = DEFAULT_EVAL_BATCH_SIZE,
+        eval_batch_token_budget: int = DEFAULT_EVAL_BATCH_TOKEN_BUDGET,
+        extraction_chunk_tokens: int = DEFAULT_EXTRACTION_CHUNK_TOKENS,
+        report_token_budget: int = DEFAULT_REPORT_TOKEN_BUDGET,
+        extraction_cache: Optional[ExtractionCache] = None,
+        llm_cache: Optional[BaseLLMCache] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        clause_triage: Optional[ClauseTriage] = None,
+        checkpointing: bool = True,
+        cascade: Optional[ModelCascade] = None,
+        metrics: Optional[RunMetrics] = None,
+        verdict_index: Optional[ClauseVerdictIndex] = None,
+        results_store: Optional[ResultsStore] = None,
+        document_loader: Optional[DocumentLoader] = None,
+        guideline_fingerprint: Optional[str] = None,
         **kwargs,
     ) -> None:
         """Initialize the workflow.
         
         Args:
             parser: Document parser (LlamaParse or SimpleDirectoryReader)
-            guideline_retriever: Retriever for GDPR guidelines
+            guideline_retriever: Retriever for GDPR guidelines (a FaissBatchRetriever
+                retrieves all clauses in one batch)
             llm: Language model instance (defaults to OpenAI GPT-4)
-            similarity_top_k: Number of similar guidelines to retrieve
+            similarity_top_k: Number of similar guidelines to retrieve per clause
+            rerank_top_n: Number of guidelines kept per clause after reranking
+            guideline_token_budget: Maximum guideline tokens sent with each clause
             output_dir: Directory for workflow outputs
+            max_concurrency: Maximum number of clauses evaluated concurrently
+            batch_evaluation: Evaluate clauses that share guidelines in multi-clause
+                LLM calls, falling back to per-clause calls on invalid output
+            eval_batch_size: Maximum clauses per multi-clause call
+            eval_batch_token_budget: Maximum clause and guideline tokens per
+                multi-clause call
+            extraction_chunk_tokens: Maximum contract tokens sent per extraction call
+            report_token_budget: Maximum non-compliant clause tokens sent for the
+                report summary
+            extraction_cache: Cache of contract extractions (defaults to an
+                on-disk cache under the output directory)
+            llm_cache: Cache of structured LLM responses (disabled if None)
+            rate_limiter: Rate limiter shared by all calls to the main LLM's endpoint
+                (defaults to one using the configured requests/tokens per minute);
+                cascade tiers on other endpoints get their own with the same budgets
+            max_retries: Maximum attempts per LLM call
+            clause_triage: Prefilter deciding which clauses need an LLM check
+                (defaults to the CLAUSE_TRIAGE settings; use
+                ClauseTriage(enabled=False) to check every clause)
+            checkpointing: Append each clause verdict and the report to a per-contract
+                JSONL checkpoint so interrupted reviews resume where they stopped
+            cascade: Evaluate clauses with cheaper models first, escalating uncertain
+                verdicts (defaults to evaluating every clause with ``llm``)
+            metrics: Timers and counters for steps, LLM calls, retrieval and caches
+                (defaults to a new RunMetrics)
+            verdict_index: Portfolio index of evaluated verdicts; clauses that (nearly)
+                match a clause of an earlier contract reuse its verdict (disabled if None)
+            results_store: Store receiving every completed review for portfolio
+                queries (disabled if None)
+            document_loader: Parses contracts with ``parser`` off the event loop
+                (defaults to one caching parsed text under the output directory)
+            guideline_fingerprint: Identifies the guideline corpus behind the retriever
+                (e.g. the local index fingerprint); checkpointed and portfolio verdicts
+                judged against another corpus are not reused
             **kwargs: Additional workflow parameters
         """
         super().__init__(**kwargs)
@@ -60,9 +182,19 @@ class ContractReviewWorkflow(Workflow):
         if guideline_retriever is None:
             raise ValueError("guideline_retriever must be provided")
         self.guideline_retriever = guideline_retriever
-        self.llm = llm or OpenAI(model="gpt-4")
+        # The OpenAI client is only imported when no LLM is given
+        self.llm = llm or create_llm(LLMProvider.OPENAI, "gpt-4")
         self.similarity_top_k = similarity_top_k
-        self.vendor_name = None  # Will be set during contract parsing
+        self.rerank_top_n = rerank_top_n
+        self.guideline_token_budget = guideline_token_budget
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.batch_evaluation = batch_evaluation
+        self.eval_batch_size = eval_batch_size
+        self.eval_batch_token_budget = eval_batch_token_budget
+        self.extraction_chunk_tokens = extraction_chunk_tokens
+        self.report_token_budget = report_token_budget
 
         # Create output directory if it doesn't exist
         out_path = Path(output_dir) / "workflow_output"
@@ -70,57 +202,261 @@ class ContractReviewWorkflow(Workflow):
         os.chmod(str(out_path), 0o0777)
         self.output_dir = out_path
 
+        self.extraction_cache = extraction_cache or ExtractionCache(
+            out_path / "extraction_cache",
+            max_entries=DEFAULT_EXTRACTION_CACHE_MAX_ENTRIES,
+            max_bytes=DEFAULT_EXTRACTION_CACHE_MAX_BYTES,
+        )
+        self.llm_cache = llm_cache
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(
+            requests_per_minute=ModelSettings.get_requests_per_minute(),
+            tokens_per_minute=ModelSettings.get_tokens_per_minute(),
+        )
+        self.max_retries = max_retries
+        self.clause_triage = clause_triage or create_clause_triage()
+        self.checkpointing = checkpointing
+        self.cascade = cascade
+        self.metrics = metrics or RunMetrics()
+        self.verdict_index = verdict_index
+        self.results_store = results_store
+        self.document_loader = document_loader or DocumentLoader(
+            parser=parser,
+            cache_dir=out_path / PARSED_CACHE_DIRNAME,
+            max_workers=ModelSettings.get_ingestion_workers(),
+            metrics=self.metrics,
+        )
+        self._encoding = get_encoding(get_llm_model_name(self.llm))
+        # Cascade tiers may use other providers: each endpoint adapts to its own
+        # 429s, and each model's tokens are counted with its own encoding
+        self._rate_limiters: Dict[str, AdaptiveRateLimiter] = {get_llm_endpoint(self.llm): self.rate_limiter}
+        self._encodings: Dict[str, tiktoken.Encoding] = {get_llm_model_name(self.llm): self._encoding}
+        self.guideline_fingerprint = guideline_fingerprint
+        self.review_context = self._review_context()
+
+    def close(self) -> None:
+        """Shut down the document loader's parsing processes.
+
+        Call once the workflow is no longer used; a process that exits with the
+        pool still running waits on its workers.
+        """
+        self.document_loader.close()
+
+    def _rate_limiter_for(self, llm: LLM) -> AdaptiveRateLimiter:
+        """Return the rate limiter of ``llm``'s endpoint, creating it on first use."""
+        endpoint = get_llm_endpoint(llm)
+        if endpoint not in self._rate_limiters:
+            self._rate_limiters[endpoint] = AdaptiveRateLimiter(
+                requests_per_minute=self.rate_limiter.max_requests_per_minute,
+                tokens_per_minute=self.rate_limiter.max_tokens_per_minute,
+            )
+        return self._rate_limiters[endpoint]
+
+    def _encoding_for(self, model_name: str) -> tiktoken.Encoding:
+        """Return the token encoding of ``model_name``."""
+        if model_name not in self._encodings:
+            self._encodings[model_name] = get_encoding(model_name)
+        return self._encodings[model_name]
+
+    def _rate_limiter_stats(self) -> Dict[str, Any]:
+        """Return rate limiter stats, per endpoint when several are in use."""
+        if len(self._rate_limiters) == 1:
+            return self.rate_limiter.stats()
+        return {endpoint: limiter.stats() for endpoint, limiter in self._rate_limiters.items()}
+
+    async def _astructured_predict(
+        self,
+        output_cls: Type[BaseModel],
+        prompt: ChatPromptTemplate,
+        llm: Optional[LLM] = None,
+        **prompt_args: Any,
+    ) -> BaseModel:
+        """Run a rate-limited, retried structured LLM call, serving repeats from the LLM cache.
+
+        The call goes to ``llm`` if given (e.g. a cascade tier), else the workflow's LLM.
+        """
+        llm = llm or self.llm
+        model_name = get_llm_model_name(llm)
+        rate_limiter = self._rate_limiter_for(llm)
+        encoding = self._encoding_for(model_name)
+        cache_key = None
+        if self.llm_cache is not None:
+            cache_key = make_llm_cache_key(
+                prompt, prompt_args, output_cls, model_name
+            )
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                try:
+                    result = output_cls.model_validate_json(cached)
+                    self.metrics.increment("llm_cache_hits", model=model_name)
+                    return result
+                except ValueError as e:
+                    logger.warning(f"Ignoring invalid LLM cache entry: {str(e)}")
+            self.metrics.increment("llm_cache_misses", model=model_name)
+
+        # Every call goes through its endpoint's rate limiter, with jittered
+        # exponential backoff (or the provider's Retry-After) between attempts
+        prompt_tokens = count_tokens(prompt.format(**prompt_args), encoding)
+        estimated_tokens = prompt_tokens + DEFAULT_COMPLETION_TOKEN_ESTIMATE
+
+        def before_sleep(state) -> None:
+            self.metrics.increment("llm_retries", model=model_name)
+            logger.warning(
+                f"Retry {state.attempt_number}/{self.max_retries} for "
+                f"{output_cls.__name__}: {state.outcome.exception()}"
+            )
+
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries),
+            wait=RetryAfterWait(DEFAULT_BACKOFF_INITIAL, DEFAULT_BACKOFF_MAX),
+            before_sleep=before_sleep,
+            reraise=True,
+        )
+        async for attempt in retrying:
+            with attempt:
+                with self.metrics.timer("rate_limit_wait_seconds"):
+                    await rate_limiter.acquire(estimated_tokens)
+                start = time.perf_counter()
+                try:
+                    result = await llm.astructured_predict(output_cls, prompt, **prompt_args)
+                except Exception as e:
+                    self.metrics.increment("llm_errors", model=model_name)
+                    if is_rate_limit_error(e):
+                        self.metrics.increment("llm_rate_limited", model=model_name)
+                        rate_limiter.on_rate_limited(e)
+                    raise
+                rate_limiter.on_success()
+                if not isinstance(result, output_cls):
+                    self.metrics.increment("llm_errors", model=model_name)
+                    raise ValueError(f"Invalid {output_cls.__name__} result: {result}")
+                # Token counts are tiktoken estimates: the structured-output API
+                # doesn't expose the provider's usage
+                self.metrics.record_llm_call(
+                    model_name,
+                    time.perf_counter() - start,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=count_tokens(result.model_dump_json(), encoding),
+                )
+
+        if cache_key is not None:
+            self.llm_cache.set(cache_key, result.model_dump_json())
+        return result
+
     @step
+    @timed_step
     async def parse_contract(
         self, ctx: Context, ev: StartEvent
     ) -> ContractExtractionEvent:
         """Parse and extract information from the contract."""
-        contract_extraction_path = Path(f"{self.output_dir}/contract_extraction.json")
-        
-        if contract_extraction_path.exists():
+        contract_path = Path(ev.contract_path)
+        contract_bytes = await asyncio.to_thread(contract_path.read_bytes)
+        previous_review = ev.get("previous_review")
+        if previous_review is not None:
+            previous_review = load_previous_review(previous_review)
+        cache_key = make_extraction_cache_key(
+            contract_bytes,
+            CONTRACT_EXTRACT_PROMPT,
+            get_llm_model_name(self.llm),
+            self.extraction_chunk_tokens,
+            previous_extraction=previous_review.contract_extraction if previous_review is not None else None,
+        )
+        contract_extraction = self.extraction_cache.get(cache_key)
+        doc_contents = None
+
+        if contract_extraction is not None:
+            self.metrics.increment("extraction_cache_hits")
             if self._verbose:
                 ctx.write_event_to_stream(LogEvent(msg=">> Loading contract from cache"))
-            contract_extraction_dict = json.load(open(contract_extraction_path))
-            contract_extraction = ContractExtraction.model_validate(contract_extraction_dict)
         else:
+            self.metrics.increment("extraction_cache_misses")
             if self._verbose:
                 ctx.write_event_to_stream(LogEvent(msg=">> Reading contract"))
 
-            # Create reader with the contract directory
-            reader = SimpleDirectoryReader(input_dir=str(Path(ev.contract_path).parent))
-            docs = reader.load_data()
-            
-            doc_contents = "\n".join([
-                d.get_content(metadata_mode=MetadataMode.ALL) 
-                for d in docs
-            ])
-            
-            prompt = ChatPromptTemplate.from_messages([
-                ("user", CONTRACT_EXTRACT_PROMPT)
-            ])
-            contract_extraction = await self.llm.astructured_predict(
-                ContractExtraction,
-                prompt,
-                contract_data=doc_contents
-            )
-            
-            if not isinstance(contract_extraction, ContractExtraction):
-                raise ValueError(f"Invalid extraction from contract: {contract_extraction}")
-                
-            with open(contract_extraction_path, "w") as fp:
-                fp.write(contract_extraction.model_dump_json())
-                
+            # Only the target contract is parsed, and only on an extraction cache miss
+            doc_contents = await self.document_loader.aload(contract_path, contract_bytes)
+
+            if previous_review is not None:
+                contract_extraction = await self._revise_extraction(
+                    ctx, doc_contents, previous_review
+                )
+            else:
+                contract_extraction = await self._extract_contract(ctx, doc_contents)
+
+            self.extraction_cache.set(cache_key, contract_extraction)
+
         if self._verbose:
+            ctx.write_event_to_stream(
+                LogEvent(msg=f">> Extraction cache stats: {self.extraction_cache.stats()}")
+            )
             ctx.write_event_to_stream(
                 LogEvent(msg=f">> Contract data: {contract_extraction.model_dump()}")
             )
 
-        # Set vendor name from contract extraction
-        self.vendor_name = contract_extraction.vendor_name
+        # Carry forward verdicts for clauses unchanged since the previous review
+        carried_results = {}
+        if previous_review is not None:
+            if doc_contents is None:
+                # Served from the parsed-text cache after a cached extraction
+                doc_contents = await self.document_loader.aload(contract_path, contract_bytes)
+            carried_results = carried_verdicts(doc_contents, contract_extraction.clauses, previous_review)
+            if self._verbose:
+                ctx.write_event_to_stream(
+                    LogEvent(msg=f">> Carrying forward {len(carried_results)} of "
+                                 f"{len(contract_extraction.clauses)} clause verdicts from previous review")
+                )
+
+        return ContractExtractionEvent(
+            contract_extraction=contract_extraction,
+            contract_hash=hashlib.sha256(contract_bytes).hexdigest(),
+            contract_path=str(contract_path),
+            carried_results=carried_results,
+        )
+
+    async def _revise_extraction(
+        self, ctx: Context, doc_contents: str, previous_review: ContractReviewResult
+    ) -> ContractExtraction:
+        """Extract only the sections that changed since the previous review."""
+        changed, unchanged = find_changed_sections(
+            doc_contents, previous_review.contract_extraction.clauses
+        )
+        if self._verbose:
+            ctx.write_event_to_stream(
+                LogEvent(msg=f">> Revision: {len(changed)} changed sections, "
+                             f"{len(unchanged)} unchanged clauses")
+            )
+        if changed:
+            revised = await self._extract_contract(ctx, "\n".join(changed))
+        else:
+            revised = ContractExtraction(clauses=[])
+        return merge_revision(
+            doc_contents, previous_review.contract_extraction, unchanged, revised
+        )
 
-        return ContractExtractionEvent(contract_extraction=contract_extraction)
+    async def _extract_contract(self, ctx: Context, doc_contents: str) -> ContractExtraction:
+        """Extract the contract in section-aligned chunks concurrently and merge the results."""
+        chunks = split_contract(doc_contents, self.extraction_chunk_tokens, self._encoding)
+        if self._verbose and len(chunks) > 1:
+            ctx.write_event_to_stream(
+                LogEvent(msg=f">> Extracting contract in {len(chunks)} chunks")
+            )
+
+        prompt = ChatPromptTemplate.from_messages([
+            ("user", CONTRACT_EXTRACT_PROMPT)
+        ])
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def extract_chunk(chunk: str) -> ContractExtraction:
+            async with semaphore:
+                return await self._astructured_predict(
+                    ContractExtraction,
+                    prompt,
+                    contract_data=chunk
+                )
+
+        extractions = await asyncio.gather(*[extract_chunk(chunk) for chunk in chunks])
+        return merge_extractions(extractions)
 
     @step
+    @timed_step
     async def match_guidelines(
         self, ctx: Context, ev: ContractExtractionEvent
     ) -> GenerateReportEvent:
@@ -128,99 +464,552 @@ class ContractReviewWorkflow(Workflow):
         if self._verbose:
             ctx.write_event_to_stream(LogEvent(msg=">> Matching clauses against guidelines"))
 
-        match_results = []
-        for clause in ev.contract_extraction.clauses:
-            try:
-                # Get relevant guidelines for this clause
-                relevant_docs = await self.guideline_retriever.aretrieve(
-                    clause.clause_text
+        # Triage: clauses without data-protection indicators get a deterministic
+        # verdict and never reach retrieval or the LLM
+        clauses = ev.contract_extraction.clauses
+        results: List[Optional[ClauseComplianceCheck]] = [None] * len(clauses)
+        sources: List[Optional[str]] = [None] * len(clauses)
+        relevant = []
+
+        def emit(i: int, result: ClauseComplianceCheck, source: str) -> None:
+            """Stream a clause verdict to consumers as soon as it is final."""
+            results[i] = result
+            sources[i] = source
+            ctx.write_event_to_stream(
+                MatchGuidelineResultEvent(clause_index=i, result=result, source=source)
+            )
+
+        # Clauses unchanged since a previous review keep their earlier verdicts
+        for i, result in sorted(ev.carried_results.items()):
+            emit(i, result, "previous_review")
+
+        for i, clause in enumerate(clauses):
+            if i in ev.carried_results:
+                continue
+            if self.clause_triage.is_relevant(clause):
+                relevant.append(i)
+            else:
+                emit(i, self.clause_triage.verdict(clause), "triage")
+
+        skipped = len(clauses) - len(ev.carried_results) - len(relevant)
+        logger.info(f"Triage skipped {skipped} of {len(clauses)} clauses")
+        self.metrics.increment("triage_llm_calls_saved", skipped)
+        if self._verbose:
+            ctx.write_event_to_stream(
+                LogEvent(msg=f">> Triage: {skipped} of {len(clauses)} clauses have no "
+                             f"data-protection indicators ({skipped} LLM calls saved)")
+            )
+
+        # Resume: reuse verdicts checkpointed by an earlier, interrupted run
+        checkpoint = self._open_checkpoint(ev.contract_hash)
+        pending = []
+        for i in relevant:
+            resumed = checkpoint.get_clause(i, clauses[i].clause_text) if checkpoint else None
+            if resumed is not None:
+                emit(i, resumed, "checkpoint")
+            else:
+                pending.append(i)
+        if self._verbose and len(pending) < len(relevant):
+            ctx.write_event_to_stream(
+                LogEvent(msg=f">> Resumed {len(relevant) - len(pending)} clause results from checkpoint")
+            )
+
+        # Portfolio reuse: clauses that (nearly) match a clause evaluated for an
+        # earlier contract reuse its verdict
+        model_name = self._evaluation_model_name()
+        if self.verdict_index is not None and pending:
+            remaining = []
+            for i in pending:
+                reused = self.verdict_index.lookup(model_name, clauses[i].clause_text, self.review_context)
+                if reused is not None:
+                    kind = "exact" if reused.reused_from.similarity == 1.0 else "near"
+                    self.metrics.increment("clause_reuse_hits", kind=kind)
+                    emit(i, reused, "portfolio")
+                else:
+                    remaining.append(i)
+            if self._verbose:
+                ctx.write_event_to_stream(
+                    LogEvent(msg=f">> Reused {len(pending) - len(remaining)} clause verdicts from earlier "
+                                 f"contracts ({len(pending) - len(remaining)} LLM calls saved)")
                 )
-                
-                # Get the most relevant guideline
-                if relevant_docs:
-                    matched_guideline = relevant_docs[0]
-                    
-                    # Evaluate compliance with retry logic
-                    max_retries = 3
-                    retry_count = 0
-                    while retry_count < max_retries:
-                        try:
-                            prompt = ChatPromptTemplate.from_messages([
-                                ("user", CONTRACT_MATCH_PROMPT)
-                            ])
-                            
-                            result = await self.llm.astructured_predict(
-                                ClauseComplianceCheck,
-                                prompt,
-                                clause_text=clause.clause_text,
-                                guideline_text=matched_guideline.text
-                            )
-                            
-                            if not isinstance(result, ClauseComplianceCheck):
-                                raise ValueError(f"Invalid compliance check result: {result}")
-                                
-                            match_results.append(result)
-                            
-                            if self._verbose:
-                                ctx.write_event_to_stream(
-                                    LogEvent(msg=f">> Clause matched: {result.model_dump()}")
-                                )
-                            break  # Success, exit retry loop
-                            
-                        except Exception as e:
-                            retry_count += 1
-                            if retry_count == max_retries:
-                                raise  # Re-raise the last exception if all retries failed
-                            if self._verbose:
-                                ctx.write_event_to_stream(
-                                    LogEvent(msg=f">> Retry {retry_count}/{max_retries} for clause: {str(e)}")
-                                )
-                            await asyncio.sleep(1)  # Wait before retrying
-                            
+            pending = remaining
+
+        def record(i: int, result: ClauseComplianceCheck, failed: bool = False) -> None:
+            """Stream, checkpoint and index an evaluated verdict as soon as it is available.
+
+            Failures are not recorded so a rerun retries them.
+            """
+            emit(i, result, "error" if failed else "llm")
+            if failed:
+                return
+            if checkpoint is not None:
+                checkpoint.record_clause(i, clauses[i].clause_text, result)
+            if self.verdict_index is not None:
+                self.verdict_index.add(
+                    model_name, clauses[i].clause_text, result,
+                    contract_hash=ev.contract_hash, clause_index=i, contract_path=ev.contract_path,
+                    context=self.review_context,
+                )
+
+        # Retrieve guidelines for all pending clauses in one batch when the
+        # retriever supports it; otherwise each clause retrieves on its own
+        retrieved: Dict[int, List[NodeWithScore]] = {}
+        if pending and isinstance(self.guideline_retriever, FaissBatchRetriever):
+            try:
+                with self.metrics.timer("retrieval_seconds", mode="batch"):
+                    batch = await self.guideline_retriever.abatch_retrieve(
+                        [clauses[i].clause_text for i in pending],
+                        top_k=self.similarity_top_k,
+                    )
+                retrieved = dict(zip(pending, batch))
             except Exception as e:
-                if self._verbose:
-                    ctx.write_event_to_stream(
-                        LogEvent(msg=f">> Error processing clause: {str(e)}")
+                logger.warning(f"Batched retrieval failed, retrieving per clause: {str(e)}")
+
+        # Fan the pending clauses out concurrently, bounded by max_concurrency.
+        # Verdicts are stored by clause index, so results stay in clause order
+        # even though they are streamed in completion order.
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self.batch_evaluation:
+            await self._match_clauses_batched(
+                ctx,
+                [clauses[i] for i in pending],
+                [retrieved.get(i) for i in pending],
+                semaphore,
+                on_result=lambda j, result, failed: record(pending[j], result, failed),
+            )
+        else:
+            async def match(i: int) -> None:
+                try:
+                    result = await self._match_clause(ctx, clauses[i], semaphore, retrieved.get(i))
+                except Exception as e:
+                    record(i, self._failed_result(ctx, clauses[i], e), failed=True)
+                    return
+                if result is not None:
+                    record(i, result)
+
+            await asyncio.gather(*[match(i) for i in pending])
+        evaluated = [i for i, result in enumerate(results) if result is not None]
+
+        return GenerateReportEvent(
+            contract_extraction=ev.contract_extraction,
+            contract_hash=ev.contract_hash,
+            match_results=[results[i] for i in evaluated],
+            contract_path=ev.contract_path,
+            clause_indexes=evaluated,
+            sources=[sources[i] for i in evaluated],
+        )
+
+    def _review_context(self) -> str:
+        """Hash of what a clause verdict depends on besides the clause text and the model."""
+        return text_hash(json.dumps({
+            "guidelines": self.guideline_fingerprint,
+            "prompts": [CONTRACT_MATCH_PROMPT, CONTRACT_BATCH_MATCH_PROMPT],
+            "similarity_top_k": self.similarity_top_k,
+            "rerank_top_n": self.rerank_top_n,
+            "guideline_token_budget": self.guideline_token_budget,
+            "batch_evaluation": self.batch_evaluation,
+            "cascade_min_confidence": self.cascade.min_confidence if self.cascade else None,
+        }, sort_keys=True))
+
+    def _open_checkpoint(self, contract_hash: str) -> Optional[ReviewCheckpoint]:
+        """Open the checkpoint for a contract, or None when checkpointing is disabled."""
+        if not self.checkpointing:
+            return None
+        return ReviewCheckpoint(
+            self.output_dir / CHECKPOINT_DIRNAME / f"{contract_hash}.jsonl",
+            model_name=self._evaluation_model_name(),
+            context=self.review_context,
+        )
+
+    def _evaluation_model_name(self) -> str:
+        """Name of the model(s) judging clauses; verdicts are only reused for the same name."""
+        if self.cascade is not None:
+            return "+".join(self.cascade.tier_names)
+        return get_llm_model_name(self.llm)
+
+    def _select_guidelines(
+        self, clause_text: str, relevant_docs: List[NodeWithScore]
+    ) -> List[NodeWithScore]:
+        """Rerank retrieved guideline nodes and keep the best within the token budget."""
+        with self.metrics.timer("rerank_seconds"):
+            ranked = rerank_nodes(
+                clause_text, relevant_docs[:self.similarity_top_k], top_n=self.rerank_top_n
+            )
+            return select_within_budget(ranked, self.guideline_token_budget, self._encoding)
+
+    def _with_guideline_score(
+        self, result: ClauseComplianceCheck, guidelines: List[NodeWithScore]
+    ) -> ClauseComplianceCheck:
+        """Fill matched_guideline with the retrieval similarity of the guideline the verdict rests on."""
+        chosen = result.matched_guideline
+        node = best_matching_node(chosen.guideline_text if chosen else None, guidelines)
+        matched = GuidelineMatch(
+            guideline_text=chosen.guideline_text if chosen else node.node.get_content(),
+            similarity_score=round(node.score, 4) if node.score is not None else 0.0,
+            relevance_explanation=chosen.relevance_explanation if chosen else None,
+        )
+        return result.model_copy(update={"matched_guideline": matched})
+
+    async def _clause_guidelines(
+        self, clause: ContractClause, relevant_docs: Optional[List[NodeWithScore]]
+    ) -> List[NodeWithScore]:
+        """Retrieve guidelines for a clause (unless already retrieved) and select the best."""
+        if relevant_docs is None:
+            with self.metrics.timer("retrieval_seconds", mode="single"):
+                relevant_docs = await self.guideline_retriever.aretrieve(clause.clause_text)
+        return self._select_guidelines(clause.clause_text, relevant_docs)
+
+    async def _evaluate_clause(
+        self,
+        ctx: Context,
+        clause: ContractClause,
+        guidelines: List[NodeWithScore],
+        start_tier: int = 0,
+    ) -> ClauseComplianceCheck:
+        """Evaluate one clause against its selected guidelines.
+
+        Without a cascade this is a single LLM call. With one, the clause goes
+        through the tiers from ``start_tier`` until a verdict is accepted.
+        """
+        # Retries and backoff happen in _astructured_predict
+        prompt = ChatPromptTemplate.from_messages([
+            ("user", CONTRACT_MATCH_PROMPT)
+        ])
+        prompt_args = dict(
+            clause_text=clause.clause_text,
+            guideline_text=format_guidelines(guidelines)
+        )
+
+        if self.cascade is None:
+            result = await self._astructured_predict(ClauseComplianceCheck, prompt, **prompt_args)
+        else:
+            for tier in range(start_tier, len(self.cascade.tiers)):
+                try:
+                    result = await self._astructured_predict(
+                        ClauseComplianceCheck, prompt, llm=self.cascade.tiers[tier], **prompt_args
+                    )
+                except Exception as e:
+                    if self.cascade.is_last(tier):
+                        raise
+                    logger.warning(
+                        f"Cascade tier {self.cascade.tier_names[tier]} failed, escalating: {str(e)}"
+                    )
+                    self.cascade.record_escalation("error")
+                    continue
+                if self.cascade.accept(tier, clause, result):
+                    break
+        result = self._with_guideline_score(result, guidelines)
+
+        if self._verbose:
+            ctx.write_event_to_stream(
+                LogEvent(msg=f">> Clause matched: {result.model_dump()}")
+            )
+        return result
+
+    def _failed_result(
+        self, ctx: Context, clause: ContractClause, error: Exception
+    ) -> ClauseComplianceCheck:
+        """Create a non-compliant result for a clause that could not be processed."""
+        if self._verbose:
+            ctx.write_event_to_stream(
+                LogEvent(msg=f">> Error processing clause: {str(error)}")
+            )
+        return ClauseComplianceCheck(
+            clause_text=clause.clause_text,
+            matched_guideline=None,
+            compliant=False,
+            notes=f"{CLAUSE_ERROR_NOTE_PREFIX}: {str(error)}"
+        )
+
+    async def _match_clause(
+        self,
+        ctx: Context,
+        clause: ContractClause,
+        semaphore: asyncio.Semaphore,
+        relevant_docs: Optional[List[NodeWithScore]] = None,
+    ) -> Optional[ClauseComplianceCheck]:
+        """Evaluate a single clause, retrieving its guidelines unless already retrieved."""
+        async with semaphore:
+            guidelines = await self._clause_guidelines(clause, relevant_docs)
+            if not guidelines:
+                return None
+            return await self._evaluate_clause(ctx, clause, guidelines)
+
+    def _plan_batches(
+        self, clauses: List[ContractClause], guidelines: List[List[NodeWithScore]]
+    ) -> List[List[int]]:
+        """Group clauses that share their top guideline into token-budgeted batches."""
+        groups: Dict[str, List[int]] = {}
+        for j, clause_guidelines in enumerate(guidelines):
+            if clause_guidelines:
+                groups.setdefault(clause_guidelines[0].node.node_id, []).append(j)
+
+        def cost(j: int, known_node_ids: set) -> int:
+            """Tokens clause j adds to a batch already holding ``known_node_ids``."""
+            return count_tokens(clauses[j].clause_text, self._encoding) + sum(
+                count_tokens(n.node.get_content(), self._encoding)
+                for n in guidelines[j] if n.node.node_id not in known_node_ids
+            )
+
+        batches: List[List[int]] = []
+        for members in groups.values():
+            batch: List[int] = []
+            batch_node_ids: set = set()
+            batch_tokens = 0
+            for j in members:
+                tokens = cost(j, batch_node_ids)
+                if batch and (
+                    len(batch) >= self.eval_batch_size
+                    or batch_tokens + tokens > self.eval_batch_token_budget
+                ):
+                    batches.append(batch)
+                    batch, batch_node_ids, batch_tokens = [], set(), 0
+                    tokens = cost(j, batch_node_ids)
+                batch.append(j)
+                batch_node_ids.update(n.node.node_id for n in guidelines[j])
+                batch_tokens += tokens
+            if batch:
+                batches.append(batch)
+        return batches
+
+    async def _evaluate_batch(
+        self,
+        ctx: Context,
+        clauses: List[ContractClause],
+        guidelines: List[List[NodeWithScore]],
+    ) -> List[Optional[ClauseComplianceCheck]]:
+        """Evaluate several clauses in one LLM call against their shared guidelines.
+
+        Returns one entry per clause; None marks a clause the model did not return
+        a usable result for.
+        """
+        shared: Dict[str, NodeWithScore] = {}
+        for clause_guidelines in guidelines:
+            for node in clause_guidelines:
+                current = shared.get(node.node.node_id)
+                if current is None or node.score > current.score:
+                    shared[node.node.node_id] = node
+        shared_guidelines = sorted(shared.values(), key=lambda n: n.score, reverse=True)
+
+        prompt = ChatPromptTemplate.from_messages([
+            ("user", CONTRACT_BATCH_MATCH_PROMPT)
+        ])
+        # With a cascade, multi-clause calls go to the cheapest tier
+        batch = await self._astructured_predict(
+            ClauseComplianceBatch,
+            prompt,
+            llm=self.cascade.tiers[0] if self.cascade is not None else None,
+            clauses="\n\n".join(
+                f"[{k}] {clause.clause_text}" for k, clause in enumerate(clauses, start=1)
+            ),
+            guideline_text=format_guidelines(shared_guidelines),
+        )
+
+        returned = {
+            normalize_clause_text(result.clause_text): result for result in batch.results
+        }
+        results: List[Optional[ClauseComplianceCheck]] = []
+        for clause, clause_guidelines in zip(clauses, guidelines):
+            result = returned.get(normalize_clause_text(clause.clause_text))
+            if result is None:
+                results.append(None)
+                continue
+            result = result.model_copy(update={"clause_text": clause.clause_text})
+            result = self._with_guideline_score(result, clause_guidelines)
+            if self._verbose:
+                ctx.write_event_to_stream(
+                    LogEvent(msg=f">> Clause matched: {result.model_dump()}")
+                )
+            results.append(result)
+        return results
+
+    async def _match_clauses_batched(
+        self,
+        ctx: Context,
+        clauses: List[ContractClause],
+        relevant_docs: List[Optional[List[NodeWithScore]]],
+        semaphore: asyncio.Semaphore,
+        on_result: Callable[[int, ClauseComplianceCheck, bool], None],
+    ) -> List[Optional[ClauseComplianceCheck]]:
+        """Evaluate clauses in multi-clause LLM calls, falling back to per-clause calls.
+
+        ``on_result`` is called with the clause position, its verdict and whether
+        evaluation failed, as soon as each clause's verdict is final.
+        """
+        results: List[Optional[ClauseComplianceCheck]] = [None] * len(clauses)
+
+        def fail(j: int, error: Exception) -> None:
+            results[j] = self._failed_result(ctx, clauses[j], error)
+            on_result(j, results[j], True)
+
+        async def select(j: int) -> List[NodeWithScore]:
+            async with semaphore:
+                try:
+                    return await self._clause_guidelines(clauses[j], relevant_docs[j])
+                except Exception as e:
+                    fail(j, e)
+                    return []
+
+        guidelines = await asyncio.gather(*[select(j) for j in range(len(clauses))])
+
+        async def evaluate_single(j: int, start_tier: int = 0) -> None:
+            async with semaphore:
+                try:
+                    results[j] = await self._evaluate_clause(
+                        ctx, clauses[j], guidelines[j], start_tier
                     )
-                # Create a non-compliant result for failed clauses
-                match_results.append(ClauseComplianceCheck(
-                    clause_text=clause.clause_text,
-                    matched_guideline=None,
-                    compliant=False,
-                    notes=f"Error processing clause: {str(e)}"
-                ))
+                except Exception as e:
+                    fail(j, e)
+                    return
+            on_result(j, results[j], False)
 
-        return GenerateReportEvent(match_results=match_results)
+        async def evaluate_batch(batch: List[int]) -> None:
+            if len(batch) == 1:
+                await evaluate_single(batch[0])
+                return
+            async with semaphore:
+                try:
+                    batch_results = await self._evaluate_batch(
+                        ctx,
+                        [clauses[j] for j in batch],
+                        [guidelines[j] for j in batch],
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Batched evaluation of {len(batch)} clauses failed, "
+                        f"falling back to per-clause calls: {str(e)}"
+                    )
+                    batch_results = [None] * len(batch)
+            escalated = []
+            for j, result in zip(batch, batch_results):
+                if result is None:
+                    continue
+                if self.cascade is not None and not self.cascade.accept(0, clauses[j], result):
+                    escalated.append(j)
+                    continue
+                results[j] = result
+                on_result(j, result, False)
+            missing = [j for j, result in zip(batch, batch_results) if result is None]
+            await asyncio.gather(
+                *[evaluate_single(j) for j in missing],
+                *[evaluate_single(j, start_tier=1) for j in escalated],
+            )
+
+        await asyncio.gather(*[
+            evaluate_batch(batch)
+            for batch in self._plan_batches(clauses, guidelines)
+        ])
+        return results
 
     @step
+    @timed_step
     async def generate_report(
         self, ctx: Context, ev: GenerateReportEvent
     ) -> StopEvent:
-        """Generate the final compliance report."""
+        """Generate the final compliance report.
+
+        ``overall_compliant`` and the vendor follow directly from the results; the
+        LLM only writes the summary of the non-compliant clauses, and is not
+        called when every clause is compliant.
+        """
         if self._verbose:
             ctx.write_event_to_stream(LogEvent(msg=">> Generating final report"))
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", COMPLIANCE_REPORT_SYSTEM_PROMPT),
-            ("user", COMPLIANCE_REPORT_USER_PROMPT)
-        ])
+        report = aggregate_report(ev.contract_extraction.vendor_name, ev.match_results, ev.sources)
+        noncompliant = [result for result in ev.match_results if not result.compliant]
+        skipped = sum(1 for source in ev.sources if source == "triage")
+        checkpoint = self._open_checkpoint(ev.contract_hash)
+        inputs_hash = None
 
-        report = await self.llm.astructured_predict(
-            ComplianceReport,
-            prompt,
-            vendor_name=self.vendor_name,
-            compliance_results=ev.match_results
-        )
+        if not noncompliant:
+            if self._verbose:
+                ctx.write_event_to_stream(
+                    LogEvent(msg=">> No non-compliant clauses, skipping report summary call")
+                )
+        else:
+            prompt_args = dict(
+                vendor_name=ev.contract_extraction.vendor_name or "Unknown",
+                noncompliant_count=len(noncompliant),
+                clause_count=len(ev.match_results) - skipped,
+                compliance_results=format_noncompliant_results(
+                    noncompliant,
+                    token_budget=self.report_token_budget,
+                    field_tokens=DEFAULT_REPORT_FIELD_TOKENS,
+                    encoding=self._encoding,
+                ),
+            )
+
+            # Skip the summary call when a checkpointed report has the same inputs
+            inputs_hash = text_hash(json.dumps({
+                "prompt_args": prompt_args,
+                "prompts": [COMPLIANCE_REPORT_SYSTEM_PROMPT, COMPLIANCE_REPORT_USER_PROMPT],
+            }, sort_keys=True))
+            checkpointed = checkpoint.get_report(inputs_hash) if checkpoint else None
+
+            if checkpointed is not None:
+                report = checkpointed
+                if self._verbose:
+                    ctx.write_event_to_stream(LogEvent(msg=">> Reusing report from checkpoint"))
+            else:
+                prompt = ChatPromptTemplate.from_messages([
+                    ("system", COMPLIANCE_REPORT_SYSTEM_PROMPT),
+                    ("user", COMPLIANCE_REPORT_USER_PROMPT)
+                ])
+                summary = await self._astructured_predict(ComplianceSummary, prompt, **prompt_args)
+                summary_notes = summary.summary_notes
+                if skipped:
+                    summary_notes = f"{summary_notes} {triage_note(skipped)}"
+                report = report.model_copy(update={"summary_notes": summary_notes})
+                if checkpoint is not None:
+                    checkpoint.record_report(inputs_hash, report)
 
         if self._verbose:
             ctx.write_event_to_stream(
                 LogEvent(msg=f">> Report generated: {report.model_dump()}")
             )
+            if self.llm_cache is not None:
+                ctx.write_event_to_stream(
+                    LogEvent(msg=f">> LLM cache stats: {self.llm_cache.stats()}")
+                )
+            ctx.write_event_to_stream(
+                LogEvent(msg=f">> Rate limiter stats: {self._rate_limiter_stats()}")
+            )
+            if self.cascade is not None:
+                ctx.write_event_to_stream(
+                    LogEvent(msg=f">> Model cascade stats: {self.cascade.stats()}")
+                )
+            if self.verdict_index is not None:
+                ctx.write_event_to_stream(
+                    LogEvent(msg=f">> Clause reuse stats: {self.verdict_index.stats()}")
+                )
+        if self.cascade is not None:
+            logger.info(f"Model cascade stats: {self.cascade.stats()}")
+
+        if self.results_store is not None:
+            review_id = self.results_store.record_review(
+                ev.contract_hash,
+                self._evaluation_model_name(),
+                ev.contract_extraction,
+                ev.match_results,
+                report,
+                contract_path=ev.contract_path,
+                clause_indexes=ev.clause_indexes,
+                sources=ev.sources,
+            )
+            if self._verbose:
+                ctx.write_event_to_stream(LogEvent(msg=f">> Stored review {review_id} in the results store"))
+
+        # The review is complete: its clause verdicts must not be replayed by later
+        # runs, but an unchanged rerun can reuse the report summary
+        if checkpoint is not None:
+            checkpoint.complete(inputs_hash)
 
         # Create and return the StopEvent
         stop_event = StopEvent(
             report=report,
-            non_compliant_results=ev.match_results
+            contract_extraction=ev.contract_extraction,
+            match_results=ev.match_results,
+            non_compliant_results=[result for result in ev.match_results if not result.compliant]
         )
         
         if self._verbose:
@@ -0,0 +1,67 @@
+from typing import Sequence
+
+from ..config.model_settings import ModelSettings
+from ..config.settings import DEFAULT_TRIAGE_FLAGS, DEFAULT_TRIAGE_KEYWORDS
+from ..models.compliance import ClauseComplianceCheck
+from ..models.contract import ContractClause
+
+TRIAGE_NOTE = (
+    "Skipped by triage: no data-protection indicators, so the clause was not "
+    "evaluated against GDPR guidelines."
+)
+
+
+class ClauseTriage:
+    """Deterministic prefilter that keeps GDPR-irrelevant clauses away from the LLM.
+
+    A clause is relevant if any of its extracted data-protection flags is set or
+    its text contains one of the keywords (a safety net for missed flags).
+    Irrelevant clauses get a compliant verdict without retrieval or an LLM call.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        relevant_flags: Sequence[str] = DEFAULT_TRIAGE_FLAGS,
+        keywords: Sequence[str] = DEFAULT_TRIAGE_KEYWORDS,
+    ) -> None:
+        """Initialize the triage stage.
+
+        Args:
+            enabled: If False, every clause is treated as relevant
+            relevant_flags: ContractClause boolean fields that mark a clause as relevant
+            keywords: Case-insensitive phrases that mark a clause as relevant
+        """
+        unknown = set(relevant_flags) - set(ContractClause.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown ContractClause flags: {', '.join(sorted(unknown))}")
+        self.enabled = enabled
+        self.relevant_flags = tuple(relevant_flags)
+        self.keywords = tuple(k.lower() for k in keywords)
+
+    def is_relevant(self, clause: ContractClause) -> bool:
+        """Return True if the clause needs a full compliance check."""
+        if not self.enabled:
+            return True
+        if any(getattr(clause, flag) for flag in self.relevant_flags):
+            return True
+        text = clause.clause_text.lower()
+        return any(keyword in text for keyword in self.keywords)
+
+    def verdict(self, clause: ContractClause) -> ClauseComplianceCheck:
+        """Return the deterministic verdict for an irrelevant clause."""
+        return ClauseComplianceCheck(
+            clause_text=clause.clause_text,
+            matched_guideline=None,
+            compliant=True,
+            notes=TRIAGE_NOTE,
+        )
+
+
+def create_clause_triage() -> ClauseTriage:
+    """Build the triage stage configured by ``CLAUSE_TRIAGE`` and its flag/keyword lists."""
+    return ClauseTriage(
+        enabled=ModelSettings.get_triage_enabled(),
+        relevant_flags=ModelSettings.get_triage_flags(),
+        keywords=ModelSettings.get_triage_keywords(),
+    )
@@ -24,7 +24,7 @@ setup(
     ],
     entry_points={
         'console_scripts': [
-            'contract-review=contract_review.cli:run_review',
+            'contract-review=contract_review.cli:cli',
             'contract-review-local=contract_review.main_local:main',
         ],
     },
@@ -0,0 +1,17 @@
+from contract_review.benchmark.harness import format_results, run_benchmark
+
+
+def test_isolated_benchmark_scenario_completes(tmp_path):
+    # Runs in a spawned process, which must exit once its scenario is done
+    results = run_benchmark(
+        clause_counts=[3],
+        guideline_sizes_mb=[0.01],
+        work_dir=tmp_path,
+        isolate=True,
+        repeats=2,
+        llm_latency=0.0,
+    )
+    assert len(results) == 1
+    assert results[0]["clauses"] == 3
+    assert results[0]["clauses_reviewed"] == 6
+    assert "clauses/s" in format_results(results)
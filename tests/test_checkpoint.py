@@ -0,0 +1,54 @@
+from contract_review.models.compliance import ClauseComplianceCheck, ComplianceReport
+from contract_review.utils.checkpoint import ReviewCheckpoint
+
+
+def _verdict(text: str) -> ClauseComplianceCheck:
+    return ClauseComplianceCheck(clause_text=text, compliant=False, notes="missing safeguards")
+
+
+def test_resume_reuses_recorded_clauses_and_report(tmp_path):
+    path = tmp_path / "checkpoints" / "contract.jsonl"
+    checkpoint = ReviewCheckpoint(path, "gpt-4", context="ctx")
+    checkpoint.record_clause(0, "Clause A", _verdict("Clause A"))
+    checkpoint.record_report("inputs", ComplianceReport(overall_compliant=False, summary_notes="Fix A"))
+
+    resumed = ReviewCheckpoint(path, "gpt-4", context="ctx")
+    assert resumed.get_clause(0, "Clause A") == _verdict("Clause A")
+    assert resumed.get_report("inputs").summary_notes == "Fix A"
+    # A clause whose text or position changed is evaluated again
+    assert resumed.get_clause(0, "Clause A, amended") is None
+    assert resumed.get_clause(1, "Clause A") is None
+    assert resumed.get_report("other inputs") is None
+
+
+def test_records_of_another_model_or_context_are_ignored(tmp_path):
+    path = tmp_path / "contract.jsonl"
+    ReviewCheckpoint(path, "gpt-4", context="ctx").record_clause(0, "Clause A", _verdict("Clause A"))
+    assert ReviewCheckpoint(path, "gpt-4o", context="ctx").get_clause(0, "Clause A") is None
+    assert ReviewCheckpoint(path, "gpt-4", context="new guidelines").get_clause(0, "Clause A") is None
+
+
+def test_truncated_line_is_skipped(tmp_path):
+    path = tmp_path / "contract.jsonl"
+    checkpoint = ReviewCheckpoint(path, "gpt-4")
+    checkpoint.record_clause(0, "Clause A", _verdict("Clause A"))
+    with open(path, "a") as fp:
+        fp.write('{"type": "clause", "ind')
+    assert ReviewCheckpoint(path, "gpt-4").get_clause(0, "Clause A") is not None
+
+
+def test_complete_keeps_only_the_report(tmp_path):
+    path = tmp_path / "contract.jsonl"
+    checkpoint = ReviewCheckpoint(path, "gpt-4")
+    checkpoint.record_clause(0, "Clause A", _verdict("Clause A"))
+    checkpoint.record_report("old inputs", ComplianceReport(overall_compliant=False, summary_notes="Old"))
+    checkpoint.record_report("inputs", ComplianceReport(overall_compliant=False, summary_notes="Fix A"))
+    checkpoint.complete("inputs")
+
+    reopened = ReviewCheckpoint(path, "gpt-4")
+    assert reopened.get_clause(0, "Clause A") is None
+    assert reopened.get_report("old inputs") is None
+    assert reopened.get_report("inputs").summary_notes == "Fix A"
+
+    reopened.complete()
+    assert not path.exists()
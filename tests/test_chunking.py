@@ -0,0 +1,25 @@
+from contract_review.models.contract import ContractClause, ContractExtraction
+from contract_review.utils.chunking import merge_extractions
+
+
+def _extraction(vendor, *clauses):
+    return ContractExtraction(vendor_name=vendor, clauses=[ContractClause(clause_text=c) for c in clauses])
+
+
+def test_clause_cut_by_a_chunk_boundary_is_merged():
+    merged = merge_extractions([
+        _extraction("Acme", "Clause A", "Clause B"),
+        _extraction("Acme", "clause  b", "Clause C"),
+    ])
+    assert [c.clause_text for c in merged.clauses] == ["Clause A", "Clause B", "Clause C"]
+
+
+def test_repeated_clauses_in_different_sections_are_kept():
+    merged = merge_extractions([
+        _extraction("Acme", "Confidentiality applies.", "Clause B"),
+        _extraction(None, "Clause C", "Confidentiality applies."),
+    ])
+    assert [c.clause_text for c in merged.clauses] == [
+        "Confidentiality applies.", "Clause B", "Clause C", "Confidentiality applies.",
+    ]
+    assert merged.vendor_name == "Acme"
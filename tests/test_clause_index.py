@@ -0,0 +1,60 @@
+from contract_review.models.compliance import ClauseComplianceCheck
+from contract_review.utils.clause_index import ClauseVerdictIndex, clause_guard, normalize_for_reuse
+
+CLAUSE = (
+    "The Processor shall notify the Controller of any personal data breach within 72 hours "
+    "of becoming aware of it, and shall provide all information reasonably required."
+)
+
+
+def _verdict(text: str, compliant: bool = True) -> ClauseComplianceCheck:
+    return ClauseComplianceCheck(clause_text=text, compliant=compliant, notes="ok")
+
+
+def _index(tmp_path) -> ClauseVerdictIndex:
+    index = ClauseVerdictIndex(tmp_path / "clauses.sqlite", threshold=0.7)
+    index.add("gpt-4", CLAUSE, _verdict(CLAUSE), contract_hash="abc", clause_index=3, context="ctx")
+    return index
+
+
+def test_clause_guard_keeps_numbers_and_modals():
+    assert clause_guard(normalize_for_reuse("Notify within 72 hours; it shall not be delayed.")) == "72|not shall"
+    assert clause_guard(normalize_for_reuse("Notify promptly.")) == "|"
+
+
+def test_exact_match_ignores_punctuation_and_case(tmp_path):
+    index = _index(tmp_path)
+    text = CLAUSE.upper().replace(",", "")
+    result = index.lookup("gpt-4", text, context="ctx")
+    assert result is not None
+    assert result.clause_text == text
+    assert result.reused_from.contract_hash == "abc"
+    assert result.reused_from.clause_index == 3
+    assert result.reused_from.similarity == 1.0
+
+
+def test_near_duplicate_is_reused(tmp_path):
+    index = _index(tmp_path)
+    result = index.lookup("gpt-4", CLAUSE.replace("reasonably required", "reasonably requested"), context="ctx")
+    assert result is not None
+    assert 0.7 <= result.reused_from.similarity < 1.0
+    assert index.stats()["near_hits"] == 1
+
+
+def test_changed_number_or_negation_is_not_reused(tmp_path):
+    index = _index(tmp_path)
+    assert index.lookup("gpt-4", CLAUSE.replace("72 hours", "30 days"), context="ctx") is None
+    assert index.lookup("gpt-4", CLAUSE.replace("shall notify", "shall not notify"), context="ctx") is None
+
+
+def test_other_model_or_context_is_not_reused(tmp_path):
+    index = _index(tmp_path)
+    assert index.lookup("gpt-4o", CLAUSE, context="ctx") is None
+    assert index.lookup("gpt-4", CLAUSE, context="other") is None
+
+
+def test_reused_verdicts_are_not_stored_again(tmp_path):
+    index = _index(tmp_path)
+    reused = index.lookup("gpt-4", CLAUSE, context="ctx")
+    index.add("gpt-4", "An unrelated clause about invoices.", reused, contract_hash="def", clause_index=0, context="ctx")
+    assert index.lookup("gpt-4", "An unrelated clause about invoices.", context="ctx") is None
@@ -0,0 +1,90 @@
+from contract_review.models.compliance import ClauseComplianceCheck, ComplianceReport, ContractReviewResult
+from contract_review.models.contract import ContractClause, ContractExtraction
+from contract_review.utils.diff import carried_verdicts, find_changed_sections, merge_revision, order_clauses
+
+SHARE = "share personal data with third parties"
+SELL = "sell customer lists"
+ENCRYPT = "Vendor shall encrypt personal data at rest and in transit."
+
+PREVIOUS_TEXT = f"""## 1. Restrictions
+
+Vendor shall:
+
+- {SHARE}
+- {SELL}
+
+## 2. Security
+
+{ENCRYPT}
+"""
+# Without a number or modal in the lead-in, the section can count as unchanged
+NEUTRAL_TEXT = PREVIOUS_TEXT.replace("Vendor shall:", "Vendor agrees to:")
+
+
+def _previous_review() -> ContractReviewResult:
+    clauses = [ContractClause(clause_text=text) for text in (SHARE, SELL, ENCRYPT)]
+    return ContractReviewResult(
+        contract_path="contract.md",
+        contract_extraction=ContractExtraction(vendor_name="Acme", clauses=clauses),
+        match_results=[
+            ClauseComplianceCheck(clause_text=SHARE, compliant=False, notes="No lawful basis"),
+            ClauseComplianceCheck(clause_text=SELL, compliant=False, notes="No consent"),
+            ClauseComplianceCheck(clause_text=ENCRYPT, compliant=True),
+        ],
+        report=ComplianceReport(overall_compliant=False),
+    )
+
+
+def test_unchanged_sections_carry_their_verdicts():
+    previous = _previous_review()
+    changed, unchanged = find_changed_sections(NEUTRAL_TEXT, previous.contract_extraction.clauses)
+    assert changed == []
+    assert [c.clause_text for c in unchanged] == [SHARE, SELL, ENCRYPT]
+    carried = carried_verdicts(NEUTRAL_TEXT, previous.contract_extraction.clauses, previous)
+    assert sorted(carried) == [0, 1, 2]
+
+
+def test_lead_in_with_a_modal_is_always_extracted_again():
+    previous = _previous_review()
+    changed, unchanged = find_changed_sections(PREVIOUS_TEXT, previous.contract_extraction.clauses)
+    assert len(changed) == 1 and "Vendor shall:" in changed[0]
+    assert [c.clause_text for c in unchanged] == [ENCRYPT]
+
+
+def test_negated_lead_in_reevaluates_the_clauses_of_its_section():
+    previous = _previous_review()
+    revised_text = PREVIOUS_TEXT.replace("Vendor shall:", "Vendor shall not:")
+
+    changed, unchanged = find_changed_sections(revised_text, previous.contract_extraction.clauses)
+    assert len(changed) == 1 and "Vendor shall not:" in changed[0]
+    assert [c.clause_text for c in unchanged] == [ENCRYPT]
+
+    # The bullets are extracted again with the same text, but keep no old verdict
+    revised = ContractExtraction(clauses=[ContractClause(clause_text=SHARE), ContractClause(clause_text=SELL)])
+    merged = merge_revision(revised_text, previous.contract_extraction, unchanged, revised)
+    assert [c.clause_text for c in merged.clauses] == [SHARE, SELL, ENCRYPT]
+    carried = carried_verdicts(revised_text, merged.clauses, previous)
+    assert list(carried) == [2]
+    assert carried[2].compliant
+
+
+def test_clause_repeated_in_a_changed_section_is_not_carried():
+    previous = _previous_review()
+    revised_text = NEUTRAL_TEXT + f"\n## 3. Marketing\n\nVendor shall not:\n\n- {SELL}\n"
+    changed, unchanged = find_changed_sections(revised_text, previous.contract_extraction.clauses)
+    assert len(changed) == 1 and "Marketing" in changed[0]
+
+    revised = ContractExtraction(clauses=[ContractClause(clause_text=SELL)])
+    merged = merge_revision(revised_text, previous.contract_extraction, unchanged, revised)
+    assert [c.clause_text for c in merged.clauses] == [SHARE, SELL, ENCRYPT, SELL]
+    assert sorted(carried_verdicts(revised_text, merged.clauses, previous)) == [0, 1, 2]
+
+
+def test_order_clauses_keeps_repeats_and_drops_extra_copies():
+    text = "## 1\n\nNo subcontracting.\n\n## 2\n\nAudit rights apply.\n\n## 3\n\nNo subcontracting.\n"
+    clauses = [ContractClause(clause_text=t) for t in (
+        "Audit rights apply.", "No subcontracting.", "No subcontracting.", "No subcontracting.", "Not in the text",
+    )]
+    assert [c.clause_text for c in order_clauses(text, clauses)] == [
+        "No subcontracting.", "Audit rights apply.", "No subcontracting.", "Not in the text",
+    ]
@@ -0,0 +1,19 @@
+import asyncio
+
+from contract_review.benchmark.fakes import HashEmbedding
+from contract_review.utils.embedding_cache import CachedEmbedding, EmbeddingStore
+
+
+def test_async_embeddings_are_stored_and_served_from_the_store(tmp_path):
+    embed_model = HashEmbedding()
+    texts = ["Vendor shall encrypt personal data.", "Data is retained for 30 days."]
+    expected = embed_model.get_text_embedding_batch(texts)
+
+    cached = CachedEmbedding(embed_model, EmbeddingStore(tmp_path))
+    assert asyncio.run(cached.aget_text_embedding_batch(texts)) == expected
+
+    # A new process sharing the directory reads the stored vectors
+    reopened = CachedEmbedding(embed_model, EmbeddingStore(tmp_path))
+    embeddings = asyncio.run(reopened.aget_text_embedding_batch(texts))
+    assert [[round(x, 5) for x in e] for e in embeddings] == [[round(x, 5) for x in e] for e in expected]
+    assert asyncio.run(reopened.aget_query_embedding(texts[0])) == embed_model.get_query_embedding(texts[0])
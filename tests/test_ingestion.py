@@ -0,0 +1,31 @@
+import asyncio
+
+import pytest
+
+from contract_review.utils.ingestion import DocumentLoader
+
+
+def test_markdown_is_parsed_without_a_process_pool(tmp_path):
+    contract = tmp_path / "contract.md"
+    contract.write_text("# Data Processing\n\nVendor shall encrypt personal data.\n")
+    loader = DocumentLoader(cache_dir=tmp_path / "parsed")
+
+    text = asyncio.run(loader.aload(contract))
+    assert "Vendor shall encrypt personal data." in text
+    assert loader._executor is None
+
+    # The second read is served from the parsed-text cache
+    assert asyncio.run(loader.aload(contract)) == text
+    counters = loader.metrics.summary()["counters"]
+    assert counters["parse_cache_misses"] == 1
+    assert counters["parse_cache_hits"] == 1
+
+
+def test_close_shuts_down_the_process_pool():
+    loader = DocumentLoader(max_workers=1)
+    executor = loader._process_pool()
+    loader.close()
+    assert loader._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+    loader.close()
@@ -0,0 +1,82 @@
+import pytest
+
+from contract_review.models.compliance import ClauseComplianceCheck, ComplianceReport, GuidelineMatch
+from contract_review.models.contract import ContractClause, ContractExtraction
+from contract_review.utils.results_store import ResultsStore
+
+TRANSFER = "Personal data may be transferred to any country."
+SECURITY = "Vendor shall encrypt personal data at rest."
+
+
+def _record(store: ResultsStore, contract_hash: str, vendor: str, transfer_compliant: bool) -> int:
+    extraction = ContractExtraction(
+        vendor_name=vendor,
+        clauses=[
+            ContractClause(clause_text=TRANSFER, mentions_data_transfer=True),
+            ContractClause(clause_text=SECURITY, mentions_safeguards=True),
+        ],
+    )
+    results = [
+        ClauseComplianceCheck(
+            clause_text=TRANSFER,
+            compliant=transfer_compliant,
+            matched_guideline=GuidelineMatch(guideline_text="Article 44: transfers", similarity_score=0.8),
+        ),
+        ClauseComplianceCheck(
+            clause_text=SECURITY,
+            compliant=True,
+            matched_guideline=GuidelineMatch(guideline_text="Article 32: security", similarity_score=0.9),
+        ),
+    ]
+    report = ComplianceReport(vendor_name=vendor, overall_compliant=transfer_compliant)
+    return store.record_review(contract_hash, "gpt-4", extraction, results, report, contract_path=f"{vendor}.pdf")
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultsStore(tmp_path / "results.sqlite")
+    _record(store, "hash-acme", "Acme Corp", transfer_compliant=False)
+    _record(store, "hash-globex", "Globex", transfer_compliant=True)
+    yield store
+    store.close()
+
+
+def test_query_clauses_by_flag_and_verdict(store):
+    rows = store.query_clauses(compliant=False, flags=("mentions_data_transfer",))
+    assert [(row["vendor_name"], row["clause_text"]) for row in rows] == [("Acme Corp", TRANSFER)]
+
+
+def test_query_clauses_by_guideline_prefix(store):
+    rows = store.query_clauses(guideline="Article 32")
+    assert {row["vendor_name"] for row in rows} == {"Acme Corp", "Globex"}
+    assert all(row["clause_text"] == SECURITY for row in rows)
+    assert store.query_clauses(guideline="article 32") == []
+
+
+def test_query_reviews_by_vendor_and_compliance(store):
+    assert [row["vendor_name"] for row in store.query_reviews(vendor="Acme")] == ["Acme Corp"]
+    assert [row["vendor_name"] for row in store.query_reviews(compliant=True)] == ["Globex"]
+
+
+def test_unknown_flag_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.query_clauses(flags=("mentions_pets",))
+
+
+def test_latest_review_supersedes_earlier_runs(store):
+    latest = _record(store, "hash-acme", "Acme Corp", transfer_compliant=True)
+    reviews = store.query_reviews(vendor="Acme")
+    assert [row["id"] for row in reviews] == [latest]
+    assert store.query_clauses(vendor="Acme", compliant=False) == []
+    assert len(store.query_reviews(vendor="Acme", all_runs=True)) == 2
+
+
+def test_vendor_filter_is_a_case_insensitive_indexed_prefix(store):
+    assert [row["vendor_name"] for row in store.query_reviews(vendor="acme")] == ["Acme Corp"]
+    assert store.query_reviews(vendor="Corp") == []
+    assert store.query_reviews(vendor="Acme%") == []
+    assert {row["vendor_name"] for row in store.query_clauses(vendor="GLOB")} == {"Globex"}
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM reviews r WHERE r.vendor_name LIKE ? ESCAPE '\\'", ("acme%",)
+    ).fetchall()
+    assert any("reviews_vendor_nocase" in row["detail"] for row in plan)
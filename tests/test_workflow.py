@@ -0,0 +1,79 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+from pydantic import PrivateAttr
+
+from contract_review.benchmark.fakes import FakeLLM, HashEmbedding
+from contract_review.benchmark.synthetic import generate_contract, prepare_guidelines
+from contract_review.models.compliance import ComplianceSummary
+from contract_review.runner import run_contract_review
+from contract_review.utils.batch_retriever import FaissBatchRetriever
+from contract_review.utils.guideline_index import load_or_build_guideline_index
+from contract_review.utils.rate_limit import AdaptiveRateLimiter
+from contract_review.workflows.contract_review import ContractReviewWorkflow
+
+
+class RecordingLLM(FakeLLM):
+    """FakeLLM recording the output class of every call."""
+
+    _outputs: List[type] = PrivateAttr(default_factory=list)
+
+    async def astructured_predict(self, output_cls: Any, prompt: Any, llm_kwargs: Any = None, **prompt_args: Any):
+        self._outputs.append(output_cls)
+        return await super().astructured_predict(output_cls, prompt, llm_kwargs, **prompt_args)
+
+    def count(self, output_cls: type) -> int:
+        return self._outputs.count(output_cls)
+
+
+@pytest.fixture(scope="module")
+def guideline_index(tmp_path_factory):
+    work_dir = tmp_path_factory.mktemp("guidelines")
+    embed_model = HashEmbedding()
+    index = load_or_build_guideline_index(
+        guidelines_dir=prepare_guidelines(work_dir, 0.01, 0),
+        embed_model=embed_model,
+        embed_model_name=embed_model.model_name,
+        dimension=embed_model.embed_dim,
+        persist_dir=work_dir / "index",
+    )
+    return index, embed_model
+
+
+def _workflow(guideline_index, llm, output_dir) -> ContractReviewWorkflow:
+    index, embed_model = guideline_index
+    return ContractReviewWorkflow(
+        guideline_retriever=FaissBatchRetriever(index, similarity_top_k=3, embed_model=embed_model),
+        llm=llm,
+        output_dir=str(output_dir),
+        rate_limiter=AdaptiveRateLimiter(10 ** 9, 10 ** 12),
+        verbose=False,
+        timeout=None,
+    )
+
+
+def test_unchanged_rerun_reuses_the_report_summary(tmp_path, guideline_index):
+    contract_path = tmp_path / "contract.md"
+    contract_path.write_text(generate_contract(12, seed=0))
+    llm = RecordingLLM(latency=0.0, non_compliant_rate=0.5)
+
+    sources = []
+
+    async def review_twice():
+        workflow = _workflow(guideline_index, llm, tmp_path / "out")
+        try:
+            first = await run_contract_review(workflow, contract_path, print_logs=False)
+            second = await run_contract_review(
+                workflow, contract_path, print_logs=False, on_clause_result=lambda ev: sources.append(ev.source)
+            )
+        finally:
+            workflow.close()
+        return first, second
+
+    first, second = asyncio.run(review_twice())
+    assert first.non_compliant_results
+    assert llm.count(ComplianceSummary) == 1
+    assert second.report == first.report
+    # Clause verdicts of the completed review are not resumed from its checkpoint
+    assert sources and "checkpoint" not in sources